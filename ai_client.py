@@ -0,0 +1,345 @@
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent import futures
+from typing import Dict, List, Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Tokens the NER model tags as organizations or miscellaneous entities that
+# look like technology names (e.g. "Python", "C++", "Node.js")
+skill_word_regex = re.compile(r"^[A-Za-z][A-Za-z0-9\+\#\.\-]*$")
+
+def skills_from_entities(entities: List[Dict]) -> List[str]:
+    """Pick skill-like words out of the entities returned by the NER model."""
+    skills = []
+    for entity in entities:
+        if "entity_group" in entity and entity["entity_group"] in ["ORG", "MISC"]:
+            word = entity["word"]
+            if (
+                len(word) > 2
+                and not word.startswith("##")
+                and skill_word_regex.match(word)
+            ):
+                skills.append(word)
+    return list(set(skills))
+
+class CircuitBreaker:
+    """Stop calling a failing service for a while after repeated failures.
+
+    After ``threshold`` consecutive failures the breaker opens and
+    ``allow`` returns False for ``cooldown`` seconds. Once the cooldown has
+    passed a single trial call is let through: success closes the breaker,
+    failure opens it again.
+    """
+
+    def __init__(self, threshold: int = 3, cooldown: float = 60) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """One of ``closed``, ``open`` or ``half-open``."""
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.monotonic() - self.opened_at >= self.cooldown:
+                return "half-open"
+            return "open"
+
+    def allow(self) -> bool:
+        """Whether a call may be made now."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._trial or time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            self._trial = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial = False
+            if self.opened_at is not None or self.failures >= self.threshold:
+                if self.opened_at is None:
+                    logger.warning(
+                        "Enrichment endpoint failed %d times in a row; pausing calls for %ss",
+                        self.failures, self.cooldown,
+                    )
+                self.opened_at = time.monotonic()
+
+class EnrichmentRequest:
+    """Handle to the skills of one resume being fetched in the background."""
+
+    def __init__(
+        self,
+        client: "EnrichmentClient",
+        future: "futures.Future[List[Optional[List[str]]]]",
+        position: int,
+    ) -> None:
+        self.client = client
+        self.future = future
+        self.position = position
+        self.started_at = time.monotonic()
+
+    def result(self, budget: Optional[float] = None) -> Optional[List[str]]:
+        """Wait for the skills, at most until ``budget`` seconds after the request started.
+
+        Args:
+            budget: Seconds since the request started after which to give
+                up; None waits for the call to finish
+
+        Returns:
+            The skills, or None if the model didn't answer within the budget
+            or the call failed
+        """
+        timeout = None
+        if budget is not None:
+            timeout = max(0.0, budget - (time.monotonic() - self.started_at))
+        try:
+            return self.future.result(timeout)[self.position]
+        except futures.TimeoutError:
+            logger.warning("AI enrichment missed its %ss latency budget", budget)
+            self.client.record_budget_miss()
+            return None
+
+class EnrichmentClient:
+    """Client for the Hugging Face NER endpoint used to find extra skills.
+
+    Requests go through one pooled ``requests.Session``, several resumes are
+    sent per inference call, and responses are cached by the hash of the
+    text sent. A circuit breaker skips the endpoint after repeated failures
+    or timeouts so a slow service can't stall every parse.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        token: str = "",
+        timeout: float = 30,
+        batch_size: int = 8,
+        max_chars: int = 500,
+        cache_size: int = 1024,
+        pool_size: int = 10,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        """
+        Args:
+            api_url: Inference endpoint; point it at a local stand-in for tests
+            token: Hugging Face API token; enrichment is disabled without one
+            timeout: Seconds to wait for one inference call
+            batch_size: Maximum number of texts sent in one call
+            max_chars: Characters of each resume sent to the model
+            cache_size: Responses kept in memory
+            pool_size: Connections kept open to the endpoint
+            breaker: Circuit breaker guarding the endpoint
+        """
+        self.api_url = api_url
+        self.token = token
+        self.timeout = timeout
+        self.batch_size = max(1, batch_size)
+        self.max_chars = max_chars
+        self.cache_size = cache_size
+        self.breaker = breaker or CircuitBreaker()
+        self.calls = 0
+        self.cache_hits = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.skipped = 0
+        self.budget_misses = 0
+        self._cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[futures.ThreadPoolExecutor] = None
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        else:
+            logger.warning("No Hugging Face API token provided; AI enrichment is disabled")
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.token)
+
+    def find_skills(self, text: str) -> Optional[List[str]]:
+        """Return the skills the model finds in one resume; see find_skills_many."""
+        return self.find_skills_many([text])[0]
+
+    def find_skills_many(self, texts: Sequence[str]) -> List[Optional[List[str]]]:
+        """Return the skills the model finds in each resume.
+
+        Cached texts are answered from memory and the rest are sent in
+        batches of ``batch_size``.
+
+        Args:
+            texts: Resume texts
+
+        Returns:
+            One list of skills per text, in the same order. Texts whose call
+            failed, timed out or was skipped by the circuit breaker get None;
+            every text gets an empty list when enrichment is disabled.
+        """
+        if not self.enabled:
+            return [[] for _ in texts]
+
+        results: List[Optional[List[str]]] = [None for _ in texts]
+        pending: Dict[str, List[int]] = OrderedDict()
+        inputs: Dict[str, str] = {}
+        for index, text in enumerate(texts):
+            snippet = text[:self.max_chars]
+            key = hashlib.sha256(snippet.encode("utf-8")).hexdigest()
+            cached = self._cached(key)
+            if cached is not None:
+                results[index] = list(cached)
+                continue
+            pending.setdefault(key, []).append(index)
+            inputs[key] = snippet
+
+        keys = list(pending)
+        for start in range(0, len(keys), self.batch_size):
+            batch = keys[start:start + self.batch_size]
+            found = self._infer([inputs[key] for key in batch])
+            if found is None:
+                continue
+            for key, skills in zip(batch, found):
+                self._store(key, skills)
+                for index in pending[key]:
+                    results[index] = list(skills)
+        return results
+
+    def submit(self, text: str) -> EnrichmentRequest:
+        """Start fetching the skills of one resume in the background."""
+        return self.submit_many([text])[0]
+
+    def submit_many(self, texts: Sequence[str]) -> List[EnrichmentRequest]:
+        """Start fetching the skills of several resumes in the background.
+
+        The texts are answered by one find_skills_many call on the client's
+        I/O threads, so callers can keep parsing locally and collect the
+        skills later with EnrichmentRequest.result.
+
+        Args:
+            texts: Resume texts
+
+        Returns:
+            One request handle per text, in the same order
+        """
+        texts = list(texts)
+        if not self.enabled:
+            future: "futures.Future[List[Optional[List[str]]]]" = futures.Future()
+            future.set_result(self.find_skills_many(texts))
+        else:
+            future = self._get_executor().submit(self.find_skills_many, texts)
+        return [EnrichmentRequest(self, future, position) for position in range(len(texts))]
+
+    def record_budget_miss(self) -> None:
+        """Count a resume returned without waiting for its enrichment."""
+        with self._lock:
+            self.budget_misses += 1
+
+    def _get_executor(self) -> futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = futures.ThreadPoolExecutor(
+                    max_workers=self.pool_size, thread_name_prefix="hf-enrichment"
+                )
+            return self._executor
+
+    def _infer(self, inputs: List[str]) -> Optional[List[List[str]]]:
+        """Send one batch to the endpoint; None if it was skipped or failed."""
+        if not self.breaker.allow():
+            with self._lock:
+                self.skipped += len(inputs)
+            logger.debug("Enrichment endpoint unavailable; skipping %d texts", len(inputs))
+            return None
+
+        payload = {"inputs": inputs, "options": {"wait_for_model": True}}
+        with self._lock:
+            self.calls += 1
+        try:
+            response = self.session.post(self.api_url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            result = response.json()
+            # A single input may come back as one flat entity list
+            if len(inputs) == 1 and result and isinstance(result[0], dict):
+                result = [result]
+            if not isinstance(result, list) or len(result) != len(inputs):
+                raise ValueError(f"expected {len(inputs)} results, got {type(result).__name__}")
+            found = [skills_from_entities(entities) for entities in result]
+        except requests.Timeout:
+            logger.error("Hugging Face API request timed out")
+            with self._lock:
+                self.timeouts += 1
+            self.breaker.record_failure()
+            return None
+        except requests.RequestException as e:
+            logger.error("Hugging Face API error: %s", e)
+            with self._lock:
+                self.failures += 1
+            self.breaker.record_failure()
+            return None
+        except Exception:
+            logger.exception("Unexpected error in AI enhancement:")
+            with self._lock:
+                self.failures += 1
+            self.breaker.record_failure()
+            return None
+
+        self.breaker.record_success()
+        logger.debug("AI found %d skills", len(found))
+        return found
+
+    def _cached(self, key: str) -> Optional[List[str]]:
+        with self._lock:
+            skills = self._cache.get(key)
+            if skills is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+            return skills
+
+    def _store(self, key: str, skills: List[str]) -> None:
+        with self._lock:
+            self._cache[key] = skills
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Forget every cached response."""
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict:
+        """Return call, cache and failure counters and the breaker state."""
+        with self._lock:
+            stats = {
+                "calls": self.calls,
+                "cache_hits": self.cache_hits,
+                "timeouts": self.timeouts,
+                "failures": self.failures,
+                "skipped": self.skipped,
+                "budget_misses": self.budget_misses,
+                "entries": len(self._cache),
+            }
+        stats["breaker"] = self.breaker.state
+        return stats
@@ -1,56 +1,224 @@
+import hmac
+import json
 import logging
+import math
+import multiprocessing
 import os
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Tuple, Union, List, Dict
-from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Union, List, Dict
+from functools import lru_cache, partial, wraps
 
-from flask import Flask, Response, jsonify, request, render_template, current_app
-from flask_limiter import Limiter
+from flask import Flask, Response, jsonify, request, render_template, current_app, stream_with_context, url_for
+from flask_limiter import HeaderNames, Limiter
 from flask_limiter.util import get_remote_address
 from werkzeug.utils import secure_filename
 from werkzeug.datastructures import FileStorage
 
-from config import ALLOWED_EXTENSIONS, MAX_CONTENT_LENGTH, UPLOAD_FOLDER, HF_API_TOKEN
-from resume_parser import ResumeParserError, parse_resume
+from config import (
+    ALLOWED_EXTENSIONS,
+    HF_API_TOKEN,
+    JOB_MAX_FILES,
+    JOB_TTL,
+    JOB_WORKERS,
+    MATCH_MAX_CHARS,
+    MATCH_MAX_TOP_K,
+    MATCH_SKILL_WEIGHT,
+    MATCH_TOP_K,
+    MAX_CONTENT_LENGTH,
+    NEAR_DUPLICATE_DETECTION,
+    NEAR_DUPLICATE_THRESHOLD,
+    PARSER_EXECUTOR,
+    PARSER_WARMUP,
+    PARSER_WORKERS,
+    PDF_MAX_PAGES,
+    PDF_TEXT_ENGINE,
+    RESULT_CACHE_DB,
+    RESULT_CACHE_SIZE,
+    RESUME_STORE_DB,
+    RESUME_STORE_TOKEN,
+    SCHEDULER_BATCH_FILES,
+    SCHEDULER_MAX_MB,
+    SCHEDULER_MAX_QUEUED,
+    SCHEDULER_MAX_WAIT,
+    SEARCH_MAX_PAGE_SIZE,
+    SEARCH_MAX_SKILLS,
+    SEARCH_PAGE_SIZE,
+    SKILL_ENRICHMENT_BACKEND,
+    SKILL_TAXONOMY_FILE,
+    UPLOAD_FOLDER,
+    UPLOAD_RATE_LIMIT,
+)
+from log_config import configure_logging
+
+# Configure logging before the parser modules load their models and log
+configure_logging()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+from jobs import JobQueue
+from metrics import REGISTRY, Collector, Trace, files_total, near_duplicates_total, timed
+from pdf_text import available_engines
+from parser_pool import get_process_pool, parse_resume_bytes
+from result_cache import ResultCache, content_digest
+from resume_parser import (
+    RULES_VERSION,
+    ResumeParserError,
+    clean_skill,
+    extract_job_skills,
+    get_skill_enricher,
+    iter_parse_resumes,
+    parse_resume,
+    warmup,
 )
+from ranking import ResumeRanker
+from reprocess import reprocess_store
+from resume_store import SEARCH_MODES, ResumeStore
+from scheduler import Scheduler, SchedulerFull
+
 logger = logging.getLogger(__name__)
 
-# Verify Hugging Face API token
-if not HF_API_TOKEN:
-    logger.warning("No Hugging Face API token found. AI-enhanced skill detection will be disabled.")
-else:
+# Report the skill enrichment backend (the API client warns itself when
+# no token is set)
+if SKILL_ENRICHMENT_BACKEND == 'local':
+    logger.info("Using offline skill enrichment from %s", SKILL_TAXONOMY_FILE)
+elif HF_API_TOKEN:
     logger.info("Hugging Face API token loaded successfully.")
 
+# The model otherwise loads on the first parse; gunicorn.conf.py warms it
+# up in the master before forking workers
+if PARSER_WARMUP:
+    warmup()
+
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH * 50
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
-app.config['MAX_WORKERS'] = 4  # Limit concurrent file processing
+app.config['MAX_WORKERS'] = PARSER_WORKERS  # Limit concurrent file processing
+app.config['PARSER_EXECUTOR'] = PARSER_EXECUTOR  # 'thread' or 'process'
+
+# Streaming response formats for /upload, chosen by the Accept header
+NDJSON_MIMETYPE = 'application/x-ndjson'
+SSE_MIMETYPE = 'text/event-stream'
+
+# Parsed results keyed by file content, shared across requests
+result_cache = ResultCache(
+    RULES_VERSION,
+    max_entries=RESULT_CACHE_SIZE,
+    db_path=RESULT_CACHE_DB or None,
+)
+
+# Parsing work of every request and of the job queue, cheapest files
+# first and shared fairly between clients; uploads are refused with 503
+# instead of queueing without bound when it is saturated
+scheduler = Scheduler(
+    PARSER_WORKERS,
+    max_queued=SCHEDULER_MAX_QUEUED,
+    max_bytes=SCHEDULER_MAX_MB * 1024 * 1024,
+    max_wait=SCHEDULER_MAX_WAIT,
+)
+
+# Every parsed resume, searchable by skill through /search; holds
+# personal data, so it is off unless RESUME_STORE_DB is set and its routes
+# need RESUME_STORE_TOKEN
+resume_store = (
+    ResumeStore(RESUME_STORE_DB, normalize=clean_skill, rules_version=RULES_VERSION)
+    if RESUME_STORE_DB else None
+)
+
+# New uploads are looked up among the stored resumes after text
+# extraction; near-duplicates are linked to (or reuse) the earlier parse
+find_duplicate = (
+    partial(resume_store.find_near_duplicate, threshold=NEAR_DUPLICATE_THRESHOLD)
+    if resume_store is not None and NEAR_DUPLICATE_DETECTION else None
+)
 
-# Setup rate limiting with custom error handler
+# Stored resumes as matrices for /match, kept in step with the store
+ranker = ResumeRanker(normalize=clean_skill, skill_weight=MATCH_SKILL_WEIGHT)
+ranker_revision = 0  # last store revision added to the ranker
+ranker_lock = threading.Lock()
+
+def sync_ranker() -> ResumeRanker:
+    """Bring the ranker up to date with the resume store and return it.
+    
+    The first call loads every stored resume; later calls add only the
+    resumes stored or re-parsed since, including by other worker processes.
+    """
+    global ranker_revision
+    with ranker_lock:
+        with timed("ranker_sync"):
+            for revision, resume_id, result in resume_store.iter_results(since=ranker_revision):
+                ranker.add(resume_id, result)
+                ranker_revision = revision
+    return ranker
+
+# Progress of the background rebuild started by POST /reprocess
+reprocess_state: Dict = {
+    "running": False, "reprocessed": 0, "failed": 0, "started_at": None, "finished_at": None, "error": None,
+}
+reprocess_lock = threading.Lock()
+
+def run_reprocess() -> None:
+    """Rebuild stale stored resumes on the parser workers; runs in a background thread."""
+    try:
+        reprocess_store(
+            resume_store,
+            workers=PARSER_WORKERS,
+            # Forking a multi-threaded server is unsafe
+            mp_context=multiprocessing.get_context("spawn"),
+            progress=reprocess_state.update,
+        )
+    except Exception:
+        logger.exception("Reprocessing failed:")
+        reprocess_state["error"] = "Reprocessing failed; see the server log."
+    finally:
+        reprocess_state.update(running=False, finished_at=time.time())
+
+# Setup rate limiting with custom error handler; responses carry the
+# X-RateLimit-* headers. The limiter's own Retry-After is renamed because
+# it would replace the scheduler's on a 503 with the end of the rate
+# limit window; the 429 handler sets Retry-After itself
 limiter = Limiter(
     app=app,
     key_func=get_remote_address,
-    default_limits=["100 per day", "10 per minute"]
+    default_limits=["100 per day", "10 per minute"],
+    headers_enabled=True,
+    header_name_mapping={HeaderNames.RETRY_AFTER: "X-RateLimit-Retry-After"},
 )
 
+def require_store_access(view: Callable) -> Callable:
+    """Guard a route that reads the resume store with RESUME_STORE_TOKEN.
+    
+    Stored resumes hold names, contact details and full text, so these
+    routes answer 404 while the store is disabled, 403 while no token is
+    configured and 401 unless the request sends ``Authorization: Bearer
+    <RESUME_STORE_TOKEN>``.
+    """
+    @wraps(view)
+    def guarded(*args, **kwargs):
+        if resume_store is None:
+            return jsonify({"error": "The resume store is disabled (RESUME_STORE_DB is empty)."}), 404
+        if not RESUME_STORE_TOKEN:
+            return jsonify({"error": "Access to stored resumes is closed until RESUME_STORE_TOKEN is set."}), 403
+        expected = f"Bearer {RESUME_STORE_TOKEN}".encode()
+        if not hmac.compare_digest(request.headers.get("Authorization", "").encode(), expected):
+            response = jsonify({"error": "A valid bearer token is required."})
+            response.headers["WWW-Authenticate"] = "Bearer"
+            return response, 401
+        return view(*args, **kwargs)
+    return guarded
+
 @lru_cache(maxsize=128)
 def allowed_file(filename: str) -> bool:
     """Cache frequently checked file extensions."""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def validate_files(files: List[FileStorage]) -> Tuple[Optional[str], Optional[int]]:
+def validate_files(files: List[FileStorage], max_files: int = 50) -> Tuple[Optional[str], Optional[int]]:
     """Validate uploaded files with improved error messages."""
     if not files:
         return "No files were uploaded. Please select at least one resume file.", 400
         
-    if len(files) > 50:
-        return f"Maximum 50 files allowed. You uploaded {len(files)} files.", 400
+    if len(files) > max_files:
+        return f"Maximum {max_files} files allowed. You uploaded {len(files)} files.", 400
         
     invalid_files = []
     for file in files:
@@ -65,46 +233,332 @@ def validate_files(files: List[FileStorage]) -> Tuple[Optional[str], Optional[in
             
     return None, None
 
-def process_resume(file: FileStorage) -> Dict:
-    """Process a single resume file with improved cleanup."""
-    filename = secure_filename(file.filename)
-    file_path = UPLOAD_FOLDER / filename
+def parse_cost(data: bytes) -> int:
+    """Estimate the work of parsing a PDF: the pages read, plus one for NER and enrichment.
     
-    try:
-        file.save(file_path)
-        result = parse_resume(file_path)
-        result['filename'] = filename  # Add filename to result
-        return result
-    except Exception as e:
-        logger.error("Error processing %s: %s", filename, str(e))
-        raise
-    finally:
-        try:
-            if file_path.exists():
-                file_path.unlink()
-        except Exception as e:
-            logger.error("Failed to delete uploaded file %s: %s", filename, str(e))
+    Pages are guessed from the file size (about 100 kB each), so admission
+    never opens the PDF on the request thread; tasks report the pages
+    they really read back to the scheduler (see parsed_cost).
+    """
+    pages = len(data) // 100_000 + 1
+    if PDF_MAX_PAGES:
+        pages = min(pages, PDF_MAX_PAGES)
+    return pages + 1
 
-def process_files_batch(files: List[FileStorage]) -> List[Dict]:
-    """Process multiple files concurrently."""
-    with ThreadPoolExecutor(max_workers=current_app.config['MAX_WORKERS']) as executor:
-        future_to_file = {executor.submit(process_resume, file): file for file in files}
-        results = []
-        errors = []
+def parsed_cost(traces: Iterable[Optional[Trace]]) -> int:
+    """The work parsing took, in parse_cost's units, from the files' traces."""
+    return sum(trace.pages + 1 for trace in traces if trace is not None)
+
+def schedule_uploads(
+    uploads: List[Tuple[str, bytes]], engine: str
+) -> "queue.Queue[Tuple[int, Union[Dict, Exception], Optional[Trace], Optional[List[str]]]]":
+    """Queue uploads on the shared scheduler for the requesting client.
+    
+    With the process executor each file is a task that waits for the
+    process pool; with the thread executor files of similar cost are
+    parsed together, SCHEDULER_BATCH_FILES at a time, so NER still runs
+    in batches.
+    
+    Args:
+        uploads: ``(filename, data)`` of the files to parse
+        engine: Text-extraction engine to use for the files
         
-        for future in future_to_file:
-            file = future_to_file[future]
+    Returns:
+        Queue receiving ``(position, outcome, trace, page_texts)`` once per
+        upload, in completion order
+        
+    Raises:
+        SchedulerFull: If the scheduler can't take the uploads now
+    """
+    outcomes: queue.Queue = queue.Queue()
+    costs = [parse_cost(data) for _, data in uploads]
+    
+    if current_app.config['PARSER_EXECUTOR'] == 'process':
+        executor = get_process_pool(current_app.config['MAX_WORKERS'])
+        
+        def parse_on_pool(position: int) -> Optional[int]:
             try:
-                result = future.result()
-                results.append(result)
+                result, trace, page_texts = executor.submit(
+                    parse_resume_bytes, uploads[position][1], engine
+                ).result()
             except Exception as e:
-                errors.append(f"{file.filename}: {str(e)}")
-                logger.error("Failed to process %s: %s", file.filename, str(e))
-                
-        if errors and not results:
-            raise ResumeParserError(f"All files failed to process. Errors: {'; '.join(errors)}")
+                outcomes.put((position, e, None, None))
+                return None
+            trace.record()  # the worker's own metrics aren't visible here
+            outcomes.put((position, result, trace, page_texts))
+            return parsed_cost([trace])
+            
+        tasks = [
+            (costs[position], len(data), partial(parse_on_pool, position))
+            for position, (_, data) in enumerate(uploads)
+        ]
+    else:
+        def parse_in_thread(positions: List[int]) -> Optional[int]:
+            traces: Dict[int, Trace] = {}
+            page_texts: Dict[int, List[str]] = {}
+            reported = set()
+            try:
+                for offset, outcome in iter_parse_resumes(
+                    (uploads[position][1] for position in positions),
+                    engine=engine,
+                    traces=traces,
+                    find_duplicate=find_duplicate,
+                    page_texts=page_texts,
+                ):
+                    reported.add(offset)
+                    outcomes.put((positions[offset], outcome, traces.get(offset), page_texts.pop(offset, None)))
+            except Exception as e:
+                for offset, position in enumerate(positions):
+                    if offset not in reported:
+                        outcomes.put((position, e, None, None))
+                return None
+            return parsed_cost(traces.values())
+                        
+        order = sorted(range(len(uploads)), key=costs.__getitem__)
+        tasks = []
+        for start in range(0, len(order), SCHEDULER_BATCH_FILES):
+            positions = order[start:start + SCHEDULER_BATCH_FILES]
+            tasks.append((
+                sum(costs[position] for position in positions),
+                sum(len(uploads[position][1]) for position in positions),
+                partial(parse_in_thread, positions),
+            ))
+            
+    scheduler.submit(get_remote_address(), tasks)
+    return outcomes
+
+def store_result(
+    digest: str, filename: str, result: Dict, page_texts: Optional[List[str]] = None
+) -> Dict:
+    """Save a parsed resume in the resume store and add its ``resume_id``.
+    
+    A failure to store is logged and the result is returned without an id,
+    so storage problems never fail a parse. The MinHash signature the
+    store indexes is left out of the returned result. The extracted
+    ``page_texts``, when given, are stored for reprocess.py.
+    """
+    stored = {key: value for key, value in result.items() if key != "minhash"}
+    if resume_store is None:
+        return stored
+    try:
+        with timed("store"):
+            stored["resume_id"] = resume_store.add(digest, filename, result, page_texts)
+    except Exception:
+        logger.exception("Failed to store parsed resume %s:", filename)
+        return stored
+    duplicate_of = stored.get("duplicate_of")
+    if duplicate_of is not None:
+        if duplicate_of["resume_id"] == stored["resume_id"]:
+            # The same file parsed again, see ResumeStore.add
+            del stored["duplicate_of"]
+        else:
+            near_duplicates_total.inc(action="reused" if duplicate_of["reused"] else "linked")
+    return stored
+
+def iter_files_batch(
+    files: List[FileStorage], engine: str = PDF_TEXT_ENGINE, with_timings: bool = False
+) -> Iterator[Tuple[int, str, Union[Dict, Exception]]]:
+    """Process multiple files on the configured parsing backend.
+    
+    Files whose content was parsed before are answered from the result
+    cache right away; the rest are queued on the shared scheduler and
+    yielded as soon as each one finishes, so one slow PDF doesn't hold
+    back the others. The files are read and queued by this call, before
+    iteration starts, so a busy server is reported before any output.
+    Results returned without AI enrichment (``partial``) are not cached.
+    Every result is saved in the resume store and carries its ``resume_id``.
+    
+    Args:
+        files: Uploaded PDF files
+        engine: Text-extraction engine to use for the files
+        with_timings: Add each file's stage timings to its result under
+            ``timings``
+        
+    Returns:
+        Iterator of ``(index, filename, outcome)`` where ``outcome`` is the
+        parsed resume data (with ``filename`` added) or the exception raised
+        
+    Raises:
+        SchedulerFull: If the scheduler can't take the files now
+    """
+    with timed("read_uploads"):
+        uploads = [(secure_filename(file.filename), file.read()) for file in files]
+        digests = [content_digest(data) for _, data in uploads]
+        keys = [result_cache.key_for_digest(digest, engine) for digest in digests]
+    cached: Dict[int, Dict] = {}
+    misses = []
+    
+    for index in range(len(uploads)):
+        with timed("cache_lookup"):
+            result = result_cache.get(keys[index])
+        if result is None:
+            misses.append(index)
+        else:
+            cached[index] = result
+            
+    outcomes = schedule_uploads([uploads[index] for index in misses], engine) if misses else None
+    
+    def results() -> Iterator[Tuple[int, str, Union[Dict, Exception]]]:
+        for index, result in cached.items():
+            filename = uploads[index][0]
+            files_total.inc(outcome="cached")
+            result = store_result(digests[index], filename, dict(result, filename=filename))
+            if with_timings:
+                result["timings"] = {"cached": True}
+            yield index, filename, result
+            
+        for _ in misses:
+            position, outcome, trace, page_texts = outcomes.get()
+            index = misses[position]
+            filename = uploads[index][0]
+            if isinstance(outcome, Exception):
+                files_total.inc(outcome="failed")
+                logger.error("Failed to process %s: %s", filename, str(outcome))
+                yield index, filename, outcome
+                continue
+            files_total.inc(outcome="parsed")
+            if not outcome.get("partial"):
+                result_cache.put(keys[index], outcome)
+            result = store_result(digests[index], filename, dict(outcome, filename=filename), page_texts)
+            if with_timings and trace is not None:
+                result["timings"] = trace.to_dict()
+            yield index, filename, result
             
-        return results
+    return results()
+
+def process_files_batch(
+    files: List[FileStorage], engine: str = PDF_TEXT_ENGINE, with_timings: bool = False
+) -> List[Dict]:
+    """Process multiple files and return their results in upload order.
+    
+    Raises:
+        SchedulerFull: If the scheduler can't take the files now
+    """
+    results = []
+    errors = []
+    
+    with timed("request"):
+        outcomes = sorted(iter_files_batch(files, engine, with_timings), key=lambda item: item[0])
+    for index, filename, outcome in outcomes:
+        if isinstance(outcome, Exception):
+            errors.append(f"{filename}: {str(outcome)}")
+        else:
+            results.append(outcome)
+            
+    if errors and not results:
+        raise ResumeParserError(f"All files failed to process. Errors: {'; '.join(errors)}")
+        
+    return results
+
+def parse_job_file(file_path: Path) -> Dict:
+    """Parse one file saved by the job queue, going through the result cache."""
+    data = file_path.read_bytes()
+    digest = content_digest(data)
+    filename = file_path.name.partition("_")[2]  # saved as "<index>_<filename>"
+    key = result_cache.key_for_digest(digest, PDF_TEXT_ENGINE)
+    result = result_cache.get(key)
+    if result is not None:
+        files_total.inc(outcome="cached")
+        return store_result(digest, filename, result)
+        
+    def parse() -> Tuple[Dict, List[str]]:
+        if app.config['PARSER_EXECUTOR'] == 'process':
+            executor = get_process_pool(app.config['MAX_WORKERS'])
+            result, trace, page_texts = executor.submit(parse_resume_bytes, data).result()
+            trace.record()  # the worker's own metrics aren't visible here
+        else:
+            page_texts = []
+            result = parse_resume(data, find_duplicate=find_duplicate, page_texts=page_texts)
+        return result, page_texts
+        
+    try:
+        # Jobs share the scheduler with uploads as one client and wait for room
+        result, page_texts = scheduler.run("jobs", parse_cost(data), len(data), parse)
+    except Exception:
+        files_total.inc(outcome="failed")
+        raise
+    files_total.inc(outcome="parsed")
+    if not result.get("partial"):
+        result_cache.put(key, result)
+    return store_result(digest, filename, result, page_texts)
+
+# Background parsing for POST /jobs
+job_queue = JobQueue(parse_job_file, UPLOAD_FOLDER / 'jobs', workers=JOB_WORKERS, ttl=JOB_TTL)
+
+# Gauges and counters read from the queue and caches on each scrape of /metrics
+ENRICHMENT_EVENTS = ("calls", "cache_hits", "timeouts", "failures", "skipped", "budget_misses")
+
+REGISTRY.register(Collector(
+    "resume_parser_job_queue_depth", "Files waiting in the job queue",
+    lambda: {(): job_queue.depth()},
+))
+REGISTRY.register(Collector(
+    "resume_parser_scheduler_tasks", "Parsing tasks in the scheduler by state",
+    lambda: {(("state", state),): scheduler.stats()[state] for state in ("queued", "running")},
+))
+REGISTRY.register(Collector(
+    "resume_parser_scheduler_bytes", "Upload bytes held by queued and running parsing tasks",
+    lambda: {(): scheduler.stats()["bytes"]},
+))
+REGISTRY.register(Collector(
+    "resume_parser_scheduler_expected_wait_seconds", "Expected time to finish the queued parsing work",
+    lambda: {(): scheduler.stats()["expected_wait"]},
+))
+REGISTRY.register(Collector(
+    "resume_parser_scheduler_rejected_total", "Uploads refused with 503 because the scheduler was full",
+    lambda: {(): scheduler.stats()["rejected"]},
+    kind="counter",
+))
+REGISTRY.register(Collector(
+    "resume_parser_result_cache_lookups_total", "Result cache lookups by outcome (disk hits are also hits)",
+    lambda: {(("outcome", outcome),): result_cache.stats()[outcome] for outcome in ("hits", "misses", "disk_hits")},
+    kind="counter",
+))
+REGISTRY.register(Collector(
+    "resume_parser_result_cache_entries", "Results held in memory by the result cache",
+    lambda: {(): result_cache.stats()["entries"]},
+))
+REGISTRY.register(Collector(
+    "resume_parser_enrichment_events_total", "AI enrichment calls, cache hits and failures by kind",
+    lambda: {
+        (("event", event),): count
+        for event, count in get_skill_enricher().stats().items() if event in ENRICHMENT_EVENTS
+    },
+    kind="counter",
+))
+REGISTRY.register(Collector(
+    "resume_parser_enrichment_breaker_open", "1 while the AI enrichment circuit breaker is open",
+    lambda: {(): int(get_skill_enricher().stats().get("breaker") == "open")},
+))
+
+def stream_files_batch(
+    outcomes: Iterator[Tuple[int, str, Union[Dict, Exception]]], mimetype: str
+) -> Iterator[str]:
+    """Serialize the outcomes of iter_files_batch as NDJSON lines or server-sent events as they finish."""
+    def encode(event: str, payload: Dict) -> str:
+        if mimetype == SSE_MIMETYPE:
+            return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+        return json.dumps(dict(payload, event=event)) + "\n"
+        
+    processed = 0
+    failed = 0
+    
+    try:
+        with timed("request"):
+            for index, filename, outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    failed += 1
+                    yield encode("error", {"index": index, "filename": filename, "error": str(outcome)})
+                else:
+                    processed += 1
+                    yield encode("result", {"index": index, "filename": filename, "result": outcome})
+    except Exception:
+        logger.exception("Unexpected error streaming resumes:")
+        yield encode("error", {
+            "error": "An unexpected error occurred while processing the resumes. Please try again."
+        })
+        
+    yield encode("done", {"processed": processed, "failed": failed})
 
 @app.route("/")
 def index() -> str:
@@ -112,7 +566,7 @@ def index() -> str:
     return render_template("index.html")
 
 @app.route("/upload", methods=["POST"])
-@limiter.limit("10 per minute")
+@limiter.limit(UPLOAD_RATE_LIMIT)
 def upload_file() -> Union[Response, Tuple[Response, int]]:
     """Handle resume file upload and parsing with improved error handling."""
     try:
@@ -121,11 +575,30 @@ def upload_file() -> Union[Response, Tuple[Response, int]]:
         if error:
             return jsonify({"error": error}), status_code
             
-        # Ensure upload directory exists
-        UPLOAD_FOLDER.mkdir(exist_ok=True, parents=True)
+        # Optional per-request override of the PDF text-extraction engine
+        engine = request.values.get("engine") or PDF_TEXT_ENGINE
+        if engine not in available_engines():
+            return jsonify({
+                "error": f"Unknown engine '{engine}'. Available engines: {', '.join(available_engines())}"
+            }), 400
+            
+        # Debug flag: add per-stage timings to each result
+        with_timings = request.values.get("timings") == "1"
         
+        mimetype = request.accept_mimetypes.best_match(
+            ["application/json", NDJSON_MIMETYPE, SSE_MIMETYPE], default="application/json"
+        )
         try:
-            results = process_files_batch(files)
+            if mimetype in (NDJSON_MIMETYPE, SSE_MIMETYPE):
+                # Queue the files first so a busy server answers 503, not a stream
+                outcomes = iter_files_batch(files, engine, with_timings)
+                return Response(
+                    stream_with_context(stream_files_batch(outcomes, mimetype)),
+                    mimetype=mimetype,
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+                )
+                
+            results = process_files_batch(files, engine, with_timings)
             
             if not results:
                 return jsonify({
@@ -134,6 +607,11 @@ def upload_file() -> Union[Response, Tuple[Response, int]]:
                 
             return jsonify({"results": results})
             
+        except SchedulerFull as e:
+            logger.warning("Refused %d files: %s", len(files), str(e))
+            response = jsonify({"error": str(e)})
+            response.headers["Retry-After"] = str(e.retry_after)
+            return response, 503
         except ResumeParserError as e:
             logger.error("Resume parsing error: %s", str(e))
             return jsonify({"error": str(e)}), 400
@@ -149,6 +627,169 @@ def upload_file() -> Union[Response, Tuple[Response, int]]:
             "error": "Internal server error. Please try again later."
         }), 500
 
+@app.route("/jobs", methods=["POST"])
+@limiter.limit("10 per minute")
+def submit_job() -> Tuple[Response, int]:
+    """Accept resume files for background parsing and return the job id right away."""
+    files = request.files.getlist("resume")
+    error, status_code = validate_files(files, max_files=JOB_MAX_FILES)
+    if error:
+        return jsonify({"error": error}), status_code
+        
+    try:
+        job = job_queue.submit([(secure_filename(file.filename), file.read()) for file in files])
+    except Exception:
+        logger.exception("Unexpected error queueing job:")
+        return jsonify({
+            "error": "Internal server error. Please try again later."
+        }), 500
+        
+    response = jsonify(dict(
+        job.to_status(),
+        status_url=url_for("job_status", job_id=job.id),
+        results_url=url_for("job_results", job_id=job.id),
+    ))
+    response.headers["Location"] = url_for("job_status", job_id=job.id)
+    return response, 202
+
+@app.route("/search", methods=["GET"])
+@limiter.limit("120 per minute")
+@require_store_access
+def search_resumes() -> Union[Response, Tuple[Response, int]]:
+    """Find stored resumes by skill.
+    
+    Query parameters: ``skills`` (comma-separated, repeatable), ``mode``
+    ("all" to require every skill, "any" to rank by how many match),
+    ``page`` and ``per_page``.
+    """
+    skills = [
+        skill.strip()
+        for value in request.args.getlist("skills")
+        for skill in value.split(",")
+        if skill.strip()
+    ]
+    if not skills:
+        return jsonify({"error": "Give at least one skill, e.g. /search?skills=python,sql"}), 400
+    if len(skills) > SEARCH_MAX_SKILLS:
+        return jsonify({"error": f"At most {SEARCH_MAX_SKILLS} skills can be searched at once"}), 400
+        
+    mode = request.args.get("mode", "all")
+    if mode not in SEARCH_MODES:
+        return jsonify({"error": f"Unknown mode '{mode}'. Use 'all' or 'any'."}), 400
+    page = request.args.get("page", 1, type=int)
+    per_page = request.args.get("per_page", SEARCH_PAGE_SIZE, type=int)
+    if page < 1 or not 1 <= per_page <= SEARCH_MAX_PAGE_SIZE:
+        return jsonify({
+            "error": f"page must be at least 1 and per_page between 1 and {SEARCH_MAX_PAGE_SIZE}"
+        }), 400
+        
+    return jsonify(resume_store.search(skills, mode, page, per_page))
+
+@app.route("/match", methods=["POST"])
+@limiter.limit("60 per minute")
+@require_store_access
+def match_resumes() -> Union[Response, Tuple[Response, int]]:
+    """Rank stored resumes against a job description.
+    
+    Takes JSON or form fields: ``job_description`` (required), ``top_k``,
+    and ``resume_ids`` to rank only some resumes, e.g. those just uploaded.
+    """
+    params = request.get_json(silent=True) or request.form
+    job_description = str(params.get("job_description") or "").strip()
+    if not job_description:
+        return jsonify({"error": "job_description is required"}), 400
+    if len(job_description) > MATCH_MAX_CHARS:
+        return jsonify({"error": f"job_description is limited to {MATCH_MAX_CHARS} characters"}), 400
+    try:
+        top_k = int(params.get("top_k", MATCH_TOP_K))
+        resume_ids = params.get("resume_ids")
+        if resume_ids is not None:
+            if isinstance(resume_ids, str):
+                resume_ids = [part for part in resume_ids.split(",") if part.strip()]
+            resume_ids = [int(resume_id) for resume_id in resume_ids]
+    except (TypeError, ValueError):
+        return jsonify({"error": "top_k and resume_ids must be integers"}), 400
+    if not 1 <= top_k <= MATCH_MAX_TOP_K:
+        return jsonify({"error": f"top_k must be between 1 and {MATCH_MAX_TOP_K}"}), 400
+        
+    skills = extract_job_skills(job_description)
+    current_ranker = sync_ranker()
+    with timed("match"):
+        ranked = current_ranker.rank(skills, job_description, top_k, resume_ids)
+    stored = resume_store.get_many([match["resume_id"] for match in ranked])
+    results = []
+    for match in ranked:
+        resume = stored.get(match["resume_id"])
+        if resume is not None:
+            results.append(dict(
+                match,
+                filename=resume["filename"],
+                name=resume.get("name", ""),
+                email=resume.get("email", ""),
+            ))
+    return jsonify({"skills": skills, "candidates": len(current_ranker), "results": results})
+
+@app.route("/reprocess", methods=["GET", "POST"])
+@limiter.limit("10 per minute")
+@require_store_access
+def reprocess() -> Union[Response, Tuple[Response, int]]:
+    """Rebuild stored resumes under the current parsing rules from their stored text.
+    
+    POST starts the rebuild in the background (unless one is running) and
+    answers 202; GET reports its progress, how many resumes are stale and
+    how many are ``outdated`` (parsed under other extraction rules, so
+    only uploading them again updates them).
+    """
+    started = False
+    with reprocess_lock:
+        if request.method == "POST" and not reprocess_state["running"]:
+            reprocess_state.update(
+                running=True, reprocessed=0, failed=0, started_at=time.time(), finished_at=None, error=None
+            )
+            threading.Thread(target=run_reprocess, name="reprocess", daemon=True).start()
+            started = True
+    response = jsonify(dict(
+        reprocess_state,
+        rules_version=RULES_VERSION,
+        stale=resume_store.count_stale(),
+        outdated=resume_store.count_outdated(),
+    ))
+    return (response, 202) if started else response
+
+@app.route("/resumes/<int:resume_id>", methods=["GET"])
+@limiter.limit("120 per minute")
+@require_store_access
+def get_resume(resume_id: int) -> Union[Response, Tuple[Response, int]]:
+    """Return one stored resume in full."""
+    resume = resume_store.get(resume_id)
+    if resume is None:
+        return jsonify({"error": "Resume not found."}), 404
+    return jsonify(resume)
+
+@app.route("/metrics", methods=["GET"])
+@limiter.exempt
+def metrics() -> Response:
+    """Expose parser metrics in the Prometheus text format."""
+    return Response(REGISTRY.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+@limiter.limit("120 per minute")
+def job_status(job_id: str) -> Union[Response, Tuple[Response, int]]:
+    """Report the status and progress of a job."""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found. It may have expired."}), 404
+    return jsonify(job.to_status())
+
+@app.route("/jobs/<job_id>/results", methods=["GET"])
+@limiter.limit("120 per minute")
+def job_results(job_id: str) -> Union[Response, Tuple[Response, int]]:
+    """Return the results parsed so far for a job, and its per-file errors."""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found. It may have expired."}), 404
+    return jsonify(job.to_results())
+
 @app.errorhandler(413)
 def request_entity_too_large(error: Exception) -> Tuple[Response, int]:
     """Handle file too large error with clearer message."""
@@ -159,10 +800,14 @@ def request_entity_too_large(error: Exception) -> Tuple[Response, int]:
 
 @app.errorhandler(429)
 def ratelimit_handler(error: Exception) -> Tuple[Response, int]:
-    """Handle rate limit exceeded error."""
-    return jsonify({
+    """Handle rate limit exceeded error, saying when the limit resets."""
+    response = jsonify({
         "error": "Too many requests. Please wait before trying again."
-    }), 429
+    })
+    if limiter.current_limit is not None:
+        retry_after = max(1, math.ceil(limiter.current_limit.reset_at - time.time()))
+        response.headers["Retry-After"] = str(retry_after)
+    return response, 429
 
 if __name__ == "__main__":
     app.run(debug=True)
@@ -0,0 +1,74 @@
+"""Benchmark: near-duplicate lookups as the resume store grows.
+
+Fills a throwaway resume store with synthetic resumes and, at each size,
+times looking up edited copies of stored resumes (which should be found)
+and unseen resumes (which should not). Run from the repository root:
+
+    python benchmarks/bench_near_duplicates.py --resumes 20000
+"""
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from near_duplicates import encode_signature, text_signature
+from resume_store import ResumeStore
+from synthetic_resumes import LAYOUTS, resume_lines
+
+def resume_text(seed: int) -> str:
+    return "\n".join(resume_lines(random.Random(seed), LAYOUTS[seed % len(LAYOUTS)]))
+
+def edited(text: str, rng: random.Random) -> str:
+    """The text with one line changed, one added and one removed."""
+    lines = text.split("\n")
+    lines[rng.randrange(len(lines))] += " (updated)"
+    lines.insert(rng.randrange(len(lines)), "Volunteer mentor at a local coding club")
+    del lines[rng.randrange(len(lines))]
+    return "\n".join(lines)
+
+def time_lookups(store: ResumeStore, texts, threshold: float):
+    """Median lookup time in ms and the share of lookups that found a match."""
+    timings = []
+    found = 0
+    for text in texts:
+        signature = text_signature(text)
+        started = time.perf_counter()
+        found += store.find_near_duplicate(signature, threshold) is not None
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000, found / len(texts)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=20000, help="largest store size")
+    parser.add_argument("--lookups", type=int, default=200, help="lookups timed at each size")
+    parser.add_argument("--threshold", type=float, default=0.8)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        store = ResumeStore(Path(directory) / "resumes.db", normalize=str.lower)
+        size = 0
+        checkpoint = 1000
+        while size < args.resumes:
+            while size < min(checkpoint, args.resumes):
+                text = resume_text(size)
+                store.add(f"key-{size}", f"{size}.pdf", {"minhash": encode_signature(text_signature(text))})
+                size += 1
+            copies = [edited(resume_text(rng.randrange(size)), rng) for _ in range(args.lookups)]
+            unseen = [resume_text(args.resumes + index) for index in range(args.lookups)]
+            copy_ms, copy_found = time_lookups(store, copies, args.threshold)
+            unseen_ms, unseen_found = time_lookups(store, unseen, args.threshold)
+            print(
+                f"{size:>7} resumes: edited copy {copy_ms:.2f} ms (found {copy_found:.0%}), "
+                f"unseen {unseen_ms:.2f} ms (false matches {unseen_found:.0%})"
+            )
+            checkpoint *= 4
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark: PDF text-extraction engines, pages/sec and section-extraction parity.
+
+Run from the repository root against a directory (or list) of PDF resumes:
+
+    python benchmarks/bench_pdf_extractors.py path/to/resumes --baseline pdfplumber
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf_text import EXTRACTORS
+from resume_parser import extract_sections
+
+def collect_pdfs(paths: List[str]) -> List[Path]:
+    """Expand files and directories into a sorted list of PDF files."""
+    pdfs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            pdfs.extend(sorted(path.rglob("*.pdf")))
+        else:
+            pdfs.append(path)
+    return pdfs
+
+def run_engine(engine: str, pdfs: List[Path]) -> Dict:
+    """Extract every PDF with one engine, timing only the extraction."""
+    texts = {}
+    pages = 0
+    started = time.perf_counter()
+    for pdf in pdfs:
+        page_texts = list(EXTRACTORS[engine](pdf))
+        pages += len(page_texts)
+        texts[pdf] = "".join(page_texts)
+    elapsed = time.perf_counter() - started
+    return {"texts": texts, "pages": pages, "seconds": elapsed}
+
+def section_diff(reference: Dict, candidate: Dict) -> List[str]:
+    """Names of sections whose extracted content differs between two engines."""
+    differing = []
+    for name, value in reference.items():
+        other = candidate.get(name)
+        if name == "skills":
+            value, other = set(value), set(other or [])
+        if value != other:
+            differing.append(name)
+    return differing
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="PDF files or directories of PDFs")
+    parser.add_argument("--baseline", default="pdfplumber", choices=sorted(EXTRACTORS),
+                        help="engine the others are compared against")
+    args = parser.parse_args()
+
+    pdfs = collect_pdfs(args.paths)
+    if not pdfs:
+        parser.error("no PDF files found")
+
+    runs = {engine: run_engine(engine, pdfs) for engine in EXTRACTORS}
+    print(f"{len(pdfs)} files, {runs[args.baseline]['pages']} pages")
+    for engine, run in runs.items():
+        rate = run["pages"] / run["seconds"] if run["seconds"] else float("inf")
+        print(f"{engine:>12}: {run['seconds']:7.2f} s  {rate:8.1f} pages/sec")
+
+    baseline = {pdf: extract_sections(text) for pdf, text in runs[args.baseline]["texts"].items()}
+    for engine, run in runs.items():
+        if engine == args.baseline:
+            continue
+        identical = 0
+        mismatches: Dict[str, int] = {}
+        for pdf, text in run["texts"].items():
+            differing = section_diff(baseline[pdf], extract_sections(text))
+            if not differing:
+                identical += 1
+            for name in differing:
+                mismatches[name] = mismatches.get(name, 0) + 1
+        print(f"{engine} vs {args.baseline}: {identical}/{len(pdfs)} files with identical sections")
+        for name, count in sorted(mismatches.items(), key=lambda item: -item[1]):
+            print(f"    {name}: differs in {count} files")
+
+if __name__ == "__main__":
+    main()
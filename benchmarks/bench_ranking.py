@@ -0,0 +1,78 @@
+"""Benchmark: ranking synthetic resumes against a job description.
+
+Builds the ranker's matrices for ``--resumes`` parsed-looking resumes,
+then times full-corpus rankings and single incremental additions. Run
+from the repository root:
+
+    python benchmarks/bench_ranking.py --resumes 100000
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from ranking import ResumeRanker
+from synthetic_resumes import ACHIEVEMENTS, COMPANIES, SKILLS, TITLES
+
+JOB_DESCRIPTION = """Senior Backend Engineer
+We are looking for an engineer to build REST API services in Python and
+PostgreSQL, run them on Kubernetes and AWS, and automate CI/CD with Docker.
+Experience leading a team and mentoring junior developers is a plus.
+Skills: Python, Django, PostgreSQL, Docker, Kubernetes, AWS"""
+
+# Extra vocabulary so the text matrix has a realistic number of distinct words
+FILLER = [f"{word}{number}" for word in ("project", "client", "system", "module") for number in range(2000)]
+
+def make_result(rng: random.Random) -> dict:
+    descriptions = []
+    for _ in range(rng.randint(2, 6)):
+        descriptions.append(
+            f"{rng.choice(TITLES)} | {rng.choice(COMPANIES)} {rng.choice(ACHIEVEMENTS)} "
+            + " ".join(rng.sample(FILLER, 5))
+        )
+    return {
+        "skills": [skill.lower() for skill in rng.sample(SKILLS, rng.randint(5, 14))],
+        "work_experience": [{"description": description} for description in descriptions],
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=100000, help="resumes in the corpus")
+    parser.add_argument("--repeat", type=int, default=20, help="timed rankings")
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    ranker = ResumeRanker(normalize=str.lower)
+    started = time.perf_counter()
+    for resume_id in range(1, args.resumes + 1):
+        ranker.add(resume_id, make_result(rng))
+    build = time.perf_counter() - started
+
+    skills = ["python", "django", "postgresql", "docker", "kubernetes", "aws"]
+    ranker.rank(skills, JOB_DESCRIPTION, args.top_k)  # converts the posting lists once
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        top = ranker.rank(skills, JOB_DESCRIPTION, args.top_k)
+        timings.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    ranker.add(args.resumes + 1, make_result(rng))
+    added = time.perf_counter() - started
+    started = time.perf_counter()
+    ranker.rank(skills, JOB_DESCRIPTION, args.top_k)
+    after_add = time.perf_counter() - started
+
+    print(f"corpus: {args.resumes} resumes, built in {build:.1f}s")
+    print(f"rank top {args.top_k}: median {statistics.median(timings) * 1000:.1f} ms, max {max(timings) * 1000:.1f} ms")
+    print(f"add one resume: {added * 1000:.2f} ms; next ranking: {after_add * 1000:.1f} ms")
+    print(f"best: {top[0]}")
+
+if __name__ == "__main__":
+    main()
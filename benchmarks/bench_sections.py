@@ -0,0 +1,91 @@
+"""Microbenchmark: single-pass section segmentation vs. per-line keyword scans.
+
+Run from the repository root:
+
+    python benchmarks/bench_sections.py --lines 2000
+"""
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sections import classify_header, segment_sections
+
+SAMPLE_LINES = [
+    "Senior Software Engineer | Acme Corp | 2019 - Present",
+    "Software Engineer",
+    "Project Manager",
+    "Volunteer Coordinator",
+    "Built REST API services in Python 3.11 and Node.js backed by PostgreSQL and Redis.",
+    "Maintained internal software tools used by 300 engineers across four offices.",
+    "Led migration of 40 microservices to Kubernetes on AWS using Docker and Jenkins CI/CD.",
+    "B.Tech in Computer Science, Example Institute of Technology, 2014 - 2018",
+    "Languages: Python, JavaScript, TypeScript, SQL",
+    "Volunteered teaching children to read at the local library on weekends.",
+    "",
+]
+HEADER_LINES = ["EXPERIENCE", "Education", "Technical Skills", "Projects", "Certifications:", "Hobbies"]
+
+def build_lines(count: int, seed: int = 0) -> list:
+    """Build a long synthetic resume with a header every ~15 lines, with a fixed seed."""
+    rng = random.Random(seed)
+    return [
+        rng.choice(HEADER_LINES) if rng.random() < 1 / 15 else rng.choice(SAMPLE_LINES)
+        for _ in range(count)
+    ]
+
+def legacy_classify(lower_line: str):
+    """The original header check: substring scans over every keyword list, rebuilt per line."""
+    skills_headers = [
+        "technical skills", "skills", "technologies", "programming languages",
+        "competencies", "expertise", "proficiencies", "technical proficiencies",
+        "tools", "software", "qualifications", "technical expertise",
+        "core competencies", "professional skills", "key skills",
+        "technical skills & tools", "languages & technologies", "professional expertise",
+    ]
+    work_headers = ["experience", "employment", "work history", "professional background"]
+    other_headers = [
+        "interests", "hobbies", "awards", "achievements",
+        "volunteer", "project", "certifications", "languages",
+    ]
+    if any(header in lower_line for header in skills_headers):
+        return "skills"
+    if any(header in lower_line for header in work_headers):
+        return "work_experience"
+    if "education" in lower_line:
+        return "education"
+    if any(header in lower_line for header in other_headers):
+        return "other"
+    return None
+
+def legacy_segment(lines: list) -> int:
+    headers = 0
+    for line in lines:
+        stripped = line.strip()
+        if stripped and legacy_classify(stripped.lower()) is not None:
+            headers += 1
+    return headers
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=2000, help="lines of resume text")
+    parser.add_argument("--repeat", type=int, default=20, help="timed iterations per approach")
+    args = parser.parse_args()
+
+    lines = build_lines(args.lines)
+    legacy = timeit.timeit(lambda: legacy_segment(lines), number=args.repeat) / args.repeat
+    single = timeit.timeit(lambda: segment_sections(lines), number=args.repeat) / args.repeat
+
+    true_headers = sum(line in HEADER_LINES for line in lines)
+    legacy_headers = legacy_segment(lines)
+    single_headers = sum(classify_header(line) is not None for line in lines if line.strip())
+    print(f"text: {args.lines} lines, {true_headers} real headers")
+    print(f"keyword scans:     {legacy * 1000:8.2f} ms  ({legacy_headers} lines taken as headers)")
+    print(f"segment_sections:  {single * 1000:8.2f} ms  ({single_headers} lines taken as headers)")
+    print(f"speedup: {legacy / single:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Microbenchmark: single-pass SkillMatcher vs. one re.finditer per SKILL_PATTERN.
+
+Run from the repository root:
+
+    python benchmarks/bench_skill_matcher.py --lines 2000
+"""
+import argparse
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from resume_parser import SKILL_PATTERNS, clean_skill, skill_matcher, skills_noise_regex
+
+SAMPLE_LINES = [
+    "Senior Software Engineer | Acme Corp | 2019 - Present",
+    "Built REST API services in Python 3.11 and Node.js backed by PostgreSQL and Redis.",
+    "Led migration of 40 microservices to Kubernetes on AWS using Docker and Jenkins CI/CD.",
+    "Mentored engineers on Agile and Scrum practices; tracked work in JIRA and Confluence.",
+    "Developed React Native and Flutter mobile apps with GitHub Actions pipelines.",
+    "Applied Machine Learning and Data Visualization with Pandas, NumPy and TensorFlow.",
+    "Improved communication between product, QA and design teams using Figma.",
+    "Volunteered teaching children to read at the local library on weekends.",
+]
+
+def build_text(lines: int, seed: int = 0) -> str:
+    """Build a long synthetic resume body with a fixed seed."""
+    rng = random.Random(seed)
+    return "\n".join(rng.choice(SAMPLE_LINES) for _ in range(lines))
+
+def legacy_find_all(text: str) -> set:
+    """The original skill pass: one re.finditer per pattern, clean_skill per hit."""
+    skills = set()
+    for pattern in SKILL_PATTERNS:
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            skill = match.group().strip()
+            if len(skill) >= 2 and not skills_noise_regex.search(skill.lower()):
+                skills.add(clean_skill.__wrapped__(skill))
+    return skills
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=2000, help="lines of resume text")
+    parser.add_argument("--repeat", type=int, default=20, help="timed iterations per engine")
+    args = parser.parse_args()
+
+    text = build_text(args.lines)
+    legacy = timeit.timeit(lambda: legacy_find_all(text), number=args.repeat) / args.repeat
+    single = timeit.timeit(lambda: skill_matcher.find_all(text), number=args.repeat) / args.repeat
+
+    legacy_skills = legacy_find_all(text)
+    single_skills = skill_matcher.find_all(text)
+    print(f"text: {len(text):,} chars, {args.lines} lines")
+    print(f"per-pattern finditer: {legacy * 1000:8.2f} ms  ({len(legacy_skills)} skills)")
+    print(f"single-pass matcher:  {single * 1000:8.2f} ms  ({len(single_skills)} skills)")
+    print(f"speedup: {legacy / single:.1f}x")
+    print(f"only in per-pattern: {sorted(legacy_skills - single_skills)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark: cold start time and per-worker memory of preforked parser workers.
+
+Cold start is the time to import the app in a fresh interpreter plus the
+first parse, which pays for any model loading left until then. Memory is
+measured in forked workers that each parse a resume, with the model
+loaded in the parent before the fork (as gunicorn.conf.py does) or in each
+worker after it. Needs Linux for /proc/<pid>/smaps_rollup. Run from the
+repository root:
+
+    python benchmarks/bench_startup.py --workers 4
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_resumes import make_resume_pdf
+
+def memory_kb() -> Dict[str, int]:
+    """Proportional (PSS) and private (USS) memory of this process in kB."""
+    fields = {}
+    with open("/proc/self/smaps_rollup") as smaps:
+        for line in smaps:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "pss_kb": fields.get("Pss", 0),
+        "uss_kb": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+def run_child(args: List[str]) -> Dict:
+    """Run a fresh interpreter with ``args`` and return the JSON it prints last."""
+    output = subprocess.run(
+        [sys.executable, *args], cwd=ROOT, env=dict(os.environ, RESULT_CACHE_DB="", RESUME_STORE_DB="", NEAR_DUPLICATE_DETECTION="0"),
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+COLD_START = """
+import json, sys, time
+sys.path.insert(0, {benchmarks!r})
+from synthetic_resumes import make_resume_pdf
+started = time.perf_counter()
+import app
+imported = time.perf_counter() - started
+import resume_parser
+started = time.perf_counter()
+resume_parser.parse_resume(make_resume_pdf(0))
+print(json.dumps({{"import_s": imported, "first_parse_s": time.perf_counter() - started}}))
+"""
+
+def bench_cold_start(repeat: int) -> Dict[str, float]:
+    """Import time and first-parse time of the app in fresh interpreters."""
+    code = COLD_START.format(benchmarks=str(Path(__file__).resolve().parent))
+    runs = [run_child(["-c", code]) for _ in range(repeat)]
+    return {
+        name: round(min(run[name] for run in runs), 4)
+        for name in ("import_s", "first_parse_s")
+    }
+
+def bench_workers(workers: int, preload: bool) -> Dict[str, int]:
+    """Fork ``workers`` children that parse a resume; report their mean PSS and USS."""
+    import gc
+    import resume_parser
+
+    if preload:
+        resume_parser.warmup()
+        gc.freeze()
+    data = make_resume_pdf(0)
+    pipes = []
+    for _ in range(workers):
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_end)
+            resume_parser.parse_resume(data)
+            os.write(write_end, json.dumps(memory_kb()).encode())
+            os._exit(0)
+        os.close(write_end)
+        pipes.append((pid, read_end))
+
+    # Every child is forked before any result is read, so the children
+    # run, and share pages, side by side
+    samples = []
+    for pid, read_end in pipes:
+        with os.fdopen(read_end) as reader:
+            samples.append(json.loads(reader.read()))
+        os.waitpid(pid, 0)
+    return {
+        name: sum(sample[name] for sample in samples) // len(samples)
+        for name in ("pss_kb", "uss_kb")
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4, help="forked workers to measure")
+    parser.add_argument("--repeat", type=int, default=3, help="cold starts to time (the fastest is kept)")
+    parser.add_argument("--mode", choices=("preload", "per-worker"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        # Runs in its own interpreter so nothing is loaded beforehand
+        print(json.dumps(bench_workers(args.workers, args.mode == "preload")))
+        return
+
+    report = {"cold_start": bench_cold_start(args.repeat), "workers": args.workers}
+    for mode in ("preload", "per-worker"):
+        report[mode] = run_child([__file__, "--mode", mode, "--workers", str(args.workers)])
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Benchmark suite: per-stage timings and /upload throughput on a synthetic corpus.
+
+Writes a JSON report that can be diffed between commits. AI enrichment is
+pointed at a stub endpoint served from this process, so no network or API
+token is needed. Run from the repository root:
+
+    python benchmarks/run_benchmarks.py --count 30 --output bench.json
+    python benchmarks/run_benchmarks.py --pdfs path/to/resumes --stub-latency 0.2
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_resumes import make_corpus
+
+BATCH_SIZES = (1, 10, 50)
+
+class StubEnrichmentHandler(BaseHTTPRequestHandler):
+    """Answers inference calls like the Hugging Face NER endpoint, after ``latency`` seconds."""
+
+    latency = 0.0
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(self.latency)
+        entities = [{"entity_group": "ORG", "word": "Kubernetes"}, {"entity_group": "MISC", "word": "GraphQL"}]
+        payload = json.dumps([entities for _ in body["inputs"]]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+def start_stub(latency: float) -> ThreadingHTTPServer:
+    """Serve the stub endpoint on a free local port in a background thread."""
+    StubEnrichmentHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubEnrichmentHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Mean, median and p95 of timings in seconds, reported in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean_ms": round(statistics.mean(ordered) * 1000, 3),
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        "total_s": round(sum(ordered), 4),
+    }
+
+def timed(func: Callable, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+def bench_stages(corpus: List[bytes], engine: str) -> Dict[str, Dict[str, float]]:
+    """Time each parsing stage separately on every resume of the corpus."""
+    import resume_parser
+
+    stages: Dict[str, List[float]] = {
+        "pdf_extraction": [], "ner": [], "sections": [], "skills": [], "enrichment": [], "total": [],
+    }
+    resume_parser.clean_skill.cache_clear()
+    resume_parser.get_skill_enricher().clear_cache()
+    nlp = resume_parser.get_nlp()
+    for data in corpus:
+        started = time.perf_counter()
+        text, seconds = timed(resume_parser.extract_text_from_pdf, data, engine)
+        stages["pdf_extraction"].append(seconds)
+        if nlp is not None:
+            _, seconds = timed(nlp, resume_parser.ner_window(text))
+            stages["ner"].append(seconds)
+        _, seconds = timed(resume_parser.extract_sections, text)
+        stages["sections"].append(seconds)
+        _, seconds = timed(resume_parser.skill_matcher.find_all, text)
+        stages["skills"].append(seconds)
+        _, seconds = timed(resume_parser.enhance_with_ai, text)
+        stages["enrichment"].append(seconds)
+        stages["total"].append(time.perf_counter() - started)
+    return {name: summarize(samples) for name, samples in stages.items() if samples}
+
+def bench_upload(corpus: List[bytes], batch_sizes=BATCH_SIZES) -> Dict[str, Dict[str, float]]:
+    """Time /upload through the Flask test client for several batch sizes, with a cold result cache."""
+    import app as webapp
+    import resume_parser
+
+    webapp.limiter.enabled = False
+    client = webapp.app.test_client()
+    throughput = {}
+    for size in batch_sizes:
+        files = [(BytesIO(corpus[index % len(corpus)]), f"resume_{index}.pdf") for index in range(size)]
+        webapp.result_cache.clear()
+        resume_parser.get_skill_enricher().clear_cache()
+        started = time.perf_counter()
+        response = client.post("/upload", data={"resume": files}, content_type="multipart/form-data")
+        elapsed = time.perf_counter() - started
+        throughput[str(size)] = {
+            "status": response.status_code,
+            "seconds": round(elapsed, 4),
+            "files_per_s": round(size / elapsed, 2),
+        }
+    return throughput
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=30, help="synthetic resumes to generate")
+    parser.add_argument("--seed", type=int, default=0, help="corpus random seed")
+    parser.add_argument("--pdfs", help="directory of real PDFs to use instead of the synthetic corpus")
+    parser.add_argument("--engine", default="auto", help="PDF text-extraction engine")
+    parser.add_argument("--stub-latency", type=float, default=0.0, help="seconds the stub enrichment endpoint waits")
+    parser.add_argument("--batch-sizes", default=",".join(map(str, BATCH_SIZES)), help="files per /upload request")
+    parser.add_argument("--skip-upload", action="store_true", help="only time the parsing stages")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    # The parser reads its configuration at import time
+    stub = start_stub(args.stub_latency)
+    os.environ["HF_API_TOKEN"] = "benchmark"
+    os.environ["HF_API_URL"] = f"http://127.0.0.1:{stub.server_address[1]}"
+    os.environ["RESULT_CACHE_DB"] = ""
+    # Keep synthetic resumes out of any configured resume store, and
+    # don't let near-duplicates of earlier runs skip NER and enrichment
+    os.environ["RESUME_STORE_DB"] = ""
+    os.environ["NEAR_DUPLICATE_DETECTION"] = "0"
+
+    if args.pdfs:
+        corpus = [path.read_bytes() for path in sorted(Path(args.pdfs).rglob("*.pdf"))]
+    else:
+        corpus = make_corpus(args.count, args.seed)
+
+    logging.disable(logging.WARNING)
+
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": {"files": len(corpus), "bytes": sum(map(len, corpus)), "seed": None if args.pdfs else args.seed},
+        "engine": args.engine,
+        "stub_latency_s": args.stub_latency,
+        "stages": bench_stages(corpus, args.engine),
+    }
+    if not args.skip_upload:
+        report["upload"] = bench_upload(corpus, [int(size) for size in args.batch_sizes.split(",")])
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
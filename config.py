@@ -7,15 +7,88 @@ load_dotenv()
 
 # API Configuration
 HF_API_TOKEN = os.getenv('HF_API_TOKEN', '')
-HF_API_TIMEOUT = 30  # seconds
+HF_API_URL = os.getenv('HF_API_URL', 'https://api-inference.huggingface.co/models/dslim/bert-base-NER')
+HF_API_TIMEOUT = float(os.getenv('HF_API_TIMEOUT', '30'))  # seconds
+HF_API_BUDGET = float(os.getenv('HF_API_BUDGET', '5'))  # seconds a parse waits for enrichment before returning without it
+HF_API_BATCH_SIZE = 8  # resumes sent per inference call
+HF_API_INPUT_CHARS = 500  # characters of each resume sent to the model
+HF_API_POOL_SIZE = 10  # connections kept open to the endpoint
+HF_CACHE_SIZE = 1024  # inference responses kept in memory
+HF_BREAKER_THRESHOLD = 3  # consecutive failures before calls are paused
+HF_BREAKER_COOLDOWN = 60  # seconds calls stay paused
+
+# Skill Enrichment Configuration
+SKILL_ENRICHMENT_BACKEND = os.getenv('SKILL_ENRICHMENT_BACKEND', 'remote')  # 'remote' (Hugging Face API) or 'local' (offline taxonomy matcher)
+SKILL_TAXONOMY_FILE = Path(os.getenv('SKILL_TAXONOMY_FILE', Path(__file__).parent / 'data' / 'skills_taxonomy.txt'))
 
 # File Upload Configuration
 UPLOAD_FOLDER = Path('uploads')
 MAX_CONTENT_LENGTH = 5 * 1024 * 1024  # 5MB
 ALLOWED_EXTENSIONS = {'pdf'}
+UPLOAD_RATE_LIMIT = os.getenv('UPLOAD_RATE_LIMIT', '60 per minute;1000 per day')  # /upload requests per client; the web page sends up to 10 files per request
+
+# Parsing Backend Configuration
+PARSER_EXECUTOR = os.getenv('PARSER_EXECUTOR', 'thread')  # 'thread' or 'process'
+PARSER_WORKERS = int(os.getenv('PARSER_WORKERS', os.cpu_count() or 4))
+PARSER_WARMUP = os.getenv('PARSER_WARMUP', '0') == '1'  # load the model when the app starts instead of on the first parse
+
+# Scheduler Configuration
+SCHEDULER_MAX_QUEUED = int(os.getenv('SCHEDULER_MAX_QUEUED', '500'))  # parse tasks waiting or running across all requests
+SCHEDULER_MAX_MB = int(os.getenv('SCHEDULER_MAX_MB', '512'))  # upload megabytes held by waiting or running files
+SCHEDULER_MAX_WAIT = float(os.getenv('SCHEDULER_MAX_WAIT', '30'))  # expected seconds of queued work above which uploads get 503
+SCHEDULER_BATCH_FILES = 8  # files of one upload parsed together (thread executor), to keep NER batched
+
+# Job Queue Configuration
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '2'))  # background threads parsing queued jobs
+JOB_TTL = 3600  # seconds a finished job's results are kept
+JOB_MAX_FILES = 1000  # files accepted in one job submission
+
+# Result Cache Configuration
+PARSER_VERSION = '2'  # bump when parsing logic changes to invalidate cached results
+RESULT_CACHE_SIZE = 1024  # entries kept in memory
+RESULT_CACHE_DB = os.getenv('RESULT_CACHE_DB', '')  # optional SQLite file for a persistent tier
+
+# Resume Store Configuration
+RESUME_STORE_DB = os.getenv('RESUME_STORE_DB', '')  # SQLite file keeping every parsed resume, contact details and text included (off unless set)
+RESUME_STORE_TOKEN = os.getenv('RESUME_STORE_TOKEN', '')  # bearer token required by /search, /match, /resumes and /reprocess (closed while empty)
+SEARCH_PAGE_SIZE = 20  # results per /search page by default
+SEARCH_MAX_PAGE_SIZE = 100
+SEARCH_MAX_SKILLS = 50  # skills accepted in one /search query
+
+# Near-Duplicate Detection Configuration
+NEAR_DUPLICATE_DETECTION = os.getenv('NEAR_DUPLICATE_DETECTION', '1') == '1'  # look new resumes up among stored ones (needs the resume store)
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv('NEAR_DUPLICATE_THRESHOLD', '0.8'))  # estimated Jaccard similarity of word shingles
+NEAR_DUPLICATE_REUSE = os.getenv('NEAR_DUPLICATE_REUSE', '0') == '1'  # take the name and AI skills from the earlier parse instead of running NER and enrichment
+
+# Job Matching Configuration
+MATCH_SKILL_WEIGHT = float(os.getenv('MATCH_SKILL_WEIGHT', '0.7'))  # share of a match score from skills; the rest from work experience text
+MATCH_TOP_K = 10  # candidates returned by /match by default
+MATCH_MAX_TOP_K = 500
+MATCH_MAX_CHARS = 20000  # job description length accepted by /match
+
+# PDF Text Extraction Configuration
+PDF_TEXT_ENGINE = os.getenv('PDF_TEXT_ENGINE', 'auto')  # 'auto' (pdfium, then pdfplumber), 'pdfium' or 'pdfplumber'
+PDF_MIN_CHARS_PER_PAGE = 20  # below this on a page, 'auto' reads that page with pdfplumber too
+PDF_MAX_PAGES = 10  # pages read per resume (0 for no limit)
+PDF_MAX_CHARS = 50000  # characters read per resume (0 for no limit)
+PDF_EARLY_EXIT = os.getenv('PDF_EARLY_EXIT', '1') == '1'  # stop reading once contact, skills, experience and education are complete
+
+# Section Segmentation Configuration
+SECTION_HEADER_MAX_WORDS = 5  # longer lines are body text, never section headers
 
 # Model Configuration
 SPACY_MODEL = 'en_core_web_sm'
+SPACY_PIPELINE_MODE = os.getenv('SPACY_PIPELINE_MODE', 'ner')  # 'full', 'ner' (entity recognizer only) or 'rules' (no model)
+SPACY_NER_EXCLUDE = ('tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter')  # components skipped in 'ner' mode
+SPACY_NER_MAX_LINES = 10  # header lines searched for the candidate's name
+SPACY_NER_MAX_CHARS = 1000  # header characters searched for the candidate's name
+SPACY_BATCH_SIZE = 16  # texts per nlp.pipe batch
+SPACY_N_PROCESS = int(os.getenv('SPACY_N_PROCESS', '1'))  # processes used by nlp.pipe
+
+# Logging Configuration
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')  # 'text' or 'json' (one object per line)
+LOG_QUEUE = os.getenv('LOG_QUEUE', '1') == '1'  # write log records from a background thread
 
 # Regex Patterns
 EMAIL_PATTERN = r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+'
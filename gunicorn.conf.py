@@ -0,0 +1,47 @@
+"""Gunicorn settings for serving the app with a preloaded, threaded worker.
+
+    pip install -r requirements.txt
+    gunicorn -c gunicorn.conf.py app:app
+
+The app and the spaCy model are loaded once in the master process before
+the workers are forked, so the workers share the model's memory
+copy-on-write instead of each loading its own copy, and a new worker is
+ready as soon as it forks.
+
+One worker with several threads is the default because the job queue,
+/reprocess progress, the result cache's memory tier and the parsing
+scheduler live in each worker's memory: with more workers, job and
+reprocess status requests that land on another worker find nothing, and
+the scheduler's limits and PARSER_WORKERS apply per worker. Only raise
+GUNICORN_WORKERS if you don't use /jobs or /reprocess, and lower
+PARSER_WORKERS and the SCHEDULER_* limits to match.
+"""
+import gc
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('GUNICORN_WORKERS', '1'))  # see above before raising
+threads = int(os.getenv('GUNICORN_THREADS', '8'))  # requests handled at once; parsing itself runs on the scheduler's PARSER_WORKERS
+worker_class = 'gthread'
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))  # large batches take a while
+preload_app = True
+
+def on_starting(server) -> None:
+    """Load the model in the master, after the app is preloaded and before any fork."""
+    import resume_parser
+
+    resume_parser.warmup()
+    # Move everything loaded so far out of the garbage collector's reach, so
+    # collections in the workers don't write to (and so copy) shared pages
+    gc.freeze()
+
+def post_fork(server, worker) -> None:
+    """Replace state that must not be shared with the master."""
+    from app import result_cache, resume_store
+    from log_config import configure_logging
+
+    # The master's log queue has no listener in this process
+    configure_logging()
+    result_cache.after_fork()
+    if resume_store is not None:
+        resume_store.after_fork()
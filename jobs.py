@@ -0,0 +1,189 @@
+import logging
+import queue
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class Job:
+    """State of one batch of resumes submitted through the job API."""
+
+    def __init__(self, job_id: str, directory: Path, filenames: List[str]) -> None:
+        self.id = job_id
+        self.directory = directory
+        self.filenames = filenames
+        self.results: List[Optional[Dict]] = [None] * len(filenames)
+        self.errors: Dict[int, str] = {}  # by file index, since filenames can repeat
+        self.completed = 0
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+
+    @property
+    def status(self) -> str:
+        """One of ``queued``, ``running`` or ``finished``."""
+        if self.finished_at is not None:
+            return "finished"
+        return "running" if self.completed else "queued"
+
+    def to_status(self) -> Dict:
+        """Return the job's status and progress as a JSON-serializable dict."""
+        total = len(self.filenames)
+        return {
+            "id": self.id,
+            "status": self.status,
+            "total": total,
+            "completed": self.completed,
+            "failed": len(self.errors),
+            "progress": round(self.completed / total, 3) if total else 1.0,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+    def to_results(self) -> Dict:
+        """Return the results parsed so far and the per-file errors, each with its file ``index``."""
+        return dict(
+            self.to_status(),
+            results=[
+                dict(result, index=index) for index, result in enumerate(self.results) if result is not None
+            ],
+            errors=[
+                {"index": index, "filename": self.filenames[index], "error": error}
+                for index, error in sorted(self.errors.items())
+            ],
+        )
+
+class JobQueue:
+    """In-process queue that parses submitted resumes on background worker threads.
+
+    Uploaded files are written to a per-job directory under ``upload_folder``
+    and removed as soon as they are parsed. Finished jobs are kept for
+    ``ttl`` seconds so their results can be fetched, then discarded.
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[Path], Dict],
+        upload_folder: Path,
+        workers: int = 2,
+        ttl: float = 3600,
+    ) -> None:
+        """
+        Args:
+            parse: Parses one saved PDF file and returns the resume data
+            upload_folder: Directory under which job files are stored
+            workers: Number of background worker threads
+            ttl: Seconds a finished job is kept before it is discarded
+        """
+        self.parse = parse
+        self.upload_folder = upload_folder
+        self.workers = workers
+        self.ttl = ttl
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Tuple[str, int]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start the worker threads if they are not running yet."""
+        with self._lock:
+            if self._threads:
+                return
+            for number in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work, name=f"resume-job-worker-{number}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, uploads: List[Tuple[str, bytes]]) -> Job:
+        """Store uploaded files and queue them for parsing.
+
+        Args:
+            uploads: ``(filename, contents)`` pairs
+
+        Returns:
+            The newly created job
+        """
+        self.start()
+        self._expire()
+        job_id = uuid.uuid4().hex
+        directory = self.upload_folder / job_id
+        directory.mkdir(parents=True, exist_ok=True)
+        for index, (filename, data) in enumerate(uploads):
+            (directory / f"{index}_{filename}").write_bytes(data)
+
+        job = Job(job_id, directory, [filename for filename, _ in uploads])
+        with self._lock:
+            self._jobs[job_id] = job
+        for index in range(len(uploads)):
+            self._queue.put((job_id, index))
+        logger.info("Queued job %s with %d files", job_id, len(uploads))
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return the job with ``job_id``, or None if it is unknown or expired."""
+        self._expire()
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def depth(self) -> int:
+        """Number of files waiting to be parsed."""
+        return self._queue.qsize()
+
+    def _work(self) -> None:
+        while True:
+            job_id, index = self._queue.get()
+            try:
+                self._run(job_id, index)
+            except Exception:
+                logger.exception("Job worker failed on job %s:", job_id)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job_id: str, index: int) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return
+
+        filename = job.filenames[index]
+        file_path = job.directory / f"{index}_{filename}"
+        result = None
+        error = None
+        try:
+            result = dict(self.parse(file_path), filename=filename)
+        except Exception as e:
+            error = str(e)
+            logger.error("Job %s failed to process %s: %s", job_id, filename, error)
+        finally:
+            try:
+                file_path.unlink()
+            except OSError as e:
+                logger.error("Failed to delete uploaded file %s: %s", file_path.name, str(e))
+
+        with self._lock:
+            if error is None:
+                job.results[index] = result
+            else:
+                job.errors[index] = error
+            job.completed += 1
+            if job.completed == len(job.filenames):
+                job.finished_at = time.time()
+                shutil.rmtree(job.directory, ignore_errors=True)
+                logger.info("Finished job %s", job_id)
+
+    def _expire(self) -> None:
+        """Drop finished jobs older than the TTL."""
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.finished_at is not None and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
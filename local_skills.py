@@ -0,0 +1,124 @@
+import hashlib
+import logging
+import threading
+from concurrent import futures
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
+
+from ai_client import EnrichmentRequest
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+logger = logging.getLogger(__name__)
+
+def load_taxonomy(path: Union[str, Path]) -> List[Tuple[str, List[str], bool]]:
+    """Read a skills taxonomy file.
+
+    Each non-comment line holds a canonical skill name, optionally followed
+    by a colon and comma-separated aliases. A leading ``=`` makes the line
+    match case-sensitively.
+
+    Args:
+        path: Taxonomy file
+
+    Returns:
+        ``(canonical, terms, case_sensitive)`` per skill, where ``terms``
+        includes the canonical name itself
+    """
+    entries = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        case_sensitive = line.startswith("=")
+        line = line.lstrip("=")
+        canonical, _, aliases = line.partition(":")
+        canonical = canonical.strip()
+        terms = [canonical] + [alias.strip() for alias in aliases.split(",") if alias.strip()]
+        entries.append((canonical, terms, case_sensitive))
+    return entries
+
+class TaxonomySkillModel:
+    """Offline replacement for the remote skill model, backed by a taxonomy file.
+
+    Skills are found with spaCy PhraseMatchers over the tokenized resume,
+    so it needs no network, has no latency budget to miss, and reads the
+    whole text rather than only its beginning. It exposes the same
+    ``find_skills``/``submit`` interface as EnrichmentClient.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        nlp: "Language",
+        taxonomy: List[Tuple[str, List[str], bool]],
+        batch_size: int = 8,
+    ) -> None:
+        """
+        Args:
+            nlp: Pipeline whose tokenizer is used; no components are run
+            taxonomy: Entries as returned by load_taxonomy
+            batch_size: Texts handed over per submit_many call by batching callers
+        """
+        from spacy.matcher import PhraseMatcher
+
+        self.nlp = nlp
+        self.batch_size = batch_size
+        self.calls = 0
+        self.skills = len(taxonomy)
+        self._lock = threading.Lock()  # guards ``calls``; scheduler threads match at once
+        self._insensitive = PhraseMatcher(nlp.vocab, attr="LOWER")
+        self._sensitive = PhraseMatcher(nlp.vocab, attr="ORTH")
+        for canonical, terms, case_sensitive in taxonomy:
+            matcher = self._sensitive if case_sensitive else self._insensitive
+            matcher.add(canonical, [nlp.make_doc(term) for term in terms])
+        logger.info("Loaded %d skills for offline enrichment", len(taxonomy))
+
+    @classmethod
+    def from_file(
+        cls, nlp: "Language", path: Union[str, Path], batch_size: int = 8
+    ) -> "TaxonomySkillModel":
+        return cls(nlp, load_taxonomy(path), batch_size)
+
+    def find_skills(self, text: str) -> Optional[List[str]]:
+        """Return the taxonomy skills mentioned anywhere in ``text``, in order of first mention."""
+        with self._lock:
+            self.calls += 1
+        doc = self.nlp.make_doc(text)
+        matches = self._insensitive(doc) + self._sensitive(doc)
+        skills = []
+        seen = set()
+        for match_id, start, _ in sorted(matches, key=lambda match: match[1]):
+            skill = self.nlp.vocab.strings[match_id]
+            if skill not in seen:
+                seen.add(skill)
+                skills.append(skill)
+        return skills
+
+    def find_skills_many(self, texts: Sequence[str]) -> List[Optional[List[str]]]:
+        return [self.find_skills(text) for text in texts]
+
+    def submit(self, text: str) -> EnrichmentRequest:
+        return self.submit_many([text])[0]
+
+    def submit_many(self, texts: Sequence[str]) -> List[EnrichmentRequest]:
+        """Match the texts right away and return already completed requests."""
+        future: "futures.Future[List[Optional[List[str]]]]" = futures.Future()
+        future.set_result(self.find_skills_many(texts))
+        return [EnrichmentRequest(self, future, position) for position in range(len(texts))]
+
+    def record_budget_miss(self) -> None:
+        """Requests are always complete, so there is nothing to count."""
+
+    def clear_cache(self) -> None:
+        """Nothing is cached; present for parity with EnrichmentClient."""
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"calls": self.calls, "skills": self.skills}
+
+def taxonomy_fingerprint(path: Union[str, Path]) -> str:
+    """Hash of the taxonomy file, so edits to it invalidate cached results."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()[:16]
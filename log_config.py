@@ -0,0 +1,79 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from typing import Optional, Union
+
+from config import LOG_FORMAT, LOG_LEVEL, LOG_QUEUE
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_configured_pid: Optional[int] = None
+_lock = threading.Lock()
+
+class JsonFormatter(logging.Formatter):
+    """Format each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+def configure_logging(
+    level: Union[int, str, None] = None,
+    fmt: Optional[str] = None,
+    use_queue: Optional[bool] = None,
+) -> None:
+    """Set up the root logger once per process.
+
+    Entry points (the web app, the command line and worker processes) call
+    this; library modules only create loggers. With ``use_queue`` the
+    calling thread only puts records on a queue and a background thread
+    formats and writes them, so slow log I/O doesn't hold up parsing.
+    Calling it again in the same process only changes the level; a forked
+    child, whose inherited queue has no listener, gets fresh handlers.
+
+    Args:
+        level: Root logging level; defaults to LOG_LEVEL
+        fmt: "text" or "json"; defaults to LOG_FORMAT
+        use_queue: Write records from a background thread; defaults to LOG_QUEUE
+    """
+    global _listener, _configured_pid
+
+    root = logging.getLogger()
+    with _lock:
+        if _configured_pid == os.getpid():
+            if level is not None:
+                root.setLevel(level.upper() if isinstance(level, str) else level)
+            return
+
+        level = LOG_LEVEL if level is None else level
+        fmt = fmt or LOG_FORMAT
+        use_queue = LOG_QUEUE if use_queue is None else use_queue
+
+        stream = logging.StreamHandler(sys.stderr)
+        stream.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+        handler: logging.Handler = stream
+        if use_queue:
+            records: queue.SimpleQueue = queue.SimpleQueue()
+            handler = logging.handlers.QueueHandler(records)
+            _listener = logging.handlers.QueueListener(records, stream)
+            _listener.start()
+            atexit.register(_listener.stop)  # flush what's queued on exit
+
+        for existing in root.handlers[:]:
+            root.removeHandler(existing)
+        root.addHandler(handler)
+        root.setLevel(level.upper() if isinstance(level, str) else level)
+        _configured_pid = os.getpid()
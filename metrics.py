@@ -0,0 +1,186 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Upper bounds (seconds) of the stage-duration histogram buckets
+STAGE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+def escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label(value)}"' for name, value in sorted(labels.items())) + "}"
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+class Counter:
+    """Monotonically increasing count, optionally split by labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str) -> None:
+        self.name = name
+        self.help = help
+        self._values: Dict[Tuple[Tuple[str, str], ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            return [(self.name, dict(key), value) for key, value in self._values.items()]
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets, optionally split by labels."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = STAGE_BUCKETS) -> None:
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[Tuple[str, str], ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            # Per-bucket counts, then sum and count
+            series = self._series.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        samples = []
+        with self._lock:
+            series_items = [(dict(key), list(series)) for key, series in self._series.items()]
+        for labels, series in series_items:
+            for bound, count in zip(self.buckets, series):
+                samples.append((f"{self.name}_bucket", dict(labels, le=format_value(bound)), count))
+            samples.append((f"{self.name}_bucket", dict(labels, le="+Inf"), series[-1]))
+            samples.append((f"{self.name}_sum", labels, series[-2]))
+            samples.append((f"{self.name}_count", labels, series[-1]))
+        return samples
+
+class Collector:
+    """Metric whose samples are read from the application when scraped, e.g. a queue depth."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        collect: Callable[[], Dict[Tuple[Tuple[str, str], ...], float]],
+        kind: str = "gauge",
+    ) -> None:
+        """
+        Args:
+            name: Metric name
+            help: Description shown in the exposition
+            collect: Returns the current value per label set
+                (``{(("label", "value"),): 1.0}``; ``{(): 1.0}`` when unlabeled)
+            kind: Prometheus metric type, ``gauge`` or ``counter``
+        """
+        self.name = name
+        self.help = help
+        self.collect = collect
+        self.kind = kind
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        return [(self.name, dict(key), value) for key, value in self.collect().items()]
+
+class Registry:
+    """Set of metrics rendered together in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+REGISTRY = Registry()
+
+stage_seconds = REGISTRY.register(Histogram(
+    "resume_parser_stage_seconds", "Time spent in each parsing stage, per resume or per request"
+))
+pages_total = REGISTRY.register(Counter(
+    "resume_parser_pages_total", "PDF pages read"
+))
+files_total = REGISTRY.register(Counter(
+    "resume_parser_files_total", "Resumes handled, by outcome (parsed, failed or cached)"
+))
+near_duplicates_total = REGISTRY.register(Counter(
+    "resume_parser_near_duplicates_total", "Near-duplicates of stored resumes, by action (reused or linked)"
+))
+
+class Trace:
+    """Timings and counts gathered while one resume is parsed.
+
+    Traces are plain picklable objects, so a worker process can hand its
+    trace back to the web process, which records it with ``record``.
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}
+        self.pages = 0
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def record(self) -> None:
+        """Add this trace to the process's metrics (for traces gathered elsewhere)."""
+        for stage, seconds in self.stages.items():
+            stage_seconds.observe(seconds, stage=stage)
+        if self.pages:
+            pages_total.inc(self.pages)
+
+    def to_dict(self) -> Dict:
+        """Timings in milliseconds and page count, for the debug response."""
+        return {
+            "stages_ms": {stage: round(seconds * 1000, 3) for stage, seconds in self.stages.items()},
+            "pages": self.pages,
+        }
+
+def record_stage(stage: str, seconds: float, trace: Optional[Trace] = None) -> None:
+    """Record time spent in a stage, in the metrics and, if given, ``trace``."""
+    stage_seconds.observe(seconds, stage=stage)
+    if trace is not None:
+        trace.add(stage, seconds)
+
+@contextmanager
+def timed(stage: str, trace: Optional[Trace] = None) -> Iterator[None]:
+    """Time the enclosed block as ``stage``; see record_stage."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - started, trace)
+
+def count_pages(pages: int, trace: Optional[Trace] = None) -> None:
+    """Count PDF pages read, in the metrics and, if given, ``trace``."""
+    pages_total.inc(pages)
+    if trace is not None:
+        trace.pages += pages
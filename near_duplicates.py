@@ -0,0 +1,72 @@
+import base64
+import re
+import zlib
+from hashlib import blake2b
+from typing import List, Optional
+
+import numpy as np
+
+# Words of the normalized text; punctuation, case and layout are ignored
+word_regex = re.compile(r"[a-z0-9]+")
+
+SHINGLE_SIZE = 3  # words per shingle
+PERMUTATIONS = 128  # hash functions, i.e. values in a signature
+# Signatures are split into BANDS bands of ROWS values for the LSH index.
+# Two resumes become candidates when any band matches, which happens with
+# probability 1 - (1 - J**ROWS)**BANDS for Jaccard similarity J: about 95%
+# at J = 0.8 and 6% at J = 0.5.
+BANDS = 16
+ROWS = PERMUTATIONS // BANDS
+
+_PRIME = (1 << 61) - 1
+_rng = np.random.RandomState(20240531)  # fixed, so signatures are comparable across processes and restarts
+_a = _rng.randint(1, 1 << 32, size=PERMUTATIONS, dtype=np.uint64)
+_b = _rng.randint(0, 1 << 32, size=PERMUTATIONS, dtype=np.uint64)
+
+def text_signature(text: str) -> Optional[np.ndarray]:
+    """MinHash signature of a resume's word shingles.
+
+    The share of values two signatures have in common estimates the
+    Jaccard similarity of the two texts' sets of shingles.
+
+    Args:
+        text: Extracted resume text
+
+    Returns:
+        PERMUTATIONS 32-bit values, or None if the text has no words
+    """
+    words = word_regex.findall(text.lower())
+    if not words:
+        return None
+    shingles = {
+        " ".join(words[start:start + SHINGLE_SIZE])
+        for start in range(max(1, len(words) - SHINGLE_SIZE + 1))
+    }
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode()) for shingle in shingles), dtype=np.uint64, count=len(shingles)
+    )
+    # a * h + b stays below 2**64 because a, b and h are all below 2**32
+    values = (hashes[:, None] * _a + _b) % np.uint64(_PRIME)
+    return (values.min(axis=0) & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+
+def similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures."""
+    return float(np.count_nonzero(first == second)) / PERMUTATIONS
+
+def band_keys(signature: np.ndarray) -> List[int]:
+    """LSH keys of a signature: one signed 64-bit hash per band, including the band's position."""
+    return [
+        int.from_bytes(
+            blake2b(bytes([band]) + signature[band * ROWS:(band + 1) * ROWS].tobytes(), digest_size=8).digest(),
+            "big",
+            signed=True,
+        )
+        for band in range(BANDS)
+    ]
+
+def encode_signature(signature: np.ndarray) -> str:
+    """Signature as text, to carry it in a JSON-serializable result."""
+    return base64.b64encode(signature.astype("<u4").tobytes()).decode("ascii")
+
+def decode_signature(encoded: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(encoded), dtype="<u4").astype(np.uint32)
@@ -0,0 +1,100 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+from metrics import Trace
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# This worker's own connection to the resume store for near-duplicate
+# lookups, opened by init_worker
+_find_duplicate: Optional[Callable] = None
+
+def init_worker() -> None:
+    """Load the spaCy model once when a worker process starts.
+
+    The model is loaded before the worker takes its first file, so every
+    resume it handles reuses it and none pays for the load.
+    """
+    global _find_duplicate
+    from config import NEAR_DUPLICATE_DETECTION, NEAR_DUPLICATE_THRESHOLD, RESUME_STORE_DB
+    from log_config import configure_logging
+
+    configure_logging()
+    import resume_parser
+
+    if RESUME_STORE_DB and NEAR_DUPLICATE_DETECTION:
+        from resume_store import ResumeStore
+
+        store = ResumeStore(
+            RESUME_STORE_DB, normalize=resume_parser.clean_skill, rules_version=resume_parser.RULES_VERSION
+        )
+        _find_duplicate = partial(store.find_near_duplicate, threshold=NEAR_DUPLICATE_THRESHOLD)
+    try:
+        resume_parser.warmup()
+    except resume_parser.ResumeParserError:
+        # Keep the worker alive; each parse reports the failure instead
+        return
+    logger.info("Parser worker ready with model: %s", resume_parser.SPACY_MODEL)
+
+def parse_resume_bytes(data: bytes, engine: Optional[str] = None) -> Tuple[Dict, Trace, List[str]]:
+    """Parse a resume from the raw bytes of a PDF inside a worker process.
+
+    Metrics recorded in a worker stay in that process, so the stage
+    timings are returned for the web process to record. Near-duplicates
+    are looked up in the resume store when it is enabled.
+
+    Args:
+        data: Contents of the PDF file
+        engine: Text-extraction engine; defaults to PDF_TEXT_ENGINE
+
+    Returns:
+        The parsed resume data, the Trace of its parse and the text of
+        each page read
+
+    Raises:
+        ResumeParserError: If parsing fails
+    """
+    from resume_parser import parse_resume
+
+    trace = Trace()
+    page_texts: List[str] = []
+    return parse_resume(data, engine, trace, _find_duplicate, page_texts), trace, page_texts
+
+def get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use.
+
+    Workers are started with the ``spawn`` method so they never inherit
+    locks held by the web server's threads, and each one loads the model
+    in ``init_worker``.
+
+    Args:
+        max_workers: Number of worker processes
+
+    Returns:
+        The process pool shared by all requests
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+            )
+            logger.info("Started parser process pool with %d workers", max_workers)
+        return _pool
+
+def shutdown_process_pool() -> None:
+    """Stop the shared process pool if it was started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
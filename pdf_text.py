@@ -0,0 +1,159 @@
+import io
+import logging
+import threading
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, Union
+
+import pdfplumber
+import pypdfium2 as pdfium
+
+logger = logging.getLogger(__name__)
+
+# Anything a PDF can be read from: a path, the raw bytes, or a binary file object
+# (e.g. BytesIO, or the SpooledTemporaryFile behind a Werkzeug upload)
+PdfSource = Union[str, Path, bytes, BinaryIO]
+
+# A text-extraction engine yields the text of each page in order
+PageExtractor = Callable[[PdfSource], Iterator[str]]
+
+# PDFium is not thread-safe, so all calls into it are serialized
+_pdfium_lock = threading.Lock()
+
+def rewind(source: PdfSource) -> PdfSource:
+    """Return ``source`` ready to be read from the start.
+
+    Raw bytes are wrapped in a BytesIO and file objects are seeked back to
+    the beginning, so the same source can be handed to several engines.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+def iter_pdfplumber_pages(source: PdfSource) -> Iterator[str]:
+    """Yield page texts using pdfplumber's layout analysis (slow, robust)."""
+    with pdfplumber.open(rewind(source)) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text() or ""
+
+def iter_pdfium_pages(source: PdfSource) -> Iterator[str]:
+    """Yield page texts using PDFium's native text extraction (fast)."""
+    source = rewind(source)
+    if hasattr(source, "read"):
+        source = source.read()
+    elif isinstance(source, Path):
+        source = str(source)
+
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(source)
+    try:
+        for index in range(len(pdf)):
+            with _pdfium_lock:
+                page = pdf[index]
+                textpage = page.get_textpage()
+                text = textpage.get_text_bounded()
+                textpage.close()
+                page.close()
+            yield text.replace("\r\n", "\n")
+    finally:
+        with _pdfium_lock:
+            pdf.close()
+
+# Registered engines by name; "auto" is resolved by iter_pages
+EXTRACTORS: Dict[str, PageExtractor] = {
+    "pdfium": iter_pdfium_pages,
+    "pdfplumber": iter_pdfplumber_pages,
+}
+
+def register_extractor(name: str, extractor: PageExtractor) -> None:
+    """Make an additional text-extraction engine selectable by name."""
+    EXTRACTORS[name] = extractor
+
+def available_engines() -> List[str]:
+    """Engine names accepted by iter_pages, including ``auto``."""
+    return ["auto", *EXTRACTORS]
+
+def is_degenerate(pages: List[str], min_chars_per_page: int) -> bool:
+    """Whether extracted text looks too thin to be trusted (e.g. empty or garbled)."""
+    if not pages:
+        return True
+    chars = sum(len(page.strip()) for page in pages)
+    return chars < min_chars_per_page * len(pages)
+
+def iter_pages(
+    source: PdfSource,
+    engine: str = "auto",
+    min_chars_per_page: int = 20,
+) -> Iterator[str]:
+    """Lazily yield the text of each page of a PDF.
+
+    Pages are only extracted when the consumer asks for them, so a caller
+    that stops early (or closes the generator) never pays for the rest.
+
+    Args:
+        source: Path to the PDF file, its raw bytes, or a binary file object
+        engine: Name of a registered engine, or ``auto`` to use PDFium,
+            reading each page whose PDFium text looks degenerate with
+            pdfplumber too, and the rest of the document with pdfplumber
+            if PDFium fails
+        min_chars_per_page: Characters on a page below which ``auto``
+            tries pdfplumber for that page
+
+    Yields:
+        Text of each page, in order
+
+    Raises:
+        ValueError: If ``engine`` is not registered
+    """
+    if engine != "auto":
+        if engine not in EXTRACTORS:
+            raise ValueError(
+                f"Unknown PDF text engine '{engine}'. Available: {', '.join(available_engines())}"
+            )
+        yield from EXTRACTORS[engine](source)
+        return
+
+    pages = iter_pdfium_pages(source)
+    plumber = None  # opened on the first page PDFium can't read well
+    index = 0
+    try:
+        while True:
+            try:
+                text = next(pages, None)
+            except Exception as e:
+                logger.warning(
+                    "PDFium failed on page %d, reading the rest with pdfplumber: %s", index + 1, e
+                )
+                break
+            if text is None:
+                return
+            if is_degenerate([text], min_chars_per_page):
+                # A scanned or cover page needn't mean the whole document
+                # is unreadable, so only this page is read again
+                if plumber is None:
+                    plumber = pdfplumber.open(rewind(source))
+                if index < len(plumber.pages):
+                    fallback = plumber.pages[index].extract_text() or ""
+                    if len(fallback.strip()) > len(text.strip()):
+                        logger.debug("PDFium output of page %d looks degenerate, using pdfplumber", index + 1)
+                        text = fallback
+            yield text
+            index += 1
+            
+        if plumber is None:
+            plumber = pdfplumber.open(rewind(source))
+        for page in plumber.pages[index:]:
+            yield page.extract_text() or ""
+    finally:
+        pages.close()
+        if plumber is not None:
+            plumber.close()
+
+def extract_pages(
+    source: PdfSource,
+    engine: str = "auto",
+    min_chars_per_page: int = 20,
+) -> List[str]:
+    """Extract the text of every page of a PDF; see iter_pages for the arguments."""
+    return list(iter_pages(source, engine, min_chars_per_page))
@@ -0,0 +1,270 @@
+import math
+import re
+import threading
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Words of a work description; keeps tech tokens like "c++", "c#" and "node.js"
+token_regex = re.compile(r"[a-z][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+# Function words and resume boilerplate that carry no signal for matching
+STOP_WORDS = frozenset("""
+a about above after again all also am an and any are as at be been before being
+below between both but by can could did do does doing down during each few for
+from further had has have having he her here hers him his how i if in into is it
+its itself just me more most my no nor not now of off on once only or other our
+ours out over own same she should so some such than that the their theirs them
+then there these they this those through to too under until up very was we were
+what when where which while who whom why will with would you your yours
+present current responsible including various using used work worked working
+""".split())
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words of ``text`` without stop words."""
+    return [token for token in token_regex.findall(text.lower()) if token not in STOP_WORDS]
+
+class SparsePostings:
+    """Sparse matrix of row vectors, stored as one posting list per term.
+
+    Rows are weighted "lnc" (log term frequency, cosine-normalized), so a
+    row's weights never change once added and rows can be appended one
+    at a time. Posting lists are Python lists, appended in O(1), and are
+    mirrored in NumPy arrays that are extended with the new entries the
+    first time they are scored after a change. Scoring a query therefore
+    touches only its own terms' postings.
+
+    A hidden row keeps its postings (and still gets scores) until
+    ``compact`` drops them, but no longer counts in ``rows`` or in the
+    document frequencies the idf is computed from.
+    """
+
+    def __init__(self) -> None:
+        self.rows = 0  # rows not hidden
+        self.size = 0  # rows, hidden ones included, i.e. the length of a score vector
+        self._rows: Dict[str, List[int]] = {}
+        self._weights: Dict[str, List[float]] = {}
+        self._arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._row_terms: List[Optional[Tuple[str, ...]]] = []  # None once hidden
+        self._frequency: Counter = Counter()
+
+    def add_row(self, counts: Dict[str, int]) -> int:
+        """Append a row from term counts and return its index."""
+        row = self.size
+        self.size += 1
+        self.rows += 1
+        weights = {term: 1 + math.log(count) for term, count in counts.items() if count > 0}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        for term, weight in weights.items():
+            self._rows.setdefault(term, []).append(row)
+            self._weights.setdefault(term, []).append(weight / norm)
+        self._row_terms.append(tuple(weights))
+        self._frequency.update(weights.keys())
+        return row
+
+    def hide_row(self, row: int) -> None:
+        """Stop counting a row in ``rows`` and the document frequencies."""
+        terms = self._row_terms[row]
+        if terms is None:
+            return
+        self._row_terms[row] = None
+        self.rows -= 1
+        self._frequency.subtract(terms)
+
+    def compact(self) -> List[int]:
+        """Drop the postings of hidden rows and renumber the others in order.
+
+        Returns:
+            The earlier index of each remaining row
+        """
+        keep = [row for row, terms in enumerate(self._row_terms) if terms is not None]
+        index = {old: new for new, old in enumerate(keep)}
+        for term in list(self._rows):
+            pairs = [
+                (index[row], weight)
+                for row, weight in zip(self._rows[term], self._weights[term])
+                if row in index
+            ]
+            if pairs:
+                self._rows[term] = [row for row, _ in pairs]
+                self._weights[term] = [weight for _, weight in pairs]
+            else:
+                del self._rows[term], self._weights[term]
+                del self._frequency[term]
+        self._row_terms = [self._row_terms[old] for old in keep]
+        self._arrays.clear()
+        self.size = len(keep)
+        return keep
+
+    def document_frequency(self, term: str) -> int:
+        """Number of rows, not counting hidden ones, that contain ``term``."""
+        return self._frequency.get(term, 0)
+
+    def _postings(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        rows = self._rows[term]
+        arrays = self._arrays.get(term)
+        if arrays is None or len(arrays[0]) < len(rows):
+            # Only the entries appended since the last conversion are new
+            done = 0 if arrays is None else len(arrays[0])
+            new_rows = np.array(rows[done:], dtype=np.int64)
+            new_weights = np.array(self._weights[term][done:], dtype=np.float64)
+            arrays = (new_rows, new_weights) if arrays is None else (
+                np.concatenate((arrays[0], new_rows)),
+                np.concatenate((arrays[1], new_weights)),
+            )
+            self._arrays[term] = arrays
+        return arrays
+
+    def score(self, counts: Dict[str, int]) -> np.ndarray:
+        """Cosine similarity of a query with every row.
+
+        The query is weighted "ltc" (log term frequency times smoothed
+        idf, cosine-normalized), so together with the rows' "lnc" weights
+        this is the classic lnc.ltc TF-IDF ranking.
+
+        Args:
+            counts: Term counts of the query
+
+        Returns:
+            One score per row (``size`` in all), between 0 and 1
+        """
+        weights = {}
+        for term, count in counts.items():
+            frequency = self.document_frequency(term)
+            if count > 0 and frequency:
+                idf = math.log((1 + self.rows) / (1 + frequency)) + 1
+                weights[term] = (1 + math.log(count)) * idf
+        if not weights:
+            return np.zeros(self.size)
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        rows = []
+        values = []
+        for term, weight in weights.items():
+            term_rows, term_weights = self._postings(term)
+            rows.append(term_rows)
+            values.append(term_weights * (weight / norm))
+        return np.bincount(np.concatenate(rows), np.concatenate(values), minlength=self.size)
+
+class ResumeRanker:
+    """Ranks resumes against a job description by skills and experience.
+
+    Each resume is a row of two sparse matrices: its normalized skills,
+    and the words of its work experience descriptions. A job is scored
+    against every row at once, as a weighted sum of the two cosine
+    similarities. Adding a resume appends a row; adding one that is
+    already present hides its old row, so the matrices are updated
+    incrementally. Once hidden rows make up ``compact_ratio`` of all rows,
+    they are dropped from both matrices.
+    """
+
+    def __init__(
+        self, normalize: Callable[[str], str], skill_weight: float = 0.7, compact_ratio: float = 0.25
+    ) -> None:
+        """
+        Args:
+            normalize: Maps a skill name to the form resumes and jobs are
+                compared in
+            skill_weight: Share of the score from skill overlap; the rest
+                comes from work experience text similarity
+            compact_ratio: Share of hidden rows at which the matrices are
+                compacted
+        """
+        self.normalize = normalize
+        self.skill_weight = skill_weight
+        self.compact_ratio = compact_ratio
+        self._skills = SparsePostings()
+        self._text = SparsePostings()
+        self._resume_ids: List[int] = []
+        self._row_skills: List[Tuple[str, ...]] = []
+        self._rows: Dict[int, int] = {}
+        self._alive = bytearray()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, resume_id: int) -> bool:
+        return resume_id in self._rows
+
+    def skill_terms(self, skills: Iterable[str]) -> Tuple[str, ...]:
+        return tuple(sorted({self.normalize(skill) for skill in skills if skill and skill.strip()} - {""}))
+
+    def add(self, resume_id: int, result: Dict) -> None:
+        """Add a parsed resume, replacing any earlier version with the same id."""
+        skills = self.skill_terms(result.get("skills", []))
+        words = Counter(tokenize(" ".join(
+            entry.get("description", "") for entry in result.get("work_experience", [])
+        )))
+        with self._lock:
+            previous = self._rows.get(resume_id)
+            if previous is not None:
+                self._alive[previous] = 0
+                self._skills.hide_row(previous)
+                self._text.hide_row(previous)
+            row = self._skills.add_row(dict.fromkeys(skills, 1))
+            self._text.add_row(words)
+            self._resume_ids.append(resume_id)
+            self._row_skills.append(skills)
+            self._alive.append(1)
+            self._rows[resume_id] = row
+            if len(self._alive) - len(self._rows) > self.compact_ratio * len(self._alive):
+                self._compact()
+
+    def _compact(self) -> None:
+        keep = self._skills.compact()
+        self._text.compact()
+        self._resume_ids = [self._resume_ids[old] for old in keep]
+        self._row_skills = [self._row_skills[old] for old in keep]
+        self._alive = bytearray(b"\x01" * len(keep))
+        self._rows = {resume_id: row for row, resume_id in enumerate(self._resume_ids)}
+
+    def rank(
+        self,
+        skills: Iterable[str],
+        text: str,
+        top_k: int = 10,
+        resume_ids: Optional[Iterable[int]] = None,
+    ) -> List[Dict]:
+        """Return the resumes that best match a job.
+
+        Args:
+            skills: Skills the job asks for
+            text: Job description, compared with work experience
+            top_k: Number of resumes to return
+            resume_ids: Only rank these resumes (e.g. those just uploaded)
+
+        Returns:
+            Up to ``top_k`` dicts with ``resume_id``, ``score``,
+            ``skill_score``, ``text_score`` and ``matched_skills``, best
+            first; resumes scoring 0 are left out
+        """
+        job_skills = self.skill_terms(skills)
+        words = Counter(tokenize(text))
+        with self._lock:
+            skill_scores = self._skills.score(dict.fromkeys(job_skills, 1))
+            text_scores = self._text.score(words)
+            scores = self.skill_weight * skill_scores + (1 - self.skill_weight) * text_scores
+            eligible = np.frombuffer(bytes(self._alive), dtype=np.uint8).astype(bool)
+            if resume_ids is not None:
+                wanted = np.zeros(len(eligible), dtype=bool)
+                wanted[[self._rows[resume_id] for resume_id in resume_ids if resume_id in self._rows]] = True
+                eligible &= wanted
+            scores[~eligible] = 0.0
+
+            k = min(top_k, int(np.count_nonzero(scores)))
+            if k <= 0:
+                return []
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best], kind="stable")]
+            wanted_skills = set(job_skills)
+            return [
+                {
+                    "resume_id": self._resume_ids[row],
+                    "score": round(float(scores[row]), 4),
+                    "skill_score": round(float(skill_scores[row]), 4),
+                    "text_score": round(float(text_scores[row]), 4),
+                    "matched_skills": [skill for skill in self._row_skills[row] if skill in wanted_skills],
+                }
+                for row in best
+            ]
@@ -0,0 +1,164 @@
+"""Rebuild stored resumes under the current parsing rules from their stored text.
+
+Changing SKILL_MAPPING, SKILL_PATTERNS, the section headers or the other
+text patterns changes TEXT_RULES_VERSION. Instead of uploading every PDF
+again, this re-runs the text-level stages (contact details, sections,
+skills and summary, see resume_parser.rebuild_resume) on the text the
+resume store kept when each PDF was first parsed, on several processes.
+Only resumes parsed under other text rules are rebuilt, so an
+interrupted run picks up where it stopped. Resumes parsed under another
+EXTRACTION_RULES_VERSION (PDF reading budget, spaCy model or AI
+enrichment) are left alone and counted as outdated: the stored text,
+name and AI skills a rebuild reuses came from those rules, so only
+uploading their PDFs again brings them up to date.
+
+    python reprocess.py --workers 4
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent import futures
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from config import RESUME_STORE_DB
+from log_config import configure_logging
+from near_duplicates import encode_signature, text_signature
+from resume_parser import RULES_VERSION, ResumeParserError, clean_skill, join_pages, rebuild_resume
+from resume_store import ResumeStore
+
+logger = logging.getLogger(__name__)
+
+def rebuild_batch(
+    rows: List[Tuple[str, str, Dict, List[str]]]
+) -> List[Tuple[str, str, Union[Dict, ResumeParserError], List[str]]]:
+    """Rebuild a batch of stored resumes; runs in a worker process.
+
+    Args:
+        rows: ``(content_key, filename, result, page_texts)`` as read by
+            ResumeStore.iter_stale
+
+    Returns:
+        ``(content_key, filename, outcome, page_texts)`` per row, where
+        ``outcome`` is the rebuilt result (with a fresh ``minhash``
+        signature) or the error raised
+    """
+    rebuilt = []
+    for content_key, filename, previous, page_texts in rows:
+        text = join_pages(page_texts)
+        try:
+            outcome = rebuild_resume(text, previous)
+        except ResumeParserError as e:
+            outcome = e
+        else:
+            signature = text_signature(text)
+            if signature is not None:
+                outcome["minhash"] = encode_signature(signature)
+        rebuilt.append((content_key, filename, outcome, page_texts))
+    return rebuilt
+
+def reprocess_store(
+    store: ResumeStore,
+    workers: int = 1,
+    batch_size: int = 100,
+    mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    progress: Optional[Callable[[Dict[str, int]], None]] = None,
+) -> Dict[str, int]:
+    """Rebuild every stale resume in ``store`` and store the new results.
+
+    Batches are rebuilt on ``workers`` processes, with at most two
+    batches per worker in flight, and written back by this process.
+
+    Args:
+        store: Resume store whose ``rules_version`` is the current one
+        workers: Worker processes (1 rebuilds in this process)
+        batch_size: Resumes read from the store and sent to a worker at once
+        mp_context: Start method of the workers; the platform default if omitted
+        progress: Called with the running counts after each batch
+
+    Returns:
+        Counts of ``reprocessed`` and ``failed`` resumes
+    """
+    stats = {"reprocessed": 0, "failed": 0}
+
+    def save(rebuilt: List[Tuple[str, str, Union[Dict, ResumeParserError], List[str]]]) -> None:
+        for content_key, filename, outcome, page_texts in rebuilt:
+            if isinstance(outcome, Exception):
+                stats["failed"] += 1
+                logger.error("Failed to reprocess %s: %s", filename, outcome)
+                continue
+            store.add(content_key, filename, outcome, page_texts)
+            stats["reprocessed"] += 1
+        if progress is not None:
+            progress(dict(stats))
+
+    if workers <= 1:
+        for batch in store.iter_stale(batch_size):
+            save(rebuild_batch(batch))
+        return stats
+
+    with futures.ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+        in_flight = set()
+        for batch in store.iter_stale(batch_size):
+            in_flight.add(executor.submit(rebuild_batch, batch))
+            if len(in_flight) < workers * 2:
+                continue
+            finished, in_flight = futures.wait(in_flight, return_when=futures.FIRST_COMPLETED)
+            for future in finished:
+                save(future.result())
+        for future in futures.as_completed(in_flight):
+            save(future.result())
+    return stats
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Reprocess the resume store from the command line.
+
+    Returns:
+        Exit status: 0 if every resume was rebuilt, 1 if any failed
+    """
+    parser = argparse.ArgumentParser(
+        prog="python reprocess.py",
+        description="Rebuild stored resumes under the current parsing rules.",
+    )
+    parser.add_argument("--db", default=RESUME_STORE_DB, help="resume store (default: RESUME_STORE_DB)")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=os.cpu_count() or 1,
+        help="worker processes (default: number of CPUs)",
+    )
+    parser.add_argument("--batch-size", type=int, default=100, help="resumes per worker task")
+    parser.add_argument("--log-level", default="WARNING", help="logging level (default: WARNING)")
+    args = parser.parse_args(argv)
+    configure_logging(args.log_level)
+    if not args.db:
+        parser.error("no resume store: RESUME_STORE_DB is empty and --db wasn't given")
+
+    store = ResumeStore(args.db, normalize=clean_skill, rules_version=RULES_VERSION)
+    print(
+        f"{store.count_stale()} of {store.count()} stored resumes to rebuild "
+        f"under rules {RULES_VERSION}",
+        file=sys.stderr,
+    )
+    outdated = store.count_outdated()
+    if outdated:
+        print(
+            f"{outdated} stored resumes were parsed with another PDF reading budget, "
+            "spaCy model or AI enrichment; upload their PDFs again to update them",
+            file=sys.stderr,
+        )
+    start = time.perf_counter()
+    stats = reprocess_store(store, args.workers, args.batch_size)
+    elapsed = time.perf_counter() - start
+
+    done = stats["reprocessed"] + stats["failed"]
+    rate = done / elapsed if elapsed else 0.0
+    print(
+        f"Reprocessed {stats['reprocessed']} resumes, {stats['failed']} failed "
+        f"in {elapsed:.1f}s ({rate:.1f} resumes/s)",
+        file=sys.stderr,
+    )
+    return 1 if stats["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+def content_digest(data: bytes) -> str:
+    """SHA-256 of a file's contents, which identifies it across uploads."""
+    return hashlib.sha256(data).hexdigest()
+
+class ResultCache:
+    """Cache of parsed resumes keyed by the SHA-256 of the PDF bytes.
+
+    Entries live in a bounded in-memory LRU and, when ``db_path`` is set, in a
+    SQLite table that survives restarts and is shared between processes. Keys
+    include ``version``, so results produced under different parser rules
+    never collide; stale rows are purged when the cache is opened.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        max_entries: int = 1024,
+        db_path: Optional[Union[str, Path]] = None,
+    ) -> None:
+        self.version = version
+        self.max_entries = max_entries
+        self.db_path = Path(db_path) if db_path else None
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if self.db_path:
+            self._open_db()
+
+    def _open_db(self) -> None:
+        """Open the SQLite tier and drop rows written under other versions."""
+        self.db_path.parent.mkdir(exist_ok=True, parents=True)
+        self._db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, version TEXT NOT NULL, "
+            "result TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        purged = self._db.execute(
+            "DELETE FROM results WHERE version != ?", (self.version,)
+        ).rowcount
+        self._db.commit()
+        if purged:
+            logger.info("Purged %d cached results from older parser versions", purged)
+
+    def after_fork(self) -> None:
+        """Give a forked child process its own lock and SQLite connection.
+
+        SQLite connections must not be used across a fork, so servers that
+        fork workers after creating the cache call this in each worker.
+        """
+        self._lock = threading.Lock()
+        if self.db_path:
+            self._open_db()
+
+    def make_key(self, data: bytes, variant: str = "") -> str:
+        """Build the cache key for the raw bytes of a PDF file.
+
+        Args:
+            data: Contents of the PDF file
+            variant: Extra discriminator for options that change the result,
+                such as the text-extraction engine
+        """
+        return self.key_for_digest(content_digest(data), variant)
+
+    def key_for_digest(self, digest: str, variant: str = "") -> str:
+        """Build the cache key from a file's content_digest, see make_key."""
+        return f"{self.version}:{variant}:{digest}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a copy of the cached result for ``key``, or None on a miss."""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT result FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    payload = row[0]
+                    self.disk_hits += 1
+                    self._remember(key, payload)
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(payload)
+
+    def put(self, key: str, result: Dict) -> None:
+        """Store a parsed result under ``key`` in every tier."""
+        payload = json.dumps(result)
+        with self._lock:
+            self._remember(key, payload)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (key, version, result, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, self.version, payload, time.time()),
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, payload: str) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry when full."""
+        self._entries[key] = payload
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Invalidate every cached result, e.g. after editing the skill rules."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current in-memory size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "entries": len(self._entries),
+            }
@@ -1,41 +1,138 @@
+import argparse
+import glob
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
 import re
+import sys
+import threading
+import time
+from concurrent import futures
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-
-import pdfplumber
-import requests
-import spacy
-from spacy.language import Language
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from config import (
     EMAIL_PATTERN,
     EDUCATION_PATTERN,
-    HF_API_TOKEN,
+    HF_API_BATCH_SIZE,
+    HF_API_BUDGET,
+    HF_API_INPUT_CHARS,
+    HF_API_POOL_SIZE,
     HF_API_TIMEOUT,
+    HF_API_TOKEN,
+    HF_API_URL,
+    HF_BREAKER_COOLDOWN,
+    HF_BREAKER_THRESHOLD,
+    HF_CACHE_SIZE,
+    NEAR_DUPLICATE_REUSE,
+    PARSER_VERSION,
+    PDF_EARLY_EXIT,
+    PDF_MAX_CHARS,
+    PDF_MAX_PAGES,
+    PDF_MIN_CHARS_PER_PAGE,
+    PDF_TEXT_ENGINE,
     PHONE_PATTERN,
+    SECTION_HEADER_MAX_WORDS,
     SKILLS_NOISE_PATTERN,
     SKILLS_PATTERN,
+    SPACY_BATCH_SIZE,
     SPACY_MODEL,
+    SPACY_N_PROCESS,
+    SPACY_NER_EXCLUDE,
+    SPACY_NER_MAX_CHARS,
+    SPACY_NER_MAX_LINES,
+    SPACY_PIPELINE_MODE,
     WORK_DATE_PATTERN,
     WORK_TITLE_PATTERN,
+    SKILL_ENRICHMENT_BACKEND,
     SKILL_MAPPING,
+    SKILL_TAXONOMY_FILE,
 )
+from ai_client import CircuitBreaker, EnrichmentClient, EnrichmentRequest
+from metrics import Trace, count_pages, record_stage, timed
+from local_skills import TaxonomySkillModel, taxonomy_fingerprint
+from log_config import configure_logging
+from near_duplicates import encode_signature, text_signature
+from pdf_text import PdfSource, iter_pages
+from sections import HEADER_SECTIONS, classify_header, segment_sections
+from skill_matcher import SkillMatcher
+
+if TYPE_CHECKING:
+    import numpy as np
+    # spaCy is imported when the model is first loaded, not with this module
+    from spacy.language import Language
+    from spacy.tokens import Doc
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-# Initialize spaCy model (cached)
-try:
-    nlp: Language = spacy.load(SPACY_MODEL)
-    logger.info(f"Loaded spaCy model: {SPACY_MODEL}")
-except Exception as e:
-    logger.error(f"Failed to load spaCy model: {e}")
-    raise
+def load_pipeline(mode: str = SPACY_PIPELINE_MODE) -> Optional["Language"]:
+    """Load the spaCy pipeline used for name detection.
+    
+    Args:
+        mode: "full" loads every component of SPACY_MODEL, "ner" loads only
+            the entity recognizer (excluding SPACY_NER_EXCLUDE), and "rules"
+            loads nothing and detects names with detect_name_by_rules
+        
+    Returns:
+        The loaded pipeline, or None in "rules" mode
+    """
+    if mode == "rules":
+        return None
+    import spacy
+    
+    if mode == "full":
+        return spacy.load(SPACY_MODEL)
+    
+    pipeline = spacy.load(SPACY_MODEL, exclude=list(SPACY_NER_EXCLUDE))
+    try:
+        # Models whose NER listens to a shared tok2vec can't run without it
+        pipeline("Jane Doe")
+    except Exception as e:
+        logger.warning("NER-only pipeline failed (%s); keeping tok2vec loaded", e)
+        pipeline = spacy.load(
+            SPACY_MODEL,
+            disable=[name for name in SPACY_NER_EXCLUDE if name != "tok2vec"],
+        )
+    return pipeline
+
+# The spaCy pipeline and the enrichment backend are created on first use
+# (or by warmup), so importing this module is cheap and a missing model
+# only fails the parses that need it
+_nlp: Optional["Language"] = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
+
+def get_nlp() -> Optional["Language"]:
+    """Return the spaCy pipeline, loading it on first use.
+    
+    Safe to call from several threads: the first caller loads the model
+    while the others wait for it. A failed load is retried on the next call.
+    
+    Returns:
+        The pipeline, or None in "rules" mode
+        
+    Raises:
+        ResumeParserError: If the model can't be loaded
+    """
+    global _nlp, _nlp_loaded
+    if not _nlp_loaded:
+        with _nlp_lock:
+            if not _nlp_loaded:
+                try:
+                    _nlp = load_pipeline()
+                except Exception as e:
+                    logger.error("Failed to load spaCy model: %s", e)
+                    raise ResumeParserError(f"Failed to load spaCy model {SPACY_MODEL}: {e}")
+                if _nlp is None:
+                    logger.info("Using rule-based name detection; no spaCy model loaded")
+                else:
+                    logger.info("Loaded spaCy model: %s with components %s", SPACY_MODEL, _nlp.pipe_names)
+                _nlp_loaded = True
+    return _nlp
 
 # Precompiled regex patterns for performance
 email_regex = re.compile(EMAIL_PATTERN)
@@ -45,11 +142,18 @@ work_title_regex = re.compile(WORK_TITLE_PATTERN, re.IGNORECASE)
 work_date_regex = re.compile(WORK_DATE_PATTERN, re.IGNORECASE)
 skills_regex = re.compile(SKILLS_PATTERN)
 skills_noise_regex = re.compile(SKILLS_NOISE_PATTERN, re.IGNORECASE)
+whitespace_regex = re.compile(r'\s+')
+skill_separator_regex = re.compile(r'[,•⚫·⦁▪▫●○⚪-]|\band\b')
+name_line_regex = re.compile(r"^[A-Z][A-Za-z'.\-]+(?:\s+[A-Z][A-Za-z'.\-]+){1,3}$")
+separator_regex = re.compile(r'[-_]')
 
-# ATS-optimized skill patterns
+# ATS-optimized skill patterns. SkillMatcher tries every pattern at each
+# word start, so overlapping skills ("AWS Certified" and "AWS") are all
+# found and the order of the patterns doesn't matter
 SKILL_PATTERNS = [
-    # Programming Languages with versions
-    r'\b(?:Python|Java|JavaScript|TypeScript|C\+\+|C#|Ruby|PHP|Swift|Kotlin|Go|Rust|Scala|R|MATLAB)(?:\s+\d+(?:\.\d+)*)?',
+    # Programming Languages with versions (whole words only, so "R" and "Go"
+    # don't swallow the start of "Redis" or "Google")
+    r'\b(?:Python|Java|JavaScript|TypeScript|C\+\+|C#|Ruby|PHP|Swift|Kotlin|Go|Rust|Scala|R|MATLAB)(?!\w)(?:\s+\d+(?:\.\d+)*)?',
     
     # Frameworks and Libraries
     r'\b(?:React(?:\.js)?|Angular(?:JS)?|Vue(?:\.js)?|Node(?:\.js)?|Express(?:\.js)?|Django|Flask|Spring|Laravel|TensorFlow|PyTorch|Pandas|NumPy|Scikit[-\s]learn)',
@@ -98,11 +202,138 @@ class ResumeParserError(Exception):
     """Base exception for resume parser errors."""
     pass
 
-def extract_text_from_pdf(file_path: Union[str, Path]) -> str:
+def fingerprint(rules: Dict) -> str:
+    """Short hash of a JSON-serializable description of parser rules."""
+    payload = json.dumps(rules, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+def compute_text_rules_version() -> str:
+    """Fingerprint the rules that rebuild_resume applies to stored text.
+    
+    Returns:
+        Short hash that changes whenever the parser version, the skill
+        mapping, any pattern or section header changes
+    """
+    return fingerprint({
+        "parser_version": PARSER_VERSION,
+        "skill_mapping": SKILL_MAPPING,
+        "skill_patterns": SKILL_PATTERNS,
+        "patterns": [
+            EMAIL_PATTERN,
+            PHONE_PATTERN,
+            EDUCATION_PATTERN,
+            WORK_TITLE_PATTERN,
+            WORK_DATE_PATTERN,
+            SKILLS_PATTERN,
+            SKILLS_NOISE_PATTERN,
+        ],
+        "section_headers": [HEADER_SECTIONS, SECTION_HEADER_MAX_WORDS],
+    })
+
+def compute_extraction_rules_version() -> str:
+    """Fingerprint the rules behind what rebuild_resume reuses.
+    
+    Returns:
+        Short hash that changes whenever the PDF reading budget (the
+        stored text), the spaCy model or pipeline (the name) or AI
+        enrichment (the AI skills) changes
+        
+    Raises:
+        ResumeParserError: If offline enrichment is configured and its
+            taxonomy file can't be read
+    """
+    if SKILL_ENRICHMENT_BACKEND == "local":
+        try:
+            taxonomy = taxonomy_fingerprint(SKILL_TAXONOMY_FILE)
+        except OSError as e:
+            raise ResumeParserError(
+                f"Cannot read the skills taxonomy {SKILL_TAXONOMY_FILE} "
+                f"(SKILL_ENRICHMENT_BACKEND=local): {str(e)}"
+            )
+    return fingerprint({
+        "spacy_model": SPACY_MODEL,
+        "spacy_pipeline": [SPACY_PIPELINE_MODE, SPACY_NER_MAX_LINES, SPACY_NER_MAX_CHARS],
+        "ai_enabled": bool(HF_API_TOKEN) or SKILL_ENRICHMENT_BACKEND == "local",
+        "ai_backend": (
+            ["local", taxonomy]
+            if SKILL_ENRICHMENT_BACKEND == "local"
+            else [HF_API_URL, HF_API_INPUT_CHARS] if HF_API_TOKEN else None
+        ),
+        "pdf_budget": [PDF_MAX_PAGES, PDF_MAX_CHARS, PDF_EARLY_EXIT],
+    })
+
+TEXT_RULES_VERSION = compute_text_rules_version()
+EXTRACTION_RULES_VERSION = compute_extraction_rules_version()
+# Versions results for caching; a stored result whose extraction part is
+# current can be brought up to date by reprocess.py
+RULES_VERSION = f"{TEXT_RULES_VERSION}.{EXTRACTION_RULES_VERSION}"
+
+# Sections that must be complete before the rest of a PDF can be skipped
+KEY_SECTIONS = frozenset({"skills", "work_experience", "education"})
+
+class KeySectionTracker:
+    """Watch page texts go by and report when the key resume content is complete.
+    
+    Contact details must have been seen, and the headers of every key
+    section must have appeared followed by one more header, which closes
+    the last key section.
+    """
+    
+    def __init__(self) -> None:
+        self.has_contact = False
+        self.seen: set = set()
+        self.complete = False
+    
+    def feed(self, page: str) -> bool:
+        """Consume one page of text; return True once the key content is complete."""
+        if not self.has_contact:
+            self.has_contact = bool(email_regex.search(page) or phone_regex.search(page))
+        for line in page.split("\n"):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            header = classify_header(stripped)
+            if header is None:
+                continue
+            if KEY_SECTIONS <= self.seen and header not in KEY_SECTIONS:
+                self.complete = True
+            self.seen.add(header)
+        return self.complete and self.has_contact
+
+def join_pages(pages: Iterable[str]) -> str:
+    """Join page texts into the resume text, a line break between pages.
+    
+    Without it the last line of a page runs into the first line of the
+    next, hiding a section header that starts a page from the segmenter.
+    """
+    return "\n".join(pages)
+
+def extract_text_from_pdf(
+    source: PdfSource,
+    engine: Optional[str] = None,
+    max_pages: int = PDF_MAX_PAGES,
+    max_chars: int = PDF_MAX_CHARS,
+    early_exit: bool = PDF_EARLY_EXIT,
+    trace: Optional[Trace] = None,
+    page_texts: Optional[List[str]] = None,
+) -> str:
     """Extract text content from a PDF file.
     
+    Pages are read one at a time and reading stops as soon as a budget is
+    exhausted or, with ``early_exit``, once every key section is complete,
+    which bounds the cost of long portfolio-style PDFs.
+    
     Args:
-        file_path: Path to the PDF file
+        source: Path to the PDF file, its raw bytes, or a seekable binary
+            file object; in-memory sources are parsed without touching disk
+        engine: Text-extraction engine ("auto", "pdfium" or "pdfplumber");
+            defaults to PDF_TEXT_ENGINE
+        max_pages: Maximum number of pages to read (0 for no limit)
+        max_chars: Maximum number of characters to keep (0 for no limit)
+        early_exit: Stop after the page on which the key sections are complete
+        trace: Collects the extraction time and page count
+        page_texts: Filled with the text of each page read, e.g. to store
+            the text with its page boundaries
         
     Returns:
         Extracted text content
@@ -111,47 +342,118 @@ def extract_text_from_pdf(file_path: Union[str, Path]) -> str:
         ResumeParserError: If PDF extraction fails
     """
     try:
-        with pdfplumber.open(file_path) as pdf:
-            text = "".join(page.extract_text() or "" for page in pdf.pages)
-            logger.info("Successfully extracted text from PDF")
-            return text
+        pages = iter_pages(
+            source,
+            engine=engine or PDF_TEXT_ENGINE,
+            min_chars_per_page=PDF_MIN_CHARS_PER_PAGE,
+        )
+        tracker = KeySectionTracker()
+        chunks: List[str] = []
+        total_chars = 0
+        
+        with timed("pdf_extraction", trace), closing(pages):
+            for page_number, page in enumerate(pages, start=1):
+                if max_chars and total_chars + len(page) >= max_chars:
+                    chunks.append(page[:max_chars - total_chars])
+                    logger.debug("Stopped reading PDF at the %d character budget", max_chars)
+                    break
+                chunks.append(page)
+                total_chars += len(page)
+                if early_exit and tracker.feed(page):
+                    logger.debug("Key sections complete after page %d, skipping the rest", page_number)
+                    break
+                if max_pages and page_number >= max_pages:
+                    logger.debug("Stopped reading PDF at the %d page budget", max_pages)
+                    break
+        
+        count_pages(len(chunks), trace)
+        if page_texts is not None:
+            page_texts.extend(chunks)
+        text = join_pages(chunks)
+        logger.debug("Extracted %d characters from %d pages", len(text), len(chunks))
+        return text
     except Exception as e:
-        logger.error(f"Failed to extract text from PDF: {e}")
+        logger.error("Failed to extract text from PDF: %s", e)
         raise ResumeParserError(f"Failed to extract text from PDF: {e}")
 
-def extract_basic_info(text: str) -> Dict[str, str]:
+def ner_window(text: str) -> str:
+    """Return the resume header, the only part NER needs to find the name.
+    
+    Args:
+        text: Full resume text
+        
+    Returns:
+        The first SPACY_NER_MAX_LINES lines, capped at SPACY_NER_MAX_CHARS
+    """
+    lines = text.split("\n", SPACY_NER_MAX_LINES)[:SPACY_NER_MAX_LINES]
+    return "\n".join(lines)[:SPACY_NER_MAX_CHARS]
+
+def detect_name_by_rules(text: str) -> str:
+    """Find the candidate's name without a model.
+    
+    Returns the first line (or the part before a "|" or ",") among the
+    header lines that looks like two to four capitalized words and isn't a
+    section header.
+    
+    Args:
+        text: Resume text
+        
+    Returns:
+        The detected name, or an empty string
+    """
+    for line in ner_window(text).split("\n"):
+        candidate = re.split(r"[|,]", line, maxsplit=1)[0].strip()
+        if name_line_regex.match(candidate) and classify_header(candidate) is None:
+            return candidate
+    return ""
+
+def extract_basic_info(text: str, doc: Optional["Doc"] = None) -> Dict[str, str]:
     """Extract basic information (name, email, phone) from text.
     
     Args:
         text: Input text to process
+        doc: Pre-computed spaCy document for ``ner_window(text)`` (e.g. from
+            ``nlp.pipe``); ignored in "rules" mode
         
     Returns:
         Dictionary containing name, email and phone
     """
-    doc = nlp(text)
     info = {"name": "", "email": "", "phone": ""}
     
     # Extract name
-    for ent in doc.ents:
-        if ent.label_ == "PERSON" and not info["name"]:
-            name = " ".join(ent.text.split()).strip()
-            info["name"] = re.sub(r"\s*\d{7,}", "", name).strip()
-            break
+    nlp = get_nlp()
+    if nlp is None:
+        info["name"] = detect_name_by_rules(text)
+    else:
+        if doc is None:
+            doc = nlp(ner_window(text))
+        for ent in doc.ents:
+            if ent.label_ == "PERSON" and not info["name"]:
+                name = " ".join(ent.text.split()).strip()
+                info["name"] = re.sub(r"\s*\d{7,}", "", name).strip()
+                break
     if not info["name"]:
         first_line = text.split("\n")[0].strip()
         info["name"] = re.sub(r"[\d\-\+\s]{7,}", "", first_line).strip()
     
-    # Extract email and phone
+    info.update(extract_contact_info(text))
+    return info
+
+def extract_contact_info(text: str) -> Dict[str, str]:
+    """Extract the email address and phone number from text."""
     email_match = email_regex.search(text)
-    info["email"] = email_match.group() if email_match else ""
-    
     phone_match = phone_regex.search(text)
-    info["phone"] = phone_match.group() if phone_match else ""
-    
-    return info
+    return {
+        "email": email_match.group() if email_match else "",
+        "phone": phone_match.group() if phone_match else "",
+    }
 
 def extract_sections(text: str) -> Dict[str, List[Union[Dict[str, str], str]]]:
-    """Extract different sections from the resume text."""
+    """Extract different sections from the resume text.
+    
+    The text is first split into section spans by segment_sections; each
+    span's lines are then handed to the extractor for that section.
+    """
     lines = text.split("\n")
     sections = {
         "education": [],
@@ -162,127 +464,30 @@ def extract_sections(text: str) -> Dict[str, List[Union[Dict[str, str], str]]]:
         "volunteering": [],
         "projects": [],
     }
-    current_section = None
     work_entries = []
-    in_skills_section = False
-    
-    # Debug: Print the entire text
-    logger.debug("Processing text:\n%s", text)
-    
-    # First pass: Extract skills using ATS patterns
-    all_skills = set()
-    for pattern in SKILL_PATTERNS:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            skill = match.group().strip()
-            if len(skill) >= 2 and not skills_noise_regex.search(skill.lower()):
-                all_skills.add(clean_skill(skill))
-                logger.debug(f"Found skill using pattern {pattern}: {skill}")
-
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
-        lower_line = stripped.lower()
-        
-        # Debug: Print each line being processed
-        logger.debug("Processing line: %s", stripped)
-        
-        # Detect section headers
-        if any(skill_header in lower_line for skill_header in [
-            "technical skills",
-            "skills",
-            "technologies",
-            "programming languages",
-            "competencies",
-            "expertise",
-            "proficiencies",
-            "technical proficiencies",
-            "tools",
-            "software",
-            "qualifications",
-            "technical expertise",
-            "core competencies",
-            "professional skills",
-            "key skills",
-            "technical skills & tools",
-            "languages & technologies",
-            "professional expertise"
-        ]):
-            current_section = "skills"
-            in_skills_section = True
-            logger.debug("Entered skills section")
-            continue
-        elif any(header in lower_line for header in [
-            "experience",
-            "employment",
-            "work history",
-            "professional background"
-        ]):
-            current_section = "work_experience"
-            in_skills_section = False
-            continue
-        elif "education" in lower_line:
-            current_section = "education"
-            in_skills_section = False
-            continue
-        elif any(new_section in lower_line for new_section in [
-            "interests",
-            "hobbies",
-            "awards",
-            "achievements",
-            "volunteer",
-            "project",
-            "certifications",
-            "languages"
-        ]):
-            in_skills_section = False
-            if "interests" in lower_line or "hobbies" in lower_line:
-                current_section = "hobbies"
-            elif "awards" in lower_line or "achievements" in lower_line:
-                current_section = "awards"
-            elif "volunteer" in lower_line:
-                current_section = "volunteering"
-            elif "project" in lower_line:
-                current_section = "projects"
+    
+    # Checked once per resume rather than per line; resume text itself is
+    # never logged, only counts and skill names
+    debug = logger.isEnabledFor(logging.DEBUG)
+    
+    for span in segment_sections(lines):
+        if span.name is None:
             continue
-
-        # Process sections
-        if current_section == "education" and education_regex.search(lower_line):
-            sections["education"].append({"degree": stripped})
-        elif current_section == "work_experience":
-            work_entries.append(stripped)
-        elif current_section == "skills" or in_skills_section:
-            # Debug: Log skill line processing
-            logger.debug("Processing potential skill line: %s", stripped)
-            
-            # Extract skills from the line
-            skills = []
-            if ":" in stripped:
-                # Handle "Category: skill1, skill2" format
-                parts = stripped.split(":", 1)
-                skills.extend(s.strip() for s in parts[1].split(","))
-            else:
-                # Handle various formats
-                # Split by common separators
-                for part in re.split(r'[,•⚫·⦁▪▫●○⚪-]|\band\b', stripped):
-                    skill = part.strip()
-                    if skill:
-                        skills.append(skill)
-
-            # Filter and clean skills
-            for skill in skills:
-                skill = skill.strip('() []{}')  # Remove common brackets
-                if (skill and 
-                    len(skill) >= 2 and  # Allow shorter skill names
-                    len(skill.split()) <= 4 and  # Allow slightly longer skill phrases
-                    not skills_noise_regex.search(skill.lower())):
-                    cleaned_skill = clean_skill(skill)
-                    sections["skills"].append(cleaned_skill)
-                    logger.debug("Added skill: %s (cleaned from: %s)", cleaned_skill, skill)
-        
-        elif current_section in ["hobbies", "awards", "volunteering", "projects"]:
-            sections[current_section].append(stripped)
+        if debug:
+            logger.debug("Processing %s section, lines %d-%d", span.name, span.start, span.end)
+        body = [line.strip() for line in lines[span.start:span.end] if line.strip()]
+        
+        if span.name == "education":
+            sections["education"].extend(
+                {"degree": line} for line in body if education_regex.search(line.lower())
+            )
+        elif span.name == "work_experience":
+            work_entries.extend(body)
+        elif span.name == "skills":
+            for line in body:
+                sections["skills"].extend(extract_skills_from_line(line))
+        else:
+            sections[span.name].extend(body)
 
     sections["work_experience"] = combine_work_experience_entries(work_entries)
     
@@ -292,11 +497,62 @@ def extract_sections(text: str) -> Dict[str, List[Union[Dict[str, str], str]]]:
         if s and not skills_noise_regex.search(s.lower())
     ))
     
-    # Log extracted skills for debugging
-    logger.info("Final extracted skills: %s", sections["skills"])
+    if debug:
+        logger.debug("Final extracted skills: %s", sections["skills"])
     
     return sections
 
+def extract_job_skills(text: str) -> List[str]:
+    """Extract the skills a job description asks for.
+    
+    Uses the same rules as resumes: skills listed under a skills-style
+    header, plus every SKILL_PATTERNS match anywhere in the text, since
+    job descriptions often name skills in running prose.
+    
+    Args:
+        text: Job description
+        
+    Returns:
+        Normalized skill names
+    """
+    skills = set(extract_sections(text)["skills"])
+    skills.update(skill_matcher.find_all(text))
+    return sorted(skills)
+
+def extract_skills_from_line(line: str) -> List[str]:
+    """Extract cleaned skills from one line of a skills section.
+    
+    Args:
+        line: Stripped line of text
+        
+    Returns:
+        Cleaned skill names found on the line
+    """
+    # Extract skills from the line
+    skills = []
+    if ":" in line:
+        # Handle "Category: skill1, skill2" format
+        parts = line.split(":", 1)
+        skills.extend(s.strip() for s in parts[1].split(","))
+    else:
+        # Handle various formats
+        # Split by common separators
+        for part in skill_separator_regex.split(line):
+            skill = part.strip()
+            if skill:
+                skills.append(skill)
+
+    # Filter and clean skills
+    found = []
+    for skill in skills:
+        skill = skill.strip('() []{}')  # Remove common brackets
+        if (skill and 
+            len(skill) >= 2 and  # Allow shorter skill names
+            len(skill.split()) <= 4 and  # Allow slightly longer skill phrases
+            not skills_noise_regex.search(skill.lower())):
+            found.append(clean_skill(skill))
+    return found
+
 def combine_work_experience_entries(entries: List[str]) -> List[Dict[str, str]]:
     """Combine work experience entries into coherent descriptions.
     
@@ -332,9 +588,14 @@ def combine_work_experience_entries(entries: List[str]) -> List[Dict[str, str]]:
         combined.append({"description": buffer.strip()})
     return combined
 
+SKILL_NOISE_WORDS = frozenset({'and', 'or', 'in', 'with', 'using', 'the', 'a', 'an'})
+
+@lru_cache(maxsize=4096)
 def clean_skill(skill: str) -> str:
     """Clean and normalize skill names.
     
+    Results are memoized since the same skill strings recur across resumes.
+    
     Args:
         skill: Input skill name
         
@@ -343,18 +604,95 @@ def clean_skill(skill: str) -> str:
     """
     # Normalize the skill
     cleaned = skill.strip()
-    cleaned = re.sub(r'\s+', ' ', cleaned)  # Normalize whitespace
-    cleaned = re.sub(r'[-_]', ' ', cleaned)  # Replace hyphens and underscores with spaces
+    cleaned = whitespace_regex.sub(' ', cleaned)  # Normalize whitespace
+    cleaned = separator_regex.sub(' ', cleaned)  # Replace hyphens and underscores with spaces
     cleaned = cleaned.lower()  # Convert to lowercase
     
     # Remove common noise words
-    noise_words = {'and', 'or', 'in', 'with', 'using', 'the', 'a', 'an'}
-    cleaned_parts = [word for word in cleaned.split() if word not in noise_words]
+    cleaned_parts = [word for word in cleaned.split() if word not in SKILL_NOISE_WORDS]
     cleaned = ' '.join(cleaned_parts)
     
     # Check skill mapping for standardization
     return SKILL_MAPPING.get(cleaned, cleaned)
 
+# Single-pass matcher over all SKILL_PATTERNS
+skill_matcher = SkillMatcher(
+    SKILL_PATTERNS,
+    normalize=clean_skill,
+    is_noise=lambda skill: bool(skills_noise_regex.search(skill)),
+)
+
+def load_skill_enricher(
+    backend: str = SKILL_ENRICHMENT_BACKEND,
+) -> Union[EnrichmentClient, TaxonomySkillModel]:
+    """Create the backend behind enhance_with_ai.
+    
+    Args:
+        backend: "remote" for the Hugging Face API or "local" for the
+            offline matcher built from SKILL_TAXONOMY_FILE
+        
+    Returns:
+        The enrichment backend
+        
+    Raises:
+        ValueError: If ``backend`` is unknown
+    """
+    if backend == "local":
+        # Only the tokenizer is used, so a blank pipeline does and the
+        # NER model isn't needed
+        import spacy
+        
+        return TaxonomySkillModel.from_file(
+            spacy.blank("en"), SKILL_TAXONOMY_FILE, batch_size=HF_API_BATCH_SIZE
+        )
+    if backend == "remote":
+        return EnrichmentClient(
+            HF_API_URL,
+            token=HF_API_TOKEN,
+            timeout=HF_API_TIMEOUT,
+            batch_size=HF_API_BATCH_SIZE,
+            max_chars=HF_API_INPUT_CHARS,
+            cache_size=HF_CACHE_SIZE,
+            pool_size=HF_API_POOL_SIZE,
+            breaker=CircuitBreaker(HF_BREAKER_THRESHOLD, HF_BREAKER_COOLDOWN),
+        )
+    raise ValueError(f"Unknown skill enrichment backend '{backend}'. Use 'remote' or 'local'.")
+
+# Shared backend for AI skill detection, see get_skill_enricher
+_skill_enricher: Optional[Union[EnrichmentClient, TaxonomySkillModel]] = None
+_skill_enricher_lock = threading.Lock()
+
+def get_skill_enricher() -> Union[EnrichmentClient, TaxonomySkillModel]:
+    """Return the shared enrichment backend, creating it on first use."""
+    global _skill_enricher
+    if _skill_enricher is None:
+        with _skill_enricher_lock:
+            if _skill_enricher is None:
+                _skill_enricher = load_skill_enricher()
+    return _skill_enricher
+
+def warmup() -> float:
+    """Load the model and enrichment backend ahead of the first parse.
+    
+    Runs the pipeline once so lazily allocated state is in place too.
+    Servers that fork workers call this before forking, so the workers
+    share the loaded model instead of each loading its own.
+    
+    Returns:
+        Seconds taken
+        
+    Raises:
+        ResumeParserError: If the model can't be loaded
+    """
+    started = time.perf_counter()
+    nlp = get_nlp()
+    if nlp is not None:
+        nlp(ner_window("Jane Doe\njane.doe@example.com | 555-123-4567"))
+    get_skill_enricher()
+    elapsed = time.perf_counter() - started
+    logger.info("Parser warmed up in %.2fs", elapsed)
+    return elapsed
+
 def generate_dynamic_summary(
     sections: Dict[str, List], ai_skills: List[str]
 ) -> str:
@@ -408,83 +746,541 @@ def generate_dynamic_summary(
 def enhance_with_ai(text: str) -> Dict[str, List[str]]:
     """Enhance resume parsing with AI-based skill detection.
     
+    Uses the backend selected by SKILL_ENRICHMENT_BACKEND: the remote
+    Hugging Face model or the offline taxonomy matcher.
+    
     Args:
         text: Input text to process
         
     Returns:
         Dictionary containing detected skills
     """
-    if not HF_API_TOKEN:
-        logger.warning("No Hugging Face API token provided")
-        return {"skills": []}
+    return {"skills": get_skill_enricher().find_skills(text) or []}
+
+# Looks a MinHash signature up among stored resumes and returns the
+# closest near-duplicate as ``(resume_id, similarity, reusable result)``,
+# or None; see ResumeStore.find_near_duplicate
+DuplicateLookup = Callable[["np.ndarray"], Optional[Tuple[int, float, Optional[Dict]]]]
+
+def same_person(text: str, previous: Dict) -> bool:
+    """Whether a near-duplicate's email address doesn't contradict the earlier parse's.
+
+    Templated resumes of different people can share most of their text;
+    their names must not be carried over from one to the other.
+    """
+    email = extract_contact_info(text)["email"]
+    return not (email and previous.get("email") and email.lower() != previous["email"].lower())
+
+def check_near_duplicate(
+    text: str, find_duplicate: Optional[DuplicateLookup], trace: Optional[Trace] = None
+) -> Tuple[Dict, Optional[Dict]]:
+    """Look a resume up among stored resumes before the heavy stages run.
+    
+    Args:
+        text: Extracted resume text
+        find_duplicate: Near-duplicate lookup; nothing is checked without one
+        trace: Collects the time spent in the check
+        
+    Returns:
+        The fields to add to the resume's result (its encoded ``minhash``
+        signature and, for a near-duplicate, ``duplicate_of``), and the
+        finished result if the earlier parse is reused (NEAR_DUPLICATE_REUSE),
+        otherwise None. A reused result is rebuilt from ``text`` like
+        rebuild_resume does: only the name found by NER and the AI skills
+        come from the earlier parse, and only when the email addresses
+        don't differ.
+    """
+    if find_duplicate is None:
+        return {}, None
+    with timed("near_duplicate", trace):
+        signature = text_signature(text)
+        if signature is None:
+            return {}, None
+        match = find_duplicate(signature)
+    fields = {"minhash": encode_signature(signature)}
+    if match is None:
+        return fields, None
+    resume_id, similarity, previous = match
+    reuse = NEAR_DUPLICATE_REUSE and previous is not None and same_person(text, previous)
+    fields["duplicate_of"] = {"resume_id": resume_id, "similarity": round(similarity, 3), "reused": reuse}
+    if not reuse:
+        return fields, None
+    logger.debug("Reusing the parse of resume %d (similarity %.2f)", resume_id, similarity)
+    with timed("near_duplicate_rebuild", trace):
+        result = rebuild_resume(text, previous)
+    result.pop("duplicate_of", None)  # the earlier resume's own link, if any
+    result.update(fields)
+    return fields, result
+
+def build_resume(
+    text: str,
+    doc: Optional["Doc"] = None,
+    ai_request: Optional[EnrichmentRequest] = None,
+    ai_budget: Optional[float] = HF_API_BUDGET,
+    trace: Optional[Trace] = None,
+) -> Dict:
+    """Build structured resume data from already extracted text.
+    
+    AI enrichment runs in the background while the local extraction runs,
+    so a parse takes about as long as the slower of the two. If the model
+    hasn't answered within ``ai_budget`` the local result is returned and
+    ``partial`` lists the fields that are missing AI input.
+    
+    Args:
+        text: Extracted resume text
+        doc: Pre-computed spaCy document for ``ner_window(text)``
+        ai_request: Enrichment already started for ``text`` (e.g. as part
+            of a batch); started here when omitted
+        ai_budget: Seconds after the enrichment started to wait for it
+        trace: Collects the time spent in each stage
         
-    api_url = "https://api-inference.huggingface.co/models/dslim/bert-base-NER"
-    headers = {"Authorization": f"Bearer {HF_API_TOKEN}"}
-    payload = {"inputs": text[:500], "options": {"wait_for_model": True}}
+    Returns:
+        Dictionary containing parsed resume data
+    """
+    if ai_request is None:
+        ai_request = get_skill_enricher().submit(text)
+    nlp = get_nlp()
+    if doc is None and nlp is not None:
+        with timed("ner", trace):
+            doc = nlp(ner_window(text))
+    with timed("basic_info", trace):
+        resume_data = extract_basic_info(text, doc)
+    with timed("sections", trace):
+        sections = extract_sections(text)
+    with timed("enrichment_wait", trace):
+        ai_skills = ai_request.result(ai_budget)
+    return assemble_resume(resume_data, sections, ai_skills)
+
+def assemble_resume(
+    resume_data: Dict, sections: Dict[str, List], ai_skills: Optional[List[str]]
+) -> Dict:
+    """Combine the basic info, sections and AI skills into the final result.
     
+    Args:
+        resume_data: Name, email and phone; updated in place
+        sections: Extracted resume sections
+        ai_skills: Skills detected by AI, or None if enrichment didn't answer
+        
+    Returns:
+        ``resume_data`` with the sections, combined skills, the AI skills
+        on their own (``ai_skills``), the summary and ``partial``
+    """
+    ai_enhancement = {"skills": ai_skills or []}
+    
+    # Combine skills and generate summary
+    combined_skills = list(set(sections["skills"] + ai_enhancement["skills"]))
+    resume_data.update(sections)
+    resume_data["skills"] = combined_skills
+    resume_data["ai_skills"] = ai_enhancement["skills"]
+    resume_data["ai_summary"] = generate_dynamic_summary(
+        sections, ai_enhancement["skills"]
+    )
+    resume_data["partial"] = ["skills", "ai_summary"] if ai_skills is None else []
+    
+    return resume_data
+
+def rebuild_resume(text: str, previous: Dict) -> Dict:
+    """Re-run the text-level stages of a parse under the current rules.
+    
+    Contact details, sections, skills and the summary are extracted from
+    the stored text again. NER and AI enrichment are not: the name (unless
+    names come from rules, in "rules" mode) and the AI skills are taken
+    from ``previous``, so no model is loaded.
+    
+    Args:
+        text: Text extracted from the resume when it was first parsed
+        previous: The resume's earlier result
+        
+    Returns:
+        The rebuilt result; ``duplicate_of`` is carried over
+        
+    Raises:
+        ResumeParserError: If rebuilding fails
+    """
     try:
-        response = requests.post(
-            api_url,
-            headers=headers,
-            json=payload,
-            timeout=HF_API_TIMEOUT
-        )
-        response.raise_for_status()
-        
-        result = response.json()
-        skills = []
-        for entity in result:
-            if "entity_group" in entity and entity["entity_group"] in ["ORG", "MISC"]:
-                word = entity["word"]
-                if (
-                    len(word) > 2
-                    and not word.startswith("##")
-                    and re.match(r"^[A-Za-z][A-Za-z0-9\+\#\.\-]*$", word)
-                ):
-                    skills.append(word)
-                    
-        skills = list(set(skills))
-        logger.info("AI found skills: %s", skills)
-        return {"skills": skills}
-        
-    except requests.Timeout:
-        logger.error("Hugging Face API request timed out")
-        return {"skills": []}
-    except requests.RequestException as e:
-        logger.error("Hugging Face API error: %s", e)
-        return {"skills": []}
+        if SPACY_PIPELINE_MODE == "rules":
+            resume_data = extract_basic_info(text)
+        else:
+            resume_data = dict(extract_contact_info(text), name=previous.get("name", ""))
+        ai_skills = None if previous.get("partial") else previous.get("ai_skills", [])
+        result = assemble_resume(resume_data, extract_sections(text), ai_skills)
     except Exception as e:
-        logger.exception("Unexpected error in AI enhancement:")
-        return {"skills": []}
+        raise ResumeParserError(f"Failed to rebuild resume: {str(e)}")
+    if "duplicate_of" in previous:
+        result["duplicate_of"] = previous["duplicate_of"]
+    return result
 
-def parse_resume(file_path: Union[str, Path]) -> Dict:
+def parse_resume(
+    source: PdfSource,
+    engine: Optional[str] = None,
+    trace: Optional[Trace] = None,
+    find_duplicate: Optional[DuplicateLookup] = None,
+    page_texts: Optional[List[str]] = None,
+) -> Dict:
     """Parse a resume PDF file and extract structured information.
     
     Args:
-        file_path: Path to the PDF file
+        source: Path to the PDF file, its raw bytes, or a binary file object
+        engine: Text-extraction engine; defaults to PDF_TEXT_ENGINE
+        trace: Collects the time spent in each stage and the pages read
+        find_duplicate: Near-duplicate lookup, see check_near_duplicate
+        page_texts: Filled with the text of each page read
         
     Returns:
         Dictionary containing parsed resume data
         
     Raises:
-        ResumeParserError: If parsing fails
+        ResumeParserError: If parsing fails; text extraction errors are
+            raised as they are, like iter_parse_resumes reports them
     """
+    text = extract_text_from_pdf(source, engine, trace=trace, page_texts=page_texts)
     try:
-        text = extract_text_from_pdf(file_path)
-        resume_data = extract_basic_info(text)
-        sections = extract_sections(text)
-        ai_enhancement = enhance_with_ai(text)
-        
-        # Combine skills and generate summary
-        combined_skills = list(set(sections["skills"] + ai_enhancement["skills"]))
-        resume_data.update(sections)
-        resume_data["skills"] = combined_skills
-        resume_data["ai_summary"] = generate_dynamic_summary(
-            sections, ai_enhancement["skills"]
-        )
-        
-        return resume_data
+        fields, reused = check_near_duplicate(text, find_duplicate, trace)
+        if reused is not None:
+            return reused
+        return dict(build_resume(text, trace=trace), **fields)
         
     except Exception as e:
         logger.exception("Failed to parse resume:")
         raise ResumeParserError(f"Failed to parse resume: {str(e)}")
+
+def iter_parse_resumes(
+    sources: Iterable[PdfSource],
+    batch_size: int = SPACY_BATCH_SIZE,
+    n_process: int = SPACY_N_PROCESS,
+    engine: Optional[str] = None,
+    traces: Optional[Dict[int, Trace]] = None,
+    find_duplicate: Optional[DuplicateLookup] = None,
+    page_texts: Optional[Dict[int, List[str]]] = None,
+) -> Iterator[Tuple[int, Union[Dict, ResumeParserError]]]:
+    """Parse several resume PDF files, yielding each result as soon as it is ready.
+    
+    Texts are extracted lazily and their headers fed to a single
+    ``nlp.pipe`` call, so NER runs in batches of ``batch_size`` and the first results are available
+    after the first batch instead of after the whole upload. AI enrichment
+    is requested for HF_API_BATCH_SIZE resumes per call as soon as their
+    texts are extracted, so it overlaps with NER. Near-duplicates whose
+    earlier parse is reused skip NER and enrichment altogether.
+    
+    Args:
+        sources: PDF files as paths, raw bytes or binary file objects
+        batch_size: Number of texts buffered per ``nlp.pipe`` batch
+        n_process: Number of processes used by ``nlp.pipe``
+        engine: Text-extraction engine; defaults to PDF_TEXT_ENGINE
+        traces: Filled with the Trace of each file, keyed by index
+        find_duplicate: Near-duplicate lookup, see check_near_duplicate
+        page_texts: Filled with the text of each page read, keyed by index
+        
+    Yields:
+        ``(index, outcome)`` pairs, where ``index`` is the position of the
+        file in ``sources`` and ``outcome`` is the parsed resume data or
+        the ResumeParserError raised while parsing that file
+    """
+    sources = list(sources)
+    failures: List[Tuple[int, ResumeParserError]] = []
+    reused: List[Tuple[int, Dict]] = []
+    duplicate_fields: Dict[int, Dict] = {}
+    done = set()
+    
+    ai_requests: Dict[int, EnrichmentRequest] = {}
+    traces = traces if traces is not None else {}
+    page_texts = page_texts if page_texts is not None else {}
+    enricher = get_skill_enricher()
+    extraction_seconds = 0.0  # spent extracting every file so far, to tell it apart from NER time
+    
+    def texts() -> Iterator[Tuple[str, Tuple[int, str]]]:
+        nonlocal extraction_seconds
+        # Extract a whole enrichment batch before handing it to NER so the
+        # remote call runs while the batch goes through the pipeline
+        for start in range(0, len(sources), enricher.batch_size):
+            extracted = []
+            for index in range(start, min(start + enricher.batch_size, len(sources))):
+                trace = traces.setdefault(index, Trace())
+                started = time.perf_counter()
+                try:
+                    text = extract_text_from_pdf(
+                        sources[index], engine, trace=trace, page_texts=page_texts.setdefault(index, [])
+                    )
+                    duplicate_fields[index], result = check_near_duplicate(text, find_duplicate, trace)
+                    if result is None:
+                        extracted.append((index, text))
+                    else:
+                        reused.append((index, result))
+                except ResumeParserError as e:
+                    failures.append((index, e))
+                finally:
+                    extraction_seconds += time.perf_counter() - started
+            submitted = enricher.submit_many([text for _, text in extracted])
+            for (index, text), ai_request in zip(extracted, submitted):
+                ai_requests[index] = ai_request
+                yield ner_window(text), (index, text)
+    
+    def annotated() -> Iterator[Tuple[Optional["Doc"], Tuple[int, str]]]:
+        nlp = get_nlp()
+        if nlp is None:
+            for _, context in texts():
+                yield None, context
+        else:
+            docs = nlp.pipe(
+                texts(), as_tuples=True, batch_size=batch_size, n_process=n_process
+            )
+            while True:
+                # The pipe pulls texts as it goes, so leave their extraction out of NER time
+                extracted_before = extraction_seconds
+                started = time.perf_counter()
+                try:
+                    doc, context = next(docs)
+                except StopIteration:
+                    return
+                extracted = extraction_seconds - extracted_before
+                record_stage("ner", time.perf_counter() - started - extracted, traces[context[0]])
+                yield doc, context
+    
+    try:
+        for doc, (index, text) in annotated():
+            while failures:
+                failed_index, error = failures.pop(0)
+                done.add(failed_index)
+                yield failed_index, error
+            while reused:
+                reused_index, result = reused.pop(0)
+                done.add(reused_index)
+                yield reused_index, result
+            try:
+                outcome = build_resume(text, doc, ai_requests.pop(index), trace=traces[index])
+                outcome.update(duplicate_fields.pop(index))
+            except Exception as e:
+                logger.exception("Failed to parse resume #%d:", index)
+                outcome = ResumeParserError(f"Failed to parse resume: {str(e)}")
+            done.add(index)
+            yield index, outcome
+    except Exception as e:
+        logger.exception("Batch NER failed:")
+        error = ResumeParserError(f"Failed to parse resume: {str(e)}")
+        failures.extend(
+            (index, error) for index in range(len(sources)) if index not in done
+        )
+    
+    for index, result in reused:
+        if index not in done:
+            done.add(index)
+            yield index, result
+    for index, error in failures:
+        if index not in done:
+            done.add(index)
+            yield index, error
+
+def parse_resumes(
+    sources: Iterable[PdfSource],
+    batch_size: int = SPACY_BATCH_SIZE,
+    n_process: int = SPACY_N_PROCESS,
+    engine: Optional[str] = None,
+) -> List[Union[Dict, ResumeParserError]]:
+    """Parse several resume PDF files, running NER over all of them in batches.
+    
+    Args:
+        sources: PDF files as paths, raw bytes or binary file objects
+        batch_size: Number of texts buffered per ``nlp.pipe`` batch
+        n_process: Number of processes used by ``nlp.pipe``
+        engine: Text-extraction engine; defaults to PDF_TEXT_ENGINE
+        
+    Returns:
+        One entry per input file, in input order: the parsed resume data, or
+        the ResumeParserError raised while parsing that file
+    """
+    sources = list(sources)
+    results: List[Union[Dict, ResumeParserError, None]] = [None] * len(sources)
+    for index, outcome in iter_parse_resumes(sources, batch_size, n_process, engine):
+        results[index] = outcome
+    return results
+
+def collect_pdf_paths(inputs: Iterable[str]) -> List[str]:
+    """Expand files, directories (searched recursively) and glob patterns into PDF paths.
+    
+    Args:
+        inputs: Command-line arguments naming what to parse
+        
+    Returns:
+        Absolute paths of the PDF files, sorted and without duplicates
+    """
+    paths: Set[str] = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = [str(path) for path in Path(item).rglob("*") if path.suffix.lower() == ".pdf"]
+        elif glob.has_magic(item):
+            matches = [match for match in glob.glob(item, recursive=True) if os.path.isfile(match)]
+        else:
+            matches = [item]  # a missing file is reported as an error when parsed
+        paths.update(os.path.abspath(match) for match in matches)
+    return sorted(paths)
+
+def read_checkpoint(output: str) -> Set[str]:
+    """Return the paths already recorded in a JSONL output file.
+    
+    Args:
+        output: JSONL file written by a previous run
+        
+    Returns:
+        Paths to skip
+    """
+    done: Set[str] = set()
+    if not os.path.exists(output):
+        return done
+    with open(output, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a line cut short when the previous run was killed
+            if "path" in record:
+                done.add(record["path"])
+    return done
+
+def drop_errors(output: str) -> int:
+    """Rewrite a JSONL output file without its error records, so those files are parsed again.
+    
+    Lines cut short by a killed run are dropped too. The file is replaced
+    in one step, so it is never left half written.
+    
+    Args:
+        output: JSONL file written by a previous run
+        
+    Returns:
+        Number of error records dropped
+    """
+    if not os.path.exists(output):
+        return 0
+    dropped = 0
+    temporary = f"{output}.tmp"
+    with open(output, encoding="utf-8") as f, open(temporary, "w", encoding="utf-8") as kept:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if "error" in record:
+                dropped += 1
+            else:
+                kept.write(line if line.endswith("\n") else line + "\n")
+    os.replace(temporary, output)
+    return dropped
+
+def parse_file(path: str, engine: Optional[str] = None) -> Dict:
+    """Parse one PDF for the command line, returning a JSONL record instead of raising."""
+    try:
+        return {"path": path, "result": parse_resume(path, engine)}
+    except ResumeParserError as e:
+        return {"path": path, "error": str(e)}
+
+def iter_parse_files(
+    paths: List[str], workers: int, engine: Optional[str] = None
+) -> Iterator[Dict]:
+    """Parse files on ``workers`` processes, yielding records as they finish.
+    
+    With one worker the files are parsed in this process with batched NER.
+    Otherwise at most a few files per worker are in flight at once, so the
+    pool never holds the whole backlog. Nothing is loaded when there are
+    no files.
+    """
+    if not paths:
+        return
+    if workers <= 1:
+        for index, outcome in iter_parse_resumes(paths, engine=engine):
+            if isinstance(outcome, Exception):
+                yield {"path": paths[index], "error": str(outcome)}
+            else:
+                yield {"path": paths[index], "result": outcome}
+        return
+    
+    # Forked workers share the model loaded here before the fork; spawned
+    # ones (where fork isn't available) load their own
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+    if context.get_start_method() == "fork":
+        warmup()
+    pending = iter(paths)
+    with futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=configure_logging,
+        initargs=(logging.getLogger().level,),
+    ) as executor:
+        in_flight = set()
+        for path in pending:
+            in_flight.add(executor.submit(parse_file, path, engine))
+            if len(in_flight) < workers * 4:
+                continue
+            finished, in_flight = futures.wait(in_flight, return_when=futures.FIRST_COMPLETED)
+            for future in finished:
+                yield future.result()
+        for future in futures.as_completed(in_flight):
+            yield future.result()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse PDF resumes from the command line into a JSONL file.
+    
+    Each output line is ``{"path": ..., "result": {...}}`` or
+    ``{"path": ..., "error": "..."}``. Lines are written as soon as each file
+    is parsed, and files already present in the output are skipped, so an
+    interrupted run can be resumed by running the same command again.
+    
+    Args:
+        argv: Command-line arguments; defaults to ``sys.argv[1:]``
+        
+    Returns:
+        Exit status: 0 if every file parsed, 1 if any failed
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m resume_parser",
+        description="Parse PDF resumes into a JSONL file.",
+    )
+    parser.add_argument("inputs", nargs="+", help="PDF files, directories or glob patterns")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file to append results to")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=os.cpu_count() or 1,
+        help="worker processes (default: number of CPUs)",
+    )
+    parser.add_argument("--engine", default=None, help="PDF text-extraction engine")
+    parser.add_argument(
+        "--retry-errors", action="store_true",
+        help="remove failed attempts from the output and parse those files again",
+    )
+    parser.add_argument("--log-level", default="WARNING", help="logging level (default: WARNING)")
+    args = parser.parse_args(argv)
+    configure_logging(args.log_level)
+    
+    paths = collect_pdf_paths(args.inputs)
+    if args.retry_errors:
+        dropped = drop_errors(args.output)
+        if dropped:
+            print(f"Removed {dropped} failed attempts from {args.output} to retry them", file=sys.stderr)
+    done = read_checkpoint(args.output)
+    todo = [path for path in paths if path not in done]
+    print(
+        f"Found {len(paths)} PDF files; {len(paths) - len(todo)} already in {args.output}",
+        file=sys.stderr,
+    )
+    
+    parsed = failed = 0
+    start = time.perf_counter()
+    with open(args.output, "a", encoding="utf-8") as output:
+        for record in iter_parse_files(todo, args.workers, args.engine):
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+            if "error" in record:
+                failed += 1
+                print(f"Failed: {record['path']}: {record['error']}", file=sys.stderr)
+            else:
+                parsed += 1
+    elapsed = time.perf_counter() - start
+    
+    rate = (parsed + failed) / elapsed if elapsed else 0.0
+    print(
+        f"Parsed {parsed} files, {failed} failed, {len(paths) - len(todo)} skipped "
+        f"in {elapsed:.1f}s ({rate:.1f} files/s)",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,468 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from near_duplicates import band_keys, decode_signature, similarity
+
+logger = logging.getLogger(__name__)
+
+SEARCH_MODES = ("all", "any")
+
+# The extraction part of a row's rules_version (the whole value for rows
+# stored before it had two parts, so they never match)
+EXTRACTION_RULES_SQL = "substr(resumes.rules_version, instr(resumes.rules_version, '.') + 1)"
+
+def compress_pages(pages: List[str]) -> Tuple[bytes, str]:
+    """Compress page texts into one blob and the JSON list of page end offsets."""
+    ends = []
+    total = 0
+    for page in pages:
+        total += len(page)
+        ends.append(total)
+    return zlib.compress("".join(pages).encode("utf-8")), json.dumps(ends)
+
+def decompress_pages(blob: bytes, ends: str) -> List[str]:
+    text = zlib.decompress(blob).decode("utf-8")
+    starts = [0] + json.loads(ends)
+    return [text[start:end] for start, end in zip(starts, starts[1:])]
+
+class ResumeStore:
+    """SQLite store of parsed resumes with an inverted skill index.
+
+    Each resume is stored once per file content (``content_key``, the
+    SHA-256 of the PDF bytes); storing the same file again replaces the
+    earlier result. ``resume_skills`` maps every normalized skill to the
+    resumes that list it, so a skill search reads one posting list per
+    queried skill instead of scanning every resume. Every write gets the
+    next ``revision``, so readers in any process can pick up just the
+    changes since they last looked.
+
+    Resumes stored with a MinHash signature (see near_duplicates) are also
+    indexed by its LSH band keys in ``resume_bands``, so a near-duplicate
+    lookup reads a handful of small buckets whatever the size of the store.
+    Only resumes that are not themselves near-duplicates are indexed, so
+    new versions link to the first version seen.
+
+    The text extracted from each PDF is kept compressed in
+    ``resume_texts``, with its page boundaries, so results can be rebuilt
+    under new parsing rules without reading the PDFs again (see
+    reprocess.py). Every row records the ``rules_version`` it was parsed
+    under, as ``<text rules>.<extraction rules>``: only rows whose
+    extraction rules are current can be rebuilt from their text.
+    """
+
+    def __init__(
+        self, db_path: Union[str, Path], normalize: Callable[[str], str], rules_version: str = ""
+    ) -> None:
+        """
+        Args:
+            db_path: SQLite file, created if missing
+            normalize: Maps a skill name to its indexed form, applied to
+                stored skills and search terms alike
+            rules_version: Version of the parsing rules; results stored
+                under another version are never reused for near-duplicates
+        """
+        self.db_path = Path(db_path)
+        self.normalize = normalize
+        self.rules_version = rules_version
+        self.extraction_rules = rules_version.partition(".")[2]
+        self._lock = threading.Lock()
+        self._open_db()
+
+    def _open_db(self) -> None:
+        self.db_path.parent.mkdir(exist_ok=True, parents=True)
+        self._db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS resumes ("
+            "id INTEGER PRIMARY KEY, content_key TEXT NOT NULL UNIQUE, "
+            "filename TEXT NOT NULL, result TEXT NOT NULL, revision INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, updated_at REAL NOT NULL, "
+            "rules_version TEXT NOT NULL DEFAULT '', minhash BLOB, duplicate_of INTEGER)"
+        )
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(resumes)")}
+        if "revision" not in columns:
+            # Stores created before revisions existed: number rows in id order
+            self._db.execute("ALTER TABLE resumes ADD COLUMN revision INTEGER NOT NULL DEFAULT 0")
+            self._db.execute("UPDATE resumes SET revision = id")
+        if "minhash" not in columns:
+            self._db.execute("ALTER TABLE resumes ADD COLUMN rules_version TEXT NOT NULL DEFAULT ''")
+            self._db.execute("ALTER TABLE resumes ADD COLUMN minhash BLOB")
+            self._db.execute("ALTER TABLE resumes ADD COLUMN duplicate_of INTEGER")
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS resumes_by_revision ON resumes (revision)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS resume_skills ("
+            "skill TEXT NOT NULL, resume_id INTEGER NOT NULL, "
+            "PRIMARY KEY (skill, resume_id)) WITHOUT ROWID"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS resume_skills_by_resume ON resume_skills (resume_id)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS resume_bands ("
+            "band_key INTEGER NOT NULL, resume_id INTEGER NOT NULL, "
+            "PRIMARY KEY (band_key, resume_id)) WITHOUT ROWID"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS resume_bands_by_resume ON resume_bands (resume_id)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS resume_texts ("
+            "content_key TEXT PRIMARY KEY, text BLOB NOT NULL, page_ends TEXT NOT NULL, "
+            "stored_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def after_fork(self) -> None:
+        """Give a forked child process its own lock and SQLite connection."""
+        self._lock = threading.Lock()
+        self._open_db()
+
+    def index_terms(self, skills: Iterable[str]) -> List[str]:
+        """Normalize skill names into the distinct terms they are indexed under."""
+        return sorted({self.normalize(skill) for skill in skills if skill and skill.strip()} - {""})
+
+    def add(
+        self, content_key: str, filename: str, result: Dict, page_texts: Optional[List[str]] = None
+    ) -> int:
+        """Store a parsed resume and index its skills and MinHash signature.
+
+        Args:
+            content_key: SHA-256 of the PDF bytes
+            filename: Name the file was uploaded under
+            result: Parsed resume data; its encoded ``minhash`` signature,
+                if any, is stored apart from the rest, and ``duplicate_of``
+                links it to the resume it is a near-duplicate of
+            page_texts: Text extracted from each page, kept for reprocessing;
+                a text stored earlier is kept when omitted
+
+        Returns:
+            The resume's id, which stays the same when the same file is
+            stored again
+        """
+        result = dict(result)
+        encoded = result.pop("minhash", None)
+        signature = decode_signature(encoded) if encoded else None
+        terms = self.index_terms(result.get("skills", []))
+        text = compress_pages(page_texts) if page_texts else None
+        now = time.time()
+        with self._lock:
+            # Take the write lock up front so concurrent writers in other
+            # processes can't hand out the same revision
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                revision = self._db.execute(
+                    "SELECT COALESCE(MAX(revision), 0) + 1 FROM resumes"
+                ).fetchone()[0]
+                row = self._db.execute(
+                    "SELECT id FROM resumes WHERE content_key = ?", (content_key,)
+                ).fetchone()
+                if row is None:
+                    resume_id = self._db.execute(
+                        "INSERT INTO resumes (content_key, filename, result, revision, created_at, updated_at) "
+                        "VALUES (?, ?, '', ?, ?, ?)",
+                        (content_key, filename, revision, now, now),
+                    ).lastrowid
+                else:
+                    resume_id = row[0]
+                    self._db.execute("DELETE FROM resume_skills WHERE resume_id = ?", (resume_id,))
+                    self._db.execute("DELETE FROM resume_bands WHERE resume_id = ?", (resume_id,))
+                # The same file parsed again can match its own earlier version
+                duplicate_of = result.get("duplicate_of", {}).get("resume_id")
+                if duplicate_of == resume_id:
+                    del result["duplicate_of"]
+                    duplicate_of = None
+                self._db.execute(
+                    "UPDATE resumes SET filename = ?, result = ?, revision = ?, updated_at = ?, "
+                    "rules_version = ?, minhash = ?, duplicate_of = ? WHERE id = ?",
+                    (
+                        filename, json.dumps(result), revision, now, self.rules_version,
+                        signature.tobytes() if signature is not None else None, duplicate_of, resume_id,
+                    ),
+                )
+                self._db.executemany(
+                    "INSERT INTO resume_skills (skill, resume_id) VALUES (?, ?)",
+                    [(term, resume_id) for term in terms],
+                )
+                if signature is not None and duplicate_of is None:
+                    self._db.executemany(
+                        "INSERT OR IGNORE INTO resume_bands (band_key, resume_id) VALUES (?, ?)",
+                        [(key, resume_id) for key in band_keys(signature)],
+                    )
+                if text is not None:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO resume_texts (content_key, text, page_ends, stored_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (content_key, *text, now),
+                    )
+                self._db.commit()
+            except Exception:
+                self._db.rollback()
+                raise
+        return resume_id
+
+    def get(self, resume_id: int) -> Optional[Dict]:
+        """Return a stored resume with its id and filename, or None if unknown."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT filename, result, created_at FROM resumes WHERE id = ?", (resume_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        filename, payload, created_at = row
+        return dict(json.loads(payload), resume_id=resume_id, filename=filename, stored_at=created_at)
+
+    def get_many(self, resume_ids: List[int]) -> Dict[int, Dict]:
+        """Return the stored resumes among ``resume_ids``, keyed by id; see get."""
+        if not resume_ids:
+            return {}
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT id, filename, result, created_at FROM resumes WHERE id IN ({','.join('?' * len(resume_ids))})",
+                list(resume_ids),
+            ).fetchall()
+        return {
+            resume_id: dict(json.loads(payload), resume_id=resume_id, filename=filename, stored_at=created_at)
+            for resume_id, filename, payload, created_at in rows
+        }
+
+    def iter_results(self, since: int = 0, batch_size: int = 1000) -> Iterator[Tuple[int, int, Dict]]:
+        """Yield resumes stored or replaced after revision ``since``.
+
+        Rows are read ``batch_size`` at a time, so the lock is never held
+        for the whole scan.
+
+        Args:
+            since: Last revision already seen; 0 for every resume
+            batch_size: Rows read per query
+
+        Yields:
+            ``(revision, resume_id, result)`` in revision order
+        """
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT revision, id, result FROM resumes WHERE revision > ? ORDER BY revision LIMIT ?",
+                    (since, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            for revision, resume_id, payload in rows:
+                yield revision, resume_id, json.loads(payload)
+            since = rows[-1][0]
+
+    def find_near_duplicate(
+        self, signature: np.ndarray, threshold: float
+    ) -> Optional[Tuple[int, float, Optional[Dict]]]:
+        """Find the stored resume most similar to a MinHash signature.
+
+        Only resumes sharing at least one LSH band with the signature are
+        compared, so the cost depends on the number of similar resumes,
+        not on the size of the store.
+
+        Args:
+            signature: MinHash signature of the new resume's text
+            threshold: Lowest estimated Jaccard similarity that counts as
+                a near-duplicate
+
+        Returns:
+            ``(resume_id, similarity, result)`` of the closest match, or
+            None if nothing reaches ``threshold``. ``result`` is the stored
+            parse if it can stand in for a new one (same parsing rules and
+            not ``partial``), otherwise None.
+        """
+        keys = band_keys(signature)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, minhash FROM resumes WHERE id IN ("
+                f"SELECT resume_id FROM resume_bands WHERE band_key IN ({','.join('?' * len(keys))}))",
+                keys,
+            ).fetchall()
+            best = None
+            for resume_id, stored in rows:
+                score = similarity(signature, np.frombuffer(stored, dtype=np.uint32))
+                # Ties go to the oldest resume
+                if score >= threshold and (best is None or (score, -resume_id) > (best[1], -best[0])):
+                    best = (resume_id, score)
+            if best is None:
+                return None
+            payload, rules_version = self._db.execute(
+                "SELECT result, rules_version FROM resumes WHERE id = ?", (best[0],)
+            ).fetchone()
+        result = json.loads(payload)
+        reusable = rules_version == self.rules_version and not result.get("partial")
+        return best[0], best[1], result if reusable else None
+
+    def get_text(self, content_key: str) -> Optional[List[str]]:
+        """Return the stored text of a PDF page by page, or None if it wasn't kept."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT text, page_ends FROM resume_texts WHERE content_key = ?", (content_key,)
+            ).fetchone()
+        return decompress_pages(*row) if row is not None else None
+
+    def count_stale(self) -> int:
+        """Number of resumes that iter_stale would yield."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM resumes JOIN resume_texts USING (content_key) "
+                f"WHERE resumes.rules_version != ? AND {EXTRACTION_RULES_SQL} = ?",
+                (self.rules_version, self.extraction_rules),
+            ).fetchone()[0]
+
+    def count_outdated(self) -> int:
+        """Number of resumes parsed under other extraction rules.
+
+        Their stored text, name or AI skills may differ from a parse under
+        the current rules, so they can't be rebuilt and only uploading the
+        PDF again brings them up to date.
+        """
+        with self._lock:
+            return self._db.execute(
+                f"SELECT COUNT(*) FROM resumes WHERE {EXTRACTION_RULES_SQL} != ?",
+                (self.extraction_rules,),
+            ).fetchone()[0]
+
+    def iter_stale(self, batch_size: int = 100) -> Iterator[List[Tuple[str, str, Dict, List[str]]]]:
+        """Yield batches of resumes to rebuild under the current rules.
+
+        Resumes are read in id order, ``batch_size`` at a time, skipping
+        those already parsed under ``rules_version``, those parsed under
+        other extraction rules (see count_outdated) and those whose text
+        wasn't stored (they were stored before texts were kept). Resumes
+        rebuilt and stored again while this runs are not read twice.
+
+        Yields:
+            Lists of ``(content_key, filename, result, page_texts)``
+        """
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT resumes.id, resumes.content_key, filename, result, text, page_ends "
+                    "FROM resumes JOIN resume_texts USING (content_key) "
+                    f"WHERE resumes.id > ? AND resumes.rules_version != ? AND {EXTRACTION_RULES_SQL} = ? "
+                    "ORDER BY resumes.id LIMIT ?",
+                    (last_id, self.rules_version, self.extraction_rules, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [
+                (content_key, filename, json.loads(payload), decompress_pages(text, ends))
+                for _, content_key, filename, payload, text, ends in rows
+            ]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def _postings(self, term: str) -> List[int]:
+        return [row[0] for row in self._db.execute(
+            "SELECT resume_id FROM resume_skills WHERE skill = ?", (term,)
+        )]
+
+    def search(
+        self,
+        skills: Iterable[str],
+        mode: str = "all",
+        page: int = 1,
+        per_page: int = 20,
+    ) -> Dict:
+        """Find resumes listing the given skills.
+
+        With ``mode="all"`` the posting lists are intersected from the
+        shortest up, stopping as soon as the intersection is empty. With
+        ``mode="any"`` they are merged and resumes are ranked by how many
+        of the skills they list. Ties go to the most recently stored resume.
+
+        Args:
+            skills: Skill names, normalized like stored skills
+            mode: "all" or "any"
+            page: 1-based page number
+            per_page: Results per page
+
+        Returns:
+            ``{"skills", "mode", "total", "page", "per_page", "results"}``,
+            where each result holds the resume's id, filename, name, email,
+            skills, the queried skills it matched and ``score``, the
+            fraction of queried skills matched
+
+        Raises:
+            ValueError: If ``mode`` is unknown
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{mode}'. Use 'all' or 'any'.")
+        terms = self.index_terms(skills)
+        matches: Counter = Counter()
+        with self._lock:
+            if mode == "all" and terms:
+                sizes = dict(self._db.execute(
+                    f"SELECT skill, COUNT(*) FROM resume_skills WHERE skill IN ({','.join('?' * len(terms))}) "
+                    "GROUP BY skill",
+                    terms,
+                ).fetchall())
+                if len(sizes) == len(terms):
+                    candidates: Optional[set] = None
+                    for term in sorted(terms, key=sizes.get):
+                        postings = self._postings(term)
+                        candidates = set(postings) if candidates is None else candidates.intersection(postings)
+                        if not candidates:
+                            break
+                    matches.update({resume_id: len(terms) for resume_id in candidates or ()})
+            else:
+                for term in terms:
+                    matches.update(self._postings(term))
+
+            ranked = sorted(matches.items(), key=lambda item: (-item[1], -item[0]))
+            start = (page - 1) * per_page
+            page_ids = [resume_id for resume_id, _ in ranked[start:start + per_page]]
+            rows = {}
+            matched: Dict[int, List[str]] = {resume_id: [] for resume_id in page_ids}
+            if page_ids:
+                id_params = ",".join("?" * len(page_ids))
+                rows = {
+                    row[0]: row[1:]
+                    for row in self._db.execute(
+                        f"SELECT id, filename, result FROM resumes WHERE id IN ({id_params})", page_ids
+                    )
+                }
+                for term, resume_id in self._db.execute(
+                    f"SELECT skill, resume_id FROM resume_skills WHERE resume_id IN ({id_params}) "
+                    f"AND skill IN ({','.join('?' * len(terms))})",
+                    page_ids + terms,
+                ):
+                    matched[resume_id].append(term)
+
+        results = []
+        for resume_id in page_ids:
+            filename, payload = rows[resume_id]
+            result = json.loads(payload)
+            results.append({
+                "resume_id": resume_id,
+                "filename": filename,
+                "name": result.get("name", ""),
+                "email": result.get("email", ""),
+                "skills": result.get("skills", []),
+                "matched_skills": sorted(matched[resume_id]),
+                "score": round(matches[resume_id] / len(terms), 3),
+                "duplicate_of": result.get("duplicate_of", {}).get("resume_id"),
+            })
+        return {
+            "skills": terms,
+            "mode": mode,
+            "total": len(ranked),
+            "page": page,
+            "per_page": per_page,
+            "results": results,
+        }
@@ -0,0 +1,241 @@
+import logging
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from metrics import record_stage
+
+logger = logging.getLogger(__name__)
+
+class SchedulerFull(Exception):
+    """Raised when the scheduler can't take more work right now."""
+
+    def __init__(self, message: str, retry_after: int) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after  # suggested seconds before trying again
+
+class Task:
+    """One unit of scheduled work and what it is expected to cost."""
+
+    __slots__ = ("client", "cost", "size", "run", "submitted_at")
+
+    def __init__(self, client: str, cost: float, size: int, run: Callable[[], None]) -> None:
+        self.client = client
+        self.cost = cost
+        self.size = size
+        self.run = run
+        self.submitted_at = time.monotonic()
+
+class Scheduler:
+    """App-wide queue of parsing work, run on a fixed set of long-lived threads.
+
+    Work arrives in tasks that carry an estimated ``cost`` (e.g. pages to
+    read) and ``size`` (bytes held in memory until the task is done).
+    Whenever a worker is free it takes the cheapest task of the client
+    that has been served the least cost so far, counting that task, so
+    small files go first and one client's large batch can't hold up
+    everyone else. A client that becomes active starts from the lowest current
+    share, so being idle earns no credit. Waiting makes a task look
+    cheaper, so large files are not starved.
+
+    A submission is taken whole or refused with SchedulerFull when the
+    queue is at ``max_queued`` tasks or ``max_bytes`` of uploads, or when
+    the work already queued is expected to take more than ``max_wait``
+    seconds; with nothing queued, any submission is taken.
+
+    A task's ``run`` may return the cost it actually had (e.g. the pages
+    it really read); the client's share and the time per unit of cost are
+    then corrected with it.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_queued: int = 500,
+        max_bytes: int = 512 * 1024 * 1024,
+        max_wait: float = 30.0,
+        aging: float = 10.0,
+        seconds_per_cost: float = 0.05,
+    ) -> None:
+        """
+        Args:
+            workers: Worker threads, i.e. tasks run at once
+            max_queued: Tasks waiting or running at most
+            max_bytes: Total ``size`` of tasks waiting or running at most
+            max_wait: Expected seconds until queued work is done, above
+                which submissions are refused
+            aging: Seconds of waiting that halve a task's cost when ordering
+            seconds_per_cost: Initial estimate of the time a unit of cost
+                takes, refined as tasks finish
+        """
+        self.workers = workers
+        self.max_queued = max_queued
+        self.max_bytes = max_bytes
+        self.max_wait = max_wait
+        self.aging = aging
+        self.seconds_per_cost = seconds_per_cost
+        self.rejected = 0
+        self._queues: Dict[str, List[Task]] = {}
+        self._served: Dict[str, float] = {}
+        self._active: Dict[str, int] = {}  # tasks waiting or running, per client
+        self._queued_cost = 0.0
+        self._running_cost = 0.0
+        self._tasks = 0
+        self._bytes = 0
+        self._running = 0
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start the worker threads if they are not running yet."""
+        with self._condition:
+            if self._threads:
+                return
+            for number in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work, name=f"parse-scheduler-{number}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def expected_wait(self) -> float:
+        """Seconds the work waiting and running is expected to take on all workers."""
+        with self._condition:
+            return self._expected_wait()
+
+    def _expected_wait(self) -> float:
+        return (self._queued_cost + self._running_cost) * self.seconds_per_cost / self.workers
+
+    def _has_room(self, tasks: List[Task]) -> bool:
+        if not self._tasks:
+            return True
+        return (
+            self._tasks + len(tasks) <= self.max_queued
+            and self._bytes + sum(task.size for task in tasks) <= self.max_bytes
+            and self._expected_wait() <= self.max_wait
+        )
+
+    def submit(
+        self,
+        client: str,
+        tasks: List[Tuple[float, int, Callable[[], None]]],
+        block: bool = False,
+    ) -> None:
+        """Queue a client's tasks, all or none.
+
+        Args:
+            client: Who the work is for; clients share the workers fairly
+            tasks: ``(cost, size, run)`` per task, where ``run`` takes no
+                arguments, reports its own outcome and may return the
+                task's actual cost
+            block: Wait for room instead of raising SchedulerFull
+
+        Raises:
+            SchedulerFull: If the tasks don't fit and ``block`` is false
+        """
+        self.start()
+        queued = [Task(client, cost, size, run) for cost, size, run in tasks]
+        with self._condition:
+            while not self._has_room(queued):
+                if not block:
+                    self.rejected += 1
+                    retry_after = min(max(1, math.ceil(self._expected_wait())), 120)
+                    raise SchedulerFull(
+                        f"The server is busy. Please retry in {retry_after} seconds.", retry_after
+                    )
+                self._condition.wait()
+            if client not in self._served:
+                waiting = [self._served[name] for name, pending in self._queues.items() if pending]
+                self._served[client] = min(waiting, default=0.0)
+            self._queues.setdefault(client, []).extend(queued)
+            self._active[client] = self._active.get(client, 0) + len(queued)
+            self._tasks += len(queued)
+            self._bytes += sum(task.size for task in queued)
+            self._queued_cost += sum(task.cost for task in queued)
+            self._condition.notify_all()
+
+    def run(self, client: str, cost: float, size: int, function: Callable[[], Any]) -> Any:
+        """Run ``function`` as one task, waiting for room, and return its result or raise its error."""
+        done = threading.Event()
+        outcome: Dict[str, Any] = {}
+
+        def run_task() -> None:
+            try:
+                outcome["result"] = function()
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                done.set()
+
+        self.submit(client, [(cost, size, run_task)], block=True)
+        done.wait()
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+
+    def stats(self) -> Dict[str, float]:
+        """Tasks waiting and running, bytes held, expected wait and rejected submissions."""
+        with self._condition:
+            return {
+                "queued": self._tasks - self._running,
+                "running": self._running,
+                "bytes": self._bytes,
+                "expected_wait": self._expected_wait(),
+                "rejected": self.rejected,
+            }
+
+    def _next_task(self) -> Task:
+        now = time.monotonic()
+
+        def aged_cost(task: Task) -> float:
+            return task.cost / (1 + (now - task.submitted_at) / self.aging)
+
+        # The client whose share would stay lowest after its cheapest task
+        chosen = None
+        for client, pending in self._queues.items():
+            if pending:
+                task = min(pending, key=aged_cost)
+                finish = self._served[client] + aged_cost(task)
+                if chosen is None or finish < chosen[0]:
+                    chosen = (finish, client, task)
+        _, client, task = chosen
+        self._queues[client].remove(task)
+        self._served[client] += task.cost
+        return task
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while self._tasks == self._running:
+                    self._condition.wait()
+                task = self._next_task()
+                self._running += 1
+                self._queued_cost -= task.cost
+                self._running_cost += task.cost
+            started = time.monotonic()
+            record_stage("queue_wait", started - task.submitted_at)
+            cost = task.cost
+            try:
+                actual = task.run()
+                if isinstance(actual, (int, float)) and actual > 0:
+                    cost = actual
+            except Exception:
+                logger.exception("Scheduled task for %s failed:", task.client)
+            finally:
+                elapsed = time.monotonic() - started
+                with self._condition:
+                    self._running -= 1
+                    self._running_cost -= task.cost
+                    self._tasks -= 1
+                    self._bytes -= task.size
+                    self._served[task.client] += cost - task.cost
+                    if cost > 0:
+                        # Moving average of the observed time per unit of cost
+                        self.seconds_per_cost += 0.1 * (elapsed / cost - self.seconds_per_cost)
+                    self._active[task.client] -= 1
+                    if not self._active[task.client]:
+                        del self._active[task.client]
+                        del self._served[task.client]
+                        del self._queues[task.client]
+                    self._condition.notify_all()
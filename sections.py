@@ -0,0 +1,169 @@
+import re
+from functools import lru_cache
+from typing import List, NamedTuple, Optional
+
+from config import SECTION_HEADER_MAX_WORDS
+
+# Keywords that mark a line as a section header, checked in this order
+SKILLS_HEADERS = (
+    "technical skills",
+    "skills",
+    "technologies",
+    "programming languages",
+    "competencies",
+    "expertise",
+    "proficiencies",
+    "technical proficiencies",
+    "tools",
+    "software",
+    "qualifications",
+    "technical expertise",
+    "core competencies",
+    "professional skills",
+    "key skills",
+    "technical skills & tools",
+    "languages & technologies",
+    "professional expertise",
+)
+WORK_HEADERS = (
+    "experience",
+    "employment",
+    "work history",
+    "professional background",
+)
+EDUCATION_HEADERS = ("education",)
+
+# Section opened by each keyword, in priority order: a header mentioning
+# both "skills" and "experience" opens the skills section. "other" marks
+# headers of sections that aren't extracted.
+HEADER_SECTIONS = (
+    ("skills", SKILLS_HEADERS),
+    ("work_experience", WORK_HEADERS),
+    ("education", EDUCATION_HEADERS),
+    ("hobbies", ("interests", "hobbies")),
+    ("awards", ("awards", "achievements")),
+    ("volunteering", ("volunteer",)),
+    ("projects", ("project",)),
+    ("other", ("certifications", "languages")),
+)
+
+# Words that may appear in a header besides its keyword, as in "Work
+# Experience", "Education & Training" or "Honors and Awards"
+HEADER_FILLER_WORDS = (
+    "and", "of", "other", "additional", "relevant", "selected", "key", "academic", "personal",
+    "professional", "technical", "core", "work", "history", "background", "community", "service",
+    "training", "courses", "coursework", "honors", "activities", "licenses", "certificates",
+    "accomplishments", "publications", "memberships", "affiliations", "extracurricular",
+    "summary", "profile", "overview", "information",
+)
+
+# One alternation over every keyword, each in a group named after its section.
+# Keywords are whole words, optionally with a plural or "-ing" ending, so
+# "Projects" and "Volunteering" match but "Experienced" doesn't.
+header_keyword_regex = re.compile(
+    "|".join(
+        rf"(?P<{section}>\b(?:{'|'.join(re.escape(h) for h in sorted(headers, key=len, reverse=True))})(?:s|ing)?\b)"
+        for section, headers in HEADER_SECTIONS
+    )
+)
+header_word_regex = re.compile(r"[a-z0-9+#]+")
+header_vocabulary = frozenset(
+    form
+    for word in (
+        *(word for _, headers in HEADER_SECTIONS for header in headers for word in header_word_regex.findall(header)),
+        *HEADER_FILLER_WORDS,
+    )
+    for form in (word, word + "s", word + "ing")
+)
+_section_priority = {section: rank for rank, (section, _) in enumerate(HEADER_SECTIONS)}
+
+# Bullets and punctuation around a header, e.g. "• SKILLS:" or "-- Education --"
+header_trim_chars = " \t•·▪●○-–—*#=_:|"
+
+class SectionSpan(NamedTuple):
+    """One section of a resume as a range of lines.
+
+    ``lines[start:end]`` (of ``text.split("\\n")``) is the body of the
+    section; ``header`` is the index of the header line, or None for text
+    before the first header.
+    """
+    name: Optional[str]
+    header: Optional[int]
+    start: int
+    end: int
+
+def classify_header(line: str) -> Optional[str]:
+    """Classify a line of resume text as a section header.
+
+    Only short lines (at most SECTION_HEADER_MAX_WORDS words once bullets
+    and a trailing colon are removed) made up mostly of header words can
+    be headers (see classify_label), so body lines that merely mention
+    "software" or "tools" and job titles are not mistaken for one, and
+    "Label: value" lines are never headers.
+
+    Args:
+        line: Line of resume text, in any case
+
+    Returns:
+        The section the header opens ("skills", "work_experience",
+        "education", "hobbies", "awards", "volunteering" or "projects"),
+        "other" for headers of sections that aren't extracted, or None if
+        the line is not a header
+    """
+    label, colon, rest = line.strip().partition(":")
+    if colon and rest.strip():
+        return None
+    words = label.strip(header_trim_chars).lower().split()
+    if not words or len(words) > SECTION_HEADER_MAX_WORDS:
+        return None
+    return classify_label(" ".join(words))
+
+@lru_cache(maxsize=4096)
+def classify_label(label: str) -> Optional[str]:
+    """Classify a normalized short header candidate; memoized since headers recur across resumes.
+
+    Besides containing a header keyword, more than half of the label's
+    words must be header words, so job titles such as "Software Engineer"
+    or "Project Manager" are not headers.
+    """
+    words = header_word_regex.findall(label)
+    if sum(word in header_vocabulary for word in words) * 2 <= len(words):
+        return None
+    best = None
+    for match in header_keyword_regex.finditer(label):
+        section = match.lastgroup
+        if best is None or _section_priority[section] < _section_priority[best]:
+            best = section
+    return best
+
+def segment_sections(lines: List[str]) -> List[SectionSpan]:
+    """Split resume lines into section spans in a single pass.
+
+    Headers of sections that aren't extracted ("other", e.g. certifications
+    or languages) don't end the section before them: their lines continue
+    it in a new span with the same name.
+
+    Args:
+        lines: Resume text split on newlines
+
+    Returns:
+        Spans in document order; header lines are not part of any body
+    """
+    spans = []
+    name: Optional[str] = None
+    header: Optional[int] = None
+    start = 0
+    for index, line in enumerate(lines):
+        if not line.strip():
+            continue
+        section = classify_header(line)
+        if section is None:
+            continue
+        if index > start or header is not None:
+            spans.append(SectionSpan(name, header, start, index))
+        if section != "other":
+            name = section
+        header = index
+        start = index + 1
+    spans.append(SectionSpan(name, header, start, len(lines)))
+    return spans
@@ -0,0 +1,82 @@
+import re
+from typing import Callable, Dict, Iterable, Optional, Set
+
+# Escapes are kept as-is so "\S" or "\W" keep their meaning when lowercasing
+_pattern_char_regex = re.compile(r"\\.|[A-Z]")
+
+def lowercase_pattern(pattern: str) -> str:
+    """Lowercase the literal characters of a regex pattern, leaving escapes alone."""
+    return _pattern_char_regex.sub(
+        lambda match: match.group() if match.group().startswith("\\") else match.group().lower(),
+        pattern,
+    )
+
+class SkillMatcher:
+    """Find skills from a list of regex patterns in a single pass over the text.
+
+    The patterns are compiled once into one alternation that finds, in a
+    single scan, the word starts where any pattern matches; only there is
+    each pattern tried on its own. Every pattern that matches at such a
+    position is reported, so overlapping skills from different patterns
+    ("AWS Certified" and "AWS", "GitHub" and "Git") are all kept, exactly
+    as with one ``re.finditer`` per pattern; a pattern's later matches
+    that start inside its previous match are skipped, as ``finditer``
+    would. Matching is case-insensitive: the patterns and the text are
+    lowercased rather than compiled with ``re.IGNORECASE``, which lets the
+    regex engine use its literal-prefix fast paths. Every distinct surface
+    form is normalized only once; later hits come from a lookup table.
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[str],
+        normalize: Callable[[str], str],
+        is_noise: Callable[[str], bool],
+    ) -> None:
+        """
+        Args:
+            patterns: Regex patterns, each matching one or more skills and
+                starting at a word boundary
+            normalize: Maps a matched surface form to its canonical skill name
+            is_noise: Returns True for matches that should be discarded
+        """
+        self._patterns = [re.compile(lowercase_pattern(pattern)) for pattern in patterns]
+        alternation = "|".join(f"(?:{regex.pattern})" for regex in self._patterns)
+        # Only try the alternation where a word starts
+        self._candidates = re.compile(rf"\b(?=\w)(?=(?:{alternation}))")
+        self._normalize = normalize
+        self._is_noise = is_noise
+        self._canonical: Dict[str, Optional[str]] = {}
+
+    def canonical(self, surface: str) -> Optional[str]:
+        """Return the canonical name for a matched surface form, or None if it is noise."""
+        try:
+            return self._canonical[surface]
+        except KeyError:
+            pass
+        skill = surface.strip()
+        if len(skill) >= 2 and not self._is_noise(skill.lower()):
+            name = self._normalize(skill)
+        else:
+            name = None
+        self._canonical[surface] = name
+        return name
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return the canonical names of every skill mentioned in ``text``."""
+        text = text.lower()
+        skills = set()
+        ends = [0] * len(self._patterns)  # end of each pattern's last match
+        for candidate in self._candidates.finditer(text):
+            position = candidate.start()
+            for number, regex in enumerate(self._patterns):
+                if position < ends[number]:
+                    continue
+                match = regex.match(text, position)
+                if match is None:
+                    continue
+                ends[number] = match.end()
+                name = self.canonical(match.group())
+                if name:
+                    skills.add(name)
+        return skills
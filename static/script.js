@@ -156,12 +156,14 @@ const updateFileDisplay = () => {
 	files.forEach((file, index) => {
 		const fileItem = document.createElement('div')
 		fileItem.className = 'file-item'
+		fileItem.dataset.index = index
 		fileItem.innerHTML = `
 			<span class="file-name" title="${file.name}">
 				<i class="fas fa-file-alt"></i>
 				${file.name}
 				<small>(${formatFileSize(file.size)})</small>
 			</span>
+			<small class="file-status"></small>
 			<button type="button" class="remove-file" data-index="${index}" onclick="removeFile(${index})">
 				<i class="fas fa-times"></i>
 			</button>
@@ -491,13 +493,18 @@ form.addEventListener('submit', async function (e) {
 	overlay.style.display = 'flex'
 	resultDiv.style.display = 'none'
 	parsedResumes = []
+	totalCountSpan.textContent = 0
+	matchCountSpan.textContent = 0
 	submitButton.disabled = true
 
 	try {
-		const results = await processFiles(files)
-		parsedResumes = results
 		resultDiv.style.display = 'block'
-		updateMatchingScores()
+		await processFiles(files, (resume) => {
+			// Render each resume as soon as the server streams it back
+			parsedResumes.push(resume)
+			overlay.style.display = 'none'
+			updateMatchingScores()
+		})
 	} catch (error) {
 		alert('Error processing resumes: ' + error.message)
 	} finally {
@@ -511,68 +518,235 @@ showMatchingOnlyCheckbox.addEventListener('change', function () {
 	displayResults(this.checked)
 })
 
-// Optimize file processing with batching
-async function processFiles(files) {
-	const results = []
-	const batchSize = 5
-
-	for (let i = 0; i < files.length; i += batchSize) {
-		const batch = Array.from(files).slice(i, i + batchSize)
-		const batchPromises = batch.map(async (file) => {
-			const formData = new FormData()
-			formData.append('resume', file)
-
-			submitButton.textContent = `Processing ${file.name}...`
-			const response = await fetch('/upload', {
-				method: 'POST',
-				body: formData,
-			})
+// Normalize a parsed resume from the server into the shape the UI expects
+function toResume(filename, result) {
+	return {
+		filename: filename,
+		name: result.name || 'Unknown',
+		email: result.email || '',
+		phone: result.phone || '',
+		education: result.education || [],
+		work_experience: result.work_experience || [],
+		skills: result.skills || [],
+		ai_summary: result.ai_summary || '',
+		matchingSkills: [],
+		missingSkills: [],
+		hasAllRequiredSkills: false,
+	}
+}
 
-			if (!response.ok) {
-				const error = await response.json()
-				throw new Error(error.error || `Failed to process ${file.name}`)
-			}
+// Multi-file uploads: files are sent to /upload in requests of up to
+// UPLOAD_CHUNK_FILES files (and UPLOAD_CHUNK_BYTES), with at most
+// UPLOAD_CONCURRENCY requests in flight; a new request starts as soon as
+// one finishes, so a slow file only holds up its own request
+const UPLOAD_CHUNK_FILES = 10
+const UPLOAD_CHUNK_BYTES = 20 * 1024 * 1024
+const UPLOAD_CONCURRENCY = 3
+const UPLOAD_MAX_RETRIES = 3 // retries of a request refused with 503 or 429
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms))
+
+// Show a file's upload state next to it in the selected files list
+function setFileStatus(index, state, text) {
+	const status = selectedFilesContainer.querySelector(`.file-item[data-index="${index}"] .file-status`)
+	if (!status) return
+	status.className = `file-status ${state}`
+	status.textContent = text
+}
 
-			const data = await response.json()
+// Group files into upload requests, smallest first so the first results arrive early
+function packChunks(files) {
+	const entries = files.map((file, index) => ({ file, index })).sort((a, b) => a.file.size - b.file.size)
+	const chunks = []
+	let chunk = []
+	let bytes = 0
+
+	entries.forEach((entry) => {
+		if (
+			chunk.length &&
+			(chunk.length >= UPLOAD_CHUNK_FILES || bytes + entry.file.size > UPLOAD_CHUNK_BYTES)
+		) {
+			chunks.push(chunk)
+			chunk = []
+			bytes = 0
+		}
+		chunk.push(entry)
+		bytes += entry.file.size
+	})
+	if (chunk.length) chunks.push(chunk)
+	return chunks
+}
 
-			// Extract the actual resume data from the response
-			if (!data.results || !Array.isArray(data.results) || data.results.length === 0) {
-				throw new Error(`No valid results found for ${file.name}`)
+// POST one request's files and read the NDJSON records as they are streamed back;
+// resolves with the status, Retry-After and error of a refused request
+function uploadChunk(chunk, onRecord, onUploadProgress) {
+	return new Promise((resolve, reject) => {
+		const formData = new FormData()
+		chunk.forEach(({ file }) => formData.append('resume', file))
+
+		const xhr = new XMLHttpRequest()
+		let consumed = 0 // characters of the response already parsed
+
+		const readRecords = () => {
+			if (xhr.status !== 200) return
+			const text = xhr.responseText
+			let newline
+			while ((newline = text.indexOf('\n', consumed)) >= 0) {
+				const line = text.slice(consumed, newline).trim()
+				consumed = newline + 1
+				if (line) onRecord(JSON.parse(line))
 			}
+		}
 
-			// Get the first result since we're uploading one file at a time
-			const result = data.results[0]
-
-			// Ensure result has all required fields
-			return {
-				filename: file.name,
-				name: result.name || 'Unknown',
-				email: result.email || '',
-				phone: result.phone || '',
-				education: result.education || [],
-				work_experience: result.work_experience || [],
-				skills: result.skills || [],
-				ai_summary: result.ai_summary || '',
-				matchingSkills: [],
-				missingSkills: [],
-				hasAllRequiredSkills: false,
+		xhr.upload.onprogress = (e) => {
+			if (e.lengthComputable) onUploadProgress(e.loaded / e.total)
+		}
+		xhr.upload.onload = () => onUploadProgress(1)
+		xhr.onprogress = readRecords
+		xhr.onload = () => {
+			if (xhr.status === 200) {
+				readRecords()
+				const rest = xhr.responseText.slice(consumed).trim()
+				if (rest) onRecord(JSON.parse(rest))
+				resolve({ ok: true })
+				return
+			}
+			let error = `Upload failed with status ${xhr.status}`
+			try {
+				error = JSON.parse(xhr.responseText).error || error
+			} catch (e) {
+				// Not a JSON error body
 			}
+			resolve({
+				ok: false,
+				status: xhr.status,
+				retryAfter: parseInt(xhr.getResponseHeader('Retry-After'), 10),
+				error,
+			})
+		}
+		xhr.onerror = () => reject(new Error('Network error while uploading resumes'))
+
+		xhr.open('POST', '/upload')
+		xhr.setRequestHeader('Accept', 'application/x-ndjson')
+		xhr.send(formData)
+	})
+}
+
+// Upload files in multi-file requests over a sliding window; results are streamed back one resume at a time
+async function processFiles(files, onResult) {
+	files = Array.from(files)
+	const results = []
+	const errors = []
+	const pending = packChunks(files)
+	let finished = 0
+
+	const fileDone = () => {
+		finished += 1
+		submitButton.textContent = `Processing ${finished}/${files.length}...`
+	}
+
+	files.forEach((file, index) => setFileStatus(index, 'queued', 'Queued'))
+	submitButton.textContent = `Processing 0/${files.length}...`
+
+	async function sendChunk(chunk) {
+		const remaining = new Set(chunk.map(({ index }) => index))
+		let streamError = null // an error for the whole request, sent without a file index
+		const fail = (indexes, error) => {
+			indexes.forEach((index) => {
+				remaining.delete(index)
+				setFileStatus(index, 'failed', 'Failed')
+				errors.push(`${files[index].name}: ${error}`)
+				fileDone()
+			})
+		}
+
+		// Byte range of each file in the request body, to turn upload progress into per-file progress
+		const total = chunk.reduce((sum, { file }) => sum + file.size, 0) || 1
+		let offset = 0
+		const ranges = chunk.map(({ file, index }) => {
+			const range = { index, start: offset / total, end: (offset + file.size) / total }
+			offset += file.size
+			return range
 		})
 
-		try {
-			const batchResults = await Promise.all(batchPromises)
-			results.push(...batchResults)
-		} catch (error) {
-			console.error('Error processing batch:', error)
-			// Continue with other batches even if one fails
+		for (let attempt = 0; ; attempt++) {
+			let response
+			try {
+				response = await uploadChunk(
+					chunk,
+					(record) => {
+						if (record.event === 'error' && record.index === undefined) {
+							streamError = record.error
+							return
+						}
+						const entry = chunk[record.index]
+						if (!entry || !remaining.has(entry.index)) return
+						if (record.event === 'result') {
+							remaining.delete(entry.index)
+							setFileStatus(entry.index, 'done', 'Done')
+							fileDone()
+							const resume = toResume(entry.file.name, record.result)
+							results.push(resume)
+							onResult(resume)
+						} else if (record.event === 'error') {
+							console.error(`Failed to process ${entry.file.name}:`, record.error)
+							fail([entry.index], record.error)
+						}
+					},
+					(fraction) => {
+						ranges.forEach(({ index, start, end }) => {
+							if (!remaining.has(index)) return
+							if (fraction >= end) {
+								setFileStatus(index, 'parsing', 'Parsing...')
+							} else if (fraction > start) {
+								const percent = Math.round(((fraction - start) / (end - start)) * 100)
+								setFileStatus(index, 'uploading', `Uploading ${percent}%`)
+							}
+						})
+					}
+				)
+			} catch (error) {
+				fail([...remaining], error.message)
+				return
+			}
+
+			if (response.ok) {
+				// A stream that ended early (e.g. an unexpected server error) leaves files without a result
+				fail([...remaining], streamError || 'No result was returned')
+				return
+			}
+			if ((response.status === 503 || response.status === 429) && attempt < UPLOAD_MAX_RETRIES) {
+				// The server is busy or rate limited: wait as long as it asks and send the files again
+				const seconds = response.retryAfter > 0 ? response.retryAfter : 5 * 2 ** attempt
+				remaining.forEach((index) =>
+					setFileStatus(index, 'waiting', `Server busy, retrying in ${seconds}s`)
+				)
+				await sleep(seconds * 1000)
+				continue
+			}
+			fail([...remaining], response.error)
+			return
 		}
 	}
 
-	submitButton.textContent = 'Analysis Complete!'
+	// Each worker sends the next request as soon as its previous one has finished
+	async function worker() {
+		while (pending.length) {
+			await sendChunk(pending.shift())
+		}
+	}
+
+	await Promise.all(Array.from({ length: Math.min(UPLOAD_CONCURRENCY, pending.length) }, worker))
+
+	submitButton.textContent = results.length ? 'Analysis Complete!' : 'Analysis Failed'
 	setTimeout(() => {
 		submitButton.textContent = `Analyze ${files.length} Resume${files.length !== 1 ? 's' : ''}`
 	}, 2000)
 
+	if (!results.length && errors.length) {
+		throw new Error(errors.join('; '))
+	}
+
 	return results
 }
 
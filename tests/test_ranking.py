@@ -0,0 +1,25 @@
+"""Tests for replacing resumes in the ranker; run with ``python -m pytest`` from the repository root."""
+from ranking import ResumeRanker
+
+PYTHON_RESUME = {"skills": ["Python"], "work_experience": [{"description": "Built Python APIs"}]}
+JAVA_RESUME = {"skills": ["Java", "Python"], "work_experience": [{"description": "Java services"}]}
+
+def test_replaced_rows_do_not_accumulate() -> None:
+    ranker = ResumeRanker(str.lower)
+    for _ in range(100):
+        ranker.add(1, PYTHON_RESUME)
+    assert len(ranker) == 1
+    assert ranker._skills.rows == 1
+    assert ranker._skills.size <= 2
+    assert ranker._skills.document_frequency("python") == 1
+
+def test_replacing_ranks_like_adding_once() -> None:
+    fresh = ResumeRanker(str.lower)
+    fresh.add(1, PYTHON_RESUME)
+    fresh.add(2, JAVA_RESUME)
+    replaced = ResumeRanker(str.lower)
+    for _ in range(7):
+        replaced.add(1, PYTHON_RESUME)
+        replaced.add(2, JAVA_RESUME)
+    query = (["Python", "Java"], "Java services")
+    assert replaced.rank(*query) == fresh.rank(*query)
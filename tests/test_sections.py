@@ -0,0 +1,60 @@
+"""Golden tests for section segmentation; run with ``python -m pytest`` from the repository root."""
+import json
+from pathlib import Path
+
+import pytest
+
+from sections import classify_header, segment_sections
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+def spans_of(text: str) -> list:
+    """Segment ``text`` into the JSON-friendly form stored next to each golden resume."""
+    lines = text.split("\n")
+    return [
+        {
+            "section": span.name,
+            "header": lines[span.header].strip() if span.header is not None else None,
+            "body": [line.strip() for line in lines[span.start:span.end] if line.strip()],
+        }
+        for span in segment_sections(lines)
+    ]
+
+@pytest.mark.parametrize("path", sorted(GOLDEN_DIR.glob("*.txt")), ids=lambda path: path.stem)
+def test_golden_resume(path: Path) -> None:
+    expected = json.loads(path.with_suffix(".json").read_text())
+    assert spans_of(path.read_text()) == expected
+
+@pytest.mark.parametrize("line", [
+    "Software Engineer",
+    "Senior Software Engineer",
+    "Experienced Python Developer",
+    "Project Manager",
+    "Volunteer Coordinator",
+    "Skills Assessor",
+    "Maintained internal software tools used by 300 engineers.",
+    "Languages: Python, Go, SQL",
+])
+def test_title_and_body_lines_are_not_headers(line: str) -> None:
+    assert classify_header(line) is None
+
+@pytest.mark.parametrize("line, section", [
+    ("Work Experience", "work_experience"),
+    ("PROFESSIONAL EXPERIENCE", "work_experience"),
+    ("Technical Skills & Tools", "skills"),
+    ("• SKILLS:", "skills"),
+    ("Projects", "projects"),
+    ("Volunteering", "volunteering"),
+    ("Education & Training", "education"),
+    ("Honors and Awards", "awards"),
+    ("Certifications:", "other"),
+])
+def test_headers(line: str, section: str) -> None:
+    assert classify_header(line) == section
+
+def test_header_at_the_top_of_a_page() -> None:
+    from resume_parser import join_pages
+
+    pages = ["EDUCATION\nB.Sc. Computer Science, 2012 - 2016", "PROJECTS\nResume parser in Python"]
+    names = [span.name for span in segment_sections(join_pages(pages).split("\n"))]
+    assert names[-2:] == ["education", "projects"]